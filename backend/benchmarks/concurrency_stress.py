@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for DataService.
+
+Runs many threads (optionally in several processes) against one data
+directory. Every thread creates a user and a batch of notes, keeps editing
+them, and reads its notes back while the others write. Afterwards the data
+is reloaded from disk and checked for:
+- duplicate user or note IDs,
+- lost updates (a note or user missing, or an edit that was overwritten),
+- reads that did not see the thread's own earlier writes.
+
+Exits with code 1 if anything was lost.
+
+Usage:
+    python backend/benchmarks/concurrency_stress.py
+    python backend/benchmarks/concurrency_stress.py --threads 32 --notes 100 --processes 4
+    python backend/benchmarks/concurrency_stress.py --storage journal --json
+    python backend/benchmarks/concurrency_stress.py --storage sharded --processes 4
+    python backend/benchmarks/concurrency_stress.py --lazy-content --processes 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import string
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from models.note import Note, now_timestamp
+from models.user import User
+from services.data_service import DataService
+
+
+def user_name(process_index: int, thread_index: int) -> str:
+    """A unique, letters-only user name."""
+    digits = f"{process_index:03d}{thread_index:03d}"
+    return "Stress" + digits.translate(str.maketrans(string.digits, string.ascii_lowercase[:10]))
+
+
+def thread_worker(data_service: DataService, process_index: int, thread_index: int,
+                  notes_per_thread: int, results: list, problems: list):
+    try:
+        run_thread(data_service, process_index, thread_index, notes_per_thread, results, problems)
+    except Exception as e:
+        problems.append(f"thread {process_index}/{thread_index} crashed: {e!r}")
+
+
+def run_thread(data_service: DataService, process_index: int, thread_index: int,
+               notes_per_thread: int, results: list, problems: list):
+    user = User(
+        id=data_service.get_next_user_id(), name=user_name(process_index, thread_index),
+        surname="Tester", birthday="01/01/1990", favorite_color="blue"
+    )
+    data_service.save_user(user)
+
+    notes = []
+    for i in range(notes_per_thread):
+        note = Note(
+            id=data_service.get_next_note_id(), title=f"Note {i}",
+            content="v0", created_at=now_timestamp(), user_id=user.id
+        )
+        data_service.save_note(note)
+        notes.append(note)
+
+        # Edit an earlier note, then check this thread's writes are all visible
+        edited = notes[i // 2]
+        edited.content = f"v{i}"
+        data_service.save_note(edited)
+
+        stored = {n.id: n.content for n in data_service.get_notes_by_user(user.id)}
+        missing = [n.id for n in notes if stored.get(n.id) != n.content]
+        if missing:
+            problems.append(f"thread {process_index}/{thread_index}: own writes not visible: {missing[:5]}")
+
+    results.append({
+        'user_id': user.id,
+        'notes': {note.id: note.content for note in notes},
+    })
+
+
+def run_process(process_index: int, data_dir: str, threads: int, notes_per_thread: int,
+                storage: str, cached: bool, lazy_content: bool) -> dict:
+    """Run the threads of one process against data_dir."""
+    data_service = DataService(data_dir, cached=cached, storage=storage, durable=False,
+                               migrate_timestamps=False, lazy_content=lazy_content)
+    results, problems = [], []
+    workers = [
+        threading.Thread(target=thread_worker,
+                         args=(data_service, process_index, i, notes_per_thread, results, problems))
+        for i in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    data_service.close()
+    return {'results': results, 'problems': problems}
+
+
+def run_process_star(args):
+    return run_process(*args)
+
+
+def verify(data_dir: str, storage: str, results: list, problems: list) -> list:
+    """Reload everything from disk and compare with what the threads wrote."""
+    fresh = DataService(data_dir, storage=storage, migrate_timestamps=False)
+    stored_notes = {note.id: note for note in fresh.get_all_notes()}
+    stored_users = {user.id for user in fresh.get_all_users()}
+    fresh.close()
+
+    user_ids = Counter(result['user_id'] for result in results)
+    note_ids = Counter(note_id for result in results for note_id in result['notes'])
+    problems = list(problems)
+
+    duplicates = [user_id for user_id, count in user_ids.items() if count > 1]
+    if duplicates:
+        problems.append(f"duplicate user IDs handed out: {duplicates[:10]}")
+    duplicates = [note_id for note_id, count in note_ids.items() if count > 1]
+    if duplicates:
+        problems.append(f"duplicate note IDs handed out: {duplicates[:10]}")
+
+    lost_users = [user_id for user_id in user_ids if user_id not in stored_users]
+    if lost_users:
+        problems.append(f"{len(lost_users)} user(s) lost, e.g. {lost_users[:10]}")
+
+    lost_notes = []
+    lost_edits = []
+    for result in results:
+        for note_id, content in result['notes'].items():
+            note = stored_notes.get(note_id)
+            if note is None:
+                lost_notes.append(note_id)
+            elif note.content != content:
+                lost_edits.append(note_id)
+    if lost_notes:
+        problems.append(f"{len(lost_notes)} note(s) lost, e.g. {lost_notes[:10]}")
+    if lost_edits:
+        problems.append(f"{len(lost_edits)} edit(s) overwritten, e.g. {lost_edits[:10]}")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=32, help='Threads per process.')
+    parser.add_argument('--processes', type=int, default=1, help='Processes sharing the data directory.')
+    parser.add_argument('--notes', type=int, default=50, help='Notes created by each thread.')
+    parser.add_argument('--storage', choices=('json', 'journal', 'sharded'), default='json')
+    parser.add_argument('--uncached', action='store_true', help='Run without the in-memory cache.')
+    parser.add_argument('--lazy-content', action='store_true',
+                        help='Store note contents in notes.content (DataService lazy_content).')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix='notes-stress-')
+    jobs = [(i, data_dir, args.threads, args.notes, args.storage, not args.uncached,
+             args.lazy_content)
+            for i in range(args.processes)]
+    try:
+        start = time.perf_counter()
+        if args.processes == 1:
+            outcomes = [run_process_star(jobs[0])]
+        else:
+            with multiprocessing.get_context('spawn').Pool(args.processes) as pool:
+                outcomes = pool.map(run_process_star, jobs)
+        elapsed = time.perf_counter() - start
+
+        results = [result for outcome in outcomes for result in outcome['results']]
+        problems = verify(data_dir, args.storage, results,
+                          [problem for outcome in outcomes for problem in outcome['problems']])
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    writes = args.processes * args.threads * (1 + 2 * args.notes)
+    report = {
+        'processes': args.processes,
+        'threads_per_process': args.threads,
+        'notes_per_thread': args.notes,
+        'storage': args.storage,
+        'cached': not args.uncached,
+        'lazy_content': args.lazy_content,
+        'seconds': round(elapsed, 2),
+        'writes_per_second': round(writes / elapsed, 1),
+        'problems': problems,
+        'passed': not problems,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{args.processes} process(es) x {args.threads} threads x {args.notes} notes "
+              f"({args.storage}, {'cached' if report['cached'] else 'uncached'}"
+              f"{', lazy content' if args.lazy_content else ''}): "
+              f"{writes} writes in {report['seconds']} s ({report['writes_per_second']}/s)")
+        for problem in problems:
+            print(f"  {problem}")
+        print("PASS: no lost updates or duplicate IDs" if report['passed'] else "FAIL")
+
+    return 0 if report['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Local load test for the Notes Assistant HTTP API.
+
+Starts the API server in-process on 127.0.0.1 (random port, throwaway data
+directory), seeds a user with notes, then hammers it from worker threads
+using keep-alive connections. Reports requests/sec and p50/p99 latency per
+request type. Stdlib only; nothing leaves localhost.
+
+Usage:
+    python backend/benchmarks/load_test.py
+    python backend/benchmarks/load_test.py --threads 16 --duration 10 --json
+    python backend/benchmarks/load_test.py --url http://127.0.0.1:8000 --user-id 1
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import shutil
+import statistics
+import string
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+# Request mix: (name, weight)
+DEFAULT_MIX = [
+    ('list', 40),          # GET /api/notes (first page)
+    ('list_etag', 20),     # GET /api/notes with If-None-Match (expect 304s)
+    ('get', 25),           # GET /api/notes/<id>
+    ('create', 10),        # POST /api/notes
+    ('update', 5),         # PUT /api/notes/<id>
+]
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Client:
+    """One keep-alive connection to the API."""
+
+    def __init__(self, host: str, port: int):
+        self.conn = http.client.HTTPConnection(host, port, timeout=30)
+
+    def request(self, method: str, path: str, body: dict = None, headers: dict = None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        all_headers = {'Content-Type': 'application/json'} if data else {}
+        all_headers.update(headers or {})
+        self.conn.request(method, path, body=data, headers=all_headers)
+        response = self.conn.getresponse()
+        payload = response.read()
+        return response.status, response.getheader('ETag'), payload
+
+    def close(self):
+        self.conn.close()
+
+
+def seed(client: Client, notes: int) -> tuple:
+    """Create a user and some notes; return (user_id, note_ids)."""
+    status, _, payload = client.request('POST', '/api/users', {
+        'name': 'Load' + ''.join(random.choices(string.ascii_lowercase, k=8)),
+        'surname': 'Tester', 'birthday': '01/01/1990', 'favorite_color': 'blue',
+    })
+    if status != 201:
+        raise RuntimeError(f"Could not create load test user: {status} {payload!r}")
+    user_id = json.loads(payload)['id']
+
+    note_ids = []
+    for i in range(notes):
+        status, _, payload = client.request('POST', '/api/notes', {
+            'user_id': user_id, 'title': f'Seed note {i}', 'content': f'Seeded content number {i}',
+        })
+        if status != 201:
+            raise RuntimeError(f"Could not seed notes: {status} {payload!r}")
+        note_ids.append(json.loads(payload)['id'])
+    return user_id, note_ids
+
+
+def worker(host, port, user_id, note_ids, deadline, mix, results, errors, lock):
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    client = Client(host, port)
+    etag = None
+    local = {name: [] for name in names}
+    local_errors = 0
+    counter = 0
+
+    try:
+        while time.perf_counter() < deadline:
+            kind = random.choices(names, weights)[0]
+            counter += 1
+            headers = None
+            if kind in ('list', 'list_etag'):
+                method, path, body = 'GET', f'/api/notes?user_id={user_id}&limit=20', None
+                if kind == 'list_etag' and etag:
+                    headers = {'If-None-Match': etag}
+            elif kind == 'get':
+                method, path, body = 'GET', f'/api/notes/{random.choice(note_ids)}?user_id={user_id}', None
+            elif kind == 'create':
+                method, path, body = 'POST', '/api/notes', {
+                    'user_id': user_id, 'title': f'Load note {counter}', 'content': 'Created by load_test.py',
+                }
+            else:
+                method, path, body = 'PUT', f'/api/notes/{random.choice(note_ids)}', {
+                    'user_id': user_id, 'content': f'Updated {counter}',
+                }
+
+            start = time.perf_counter()
+            try:
+                status, new_etag, _ = client.request(method, path, body, headers)
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                client.close()
+                client = Client(host, port)
+                continue
+            local[kind].append(time.perf_counter() - start)
+
+            if status >= 400:
+                local_errors += 1
+            elif kind in ('list', 'list_etag') and new_etag:
+                etag = new_etag
+    finally:
+        client.close()
+
+    with lock:
+        for name, timings in local.items():
+            results[name].extend(timings)
+        errors[0] += local_errors
+
+
+def summarize(timings: list, elapsed: float) -> dict:
+    return {
+        'requests': len(timings),
+        'rps': round(len(timings) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(percentile(timings, 50) * 1000, 2),
+        'p99_ms': round(percentile(timings, 99) * 1000, 2),
+        'mean_ms': round(statistics.mean(timings) * 1000, 2) if timings else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--url', help='Test a running server instead of starting one (http://host:port).')
+    parser.add_argument('--user-id', type=int, help='With --url: existing user to test with (default: create one).')
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent client connections.')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds to run.')
+    parser.add_argument('--seed-notes', type=int, default=200, help='Notes to create before measuring.')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+    args = parser.parse_args()
+
+    server = data_dir = None
+    if args.url:
+        parsed = urlparse(args.url)
+        if parsed.hostname not in ('127.0.0.1', 'localhost', '::1'):
+            parser.error('--url must point at localhost')
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        from api.server import create_server
+
+        data_dir = tempfile.mkdtemp(prefix='notes-load-')
+        server = create_server(data_dir, '127.0.0.1', 0, quiet=True)
+        host, port = server.server_address[:2]
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        client = Client(host, port)
+        if args.user_id:
+            user_id = args.user_id
+            _, _, payload = client.request('GET', f'/api/notes?user_id={user_id}&limit=500')
+            note_ids = [note['id'] for note in json.loads(payload).get('notes', [])]
+        else:
+            user_id, note_ids = seed(client, args.seed_notes)
+        client.close()
+        if not note_ids:
+            parser.error('the test user has no notes to read')
+
+        results = {name: [] for name, _ in DEFAULT_MIX}
+        errors = [0]
+        lock = threading.Lock()
+        start = time.perf_counter()
+        deadline = start + args.duration
+        threads = [
+            threading.Thread(target=worker, args=(host, port, user_id, note_ids, deadline,
+                                                  DEFAULT_MIX, results, errors, lock))
+            for _ in range(args.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+            server.api.data_service.close()
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    all_timings = [t for timings in results.values() for t in timings]
+    report = {
+        'threads': args.threads,
+        'duration_s': round(elapsed, 2),
+        'errors': errors[0],
+        'overall': summarize(all_timings, elapsed),
+        'by_request': {name: summarize(timings, elapsed) for name, timings in results.items()},
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        overall = report['overall']
+        print(f"{overall['requests']} requests in {report['duration_s']} s with {args.threads} threads: "
+              f"{overall['rps']} req/s, p50 {overall['p50_ms']} ms, p99 {overall['p99_ms']} ms, "
+              f"{report['errors']} error(s)")
+        for name, stats in report['by_request'].items():
+            print(f"  {name:<10} {stats['requests']:>7} req  {stats['rps']:>8} req/s  "
+                  f"p50 {stats['p50_ms']:>7} ms  p99 {stats['p99_ms']:>7} ms")
+
+    return 1 if errors[0] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
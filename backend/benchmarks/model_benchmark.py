@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Memory and hydration benchmark for the Note and User models.
+
+Builds many model objects from stored records (as DataService does on
+every load) and reports, for each model variant and hydration path
+(validating from_dict, or the trusted from_storage used for storage loads):
+- memory held by the objects themselves (tracemalloc; the strings are
+  shared with the records, so this is the per-object overhead),
+- hydration time (best of several runs) and objects per second.
+
+The baseline is the models as they were before they were slotted: plain
+dataclasses with a per-instance __dict__, built with cls(**data).
+
+Usage:
+    python backend/benchmarks/model_benchmark.py
+    python backend/benchmarks/model_benchmark.py --notes 1000000 --json
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.note import FrozenNote, Note, now_timestamp, to_timestamp
+from models.user import FrozenUser, User
+from synthetic_data import COLORS, content_length, make_text, make_vocabulary, user_name, zipf_weights
+
+RUNS = 3
+
+
+@dataclass
+class DictNote:
+    """Note as it was before __slots__: per-instance __dict__, built with cls(**data)."""
+    id: int
+    title: str
+    content: str
+    created_at: int
+    updated_at: Optional[int] = None
+    user_id: Optional[int] = None
+
+    def __post_init__(self):
+        self.validate_title()
+        self.validate_content()
+        self.created_at = to_timestamp(self.created_at)
+        self.updated_at = to_timestamp(self.updated_at)
+
+    validate_title = Note.validate_title
+    validate_content = Note.validate_content
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DictNote':
+        return cls(**data)
+
+
+@dataclass
+class DictUser:
+    """User as it was before __slots__ and shared validation (regexes compiled per call)."""
+    id: int
+    name: str
+    surname: str
+    birthday: str
+    favorite_color: str
+
+    def __post_init__(self):
+        self.validate_name()
+        self.validate_birthday()
+        self.validate_color()
+
+    validate_name = User.validate_name
+
+    def validate_birthday(self):
+        pattern1 = re.compile(r'^\d{2}-\d{2}-\d{4}$')
+        pattern2 = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+        if not (pattern1.match(self.birthday) or pattern2.match(self.birthday)):
+            raise ValueError("Birthday must be in DD-MM-YYYY or DD/MM/YYYY format")
+
+    def validate_color(self):
+        valid_colors = [
+            'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink',
+            'brown', 'black', 'white', 'gray', 'grey', 'cyan', 'magenta'
+        ]
+        if self.favorite_color.lower() not in valid_colors:
+            raise ValueError(f"Color must be one of: {', '.join(valid_colors)}")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DictUser':
+        return cls(**data)
+
+
+def make_records(notes: int, users: int, seed: int) -> tuple:
+    """Stored note and user records, shaped like the synthetic data sets."""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(seed)
+    weights = zipf_weights(len(vocabulary))
+    now = now_timestamp()
+    note_records = [
+        {
+            'id': note_id,
+            'title': make_text(rng, vocabulary, weights, rng.randint(10, 60))[:100],
+            'content': make_text(rng, vocabulary, weights, content_length(rng, 'lognormal', 400)),
+            'created_at': now - notes + note_id,
+            'updated_at': None,
+            'user_id': rng.randint(1, users),
+        }
+        for note_id in range(1, notes + 1)
+    ]
+    user_records = [
+        {'id': user_id, 'name': user_name(user_id), 'surname': "Tester",
+         'birthday': "01/01/1990", 'favorite_color': rng.choice(COLORS)}
+        for user_id in range(1, users + 1)
+    ]
+    return note_records, user_records
+
+
+def measure(hydrate, records: list) -> dict:
+    """Memory held by hydrated objects and the best hydration time."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [hydrate(record) for record in records]
+    memory, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    best = float('inf')
+    for _ in range(RUNS):
+        gc.collect()
+        start = time.perf_counter()
+        objects = [hydrate(record) for record in records]
+        best = min(best, time.perf_counter() - start)
+        del objects
+
+    return {
+        'bytes': memory,
+        'bytes_per_object': round(memory / len(records), 1),
+        'seconds': round(best, 4),
+        'objects_per_sec': round(len(records) / best),
+    }
+
+
+def run(notes: int, users: int, seed: int) -> dict:
+    note_records, user_records = make_records(notes, users, seed)
+    variants = {
+        'notes': [
+            ('dataclass + __dict__, cls(**data) (old)', DictNote.from_dict),
+            ('Note.from_dict (slots)', Note.from_dict),
+            ('FrozenNote.from_dict (slots, frozen)', FrozenNote.from_dict),
+            ('Note.from_storage (slots, trusted)', Note.from_storage),
+        ],
+        'users': [
+            ('dataclass + __dict__, cls(**data) (old)', DictUser.from_dict),
+            ('User.from_dict (slots)', User.from_dict),
+            ('FrozenUser.from_dict (slots, frozen)', FrozenUser.from_dict),
+            ('User.from_storage (slots, trusted)', User.from_storage),
+        ],
+    }
+    text_bytes = sum(sys.getsizeof(record['title']) + sys.getsizeof(record['content'])
+                     for record in note_records)
+
+    report = {'notes': notes, 'users': users, 'note_text_bytes': text_bytes, 'results': {}}
+    for kind, records in (('notes', note_records), ('users', user_records)):
+        results = {}
+        baseline = None
+        for name, hydrate in variants[kind]:
+            result = measure(hydrate, records)
+            baseline = baseline or result
+            result['memory_vs_old'] = round(result['bytes'] / baseline['bytes'], 3)
+            result['speed_vs_old'] = round(baseline['seconds'] / result['seconds'], 2)
+            results[name] = result
+        report['results'][kind] = results
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--notes', type=int, default=200_000)
+    parser.add_argument('--users', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+    args = parser.parse_args()
+
+    report = run(args.notes, args.users, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{args.notes} notes ({report['note_text_bytes'] / 1e6:.1f} MB of title/content strings), "
+          f"{args.users} users")
+    for kind, results in report['results'].items():
+        print(f"\n  {kind:<42} {'bytes/obj':>10} {'total MB':>9} {'vs old':>7} {'objs/s':>11} {'speedup':>8}")
+        for name, result in results.items():
+            print(f"  {name:<42} {result['bytes_per_object']:>10.1f} {result['bytes'] / 1e6:>9.1f} "
+                  f"{result['memory_vs_old']:>7.0%} {result['objects_per_sec']:>11,} "
+                  f"{result['speed_vs_old']:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for DataService, NotesService and UserService.
+
+For each scale (number of notes) a synthetic data set is generated (see
+synthetic_data.py) in a fresh process, then every public service method is
+timed against it. Per method it records ops/sec and latency percentiles;
+per scale the generation time, size on disk and peak RSS. Results are
+written as JSON.
+
+Compare mode reads two result files and flags methods whose median latency
+(or a scale's peak RSS) grew by more than the threshold. Exits with code 1
+if there are regressions.
+
+Usage:
+    python backend/benchmarks/service_benchmark.py --out results.json
+    python backend/benchmarks/service_benchmark.py --scales 1000,10000,100000,1000000 --storage sharded
+    python backend/benchmarks/service_benchmark.py --lazy-content --out lazy.json
+    python backend/benchmarks/service_benchmark.py --compare baseline.json results.json --threshold 0.25
+"""
+
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.note import Note, now_timestamp
+from services.data_service import DataService
+from services.notes_service import NotesService
+from services.user_service import UserService
+from synthetic_data import generate, make_vocabulary, user_name
+
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+DEFAULT_OPS = 200           # timed calls per method (at most)
+DEFAULT_TIME_BUDGET = 2.0   # seconds per method; slow methods stop early
+MIN_OPS = 3
+BULK_SIZE = 100             # notes per save_notes / bulk_create_notes call
+
+# Compare mode ignores changes smaller than this, whatever the ratio
+DEFAULT_MIN_DELTA_MS = 0.05
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def time_method(call, ops: int, time_budget: float, setup=None) -> dict:
+    """Time call(i) for i = 0, 1, ... The first (cold) call is reported apart.
+
+    With setup, each call is call(setup(i)) and only call is timed (e.g.
+    setup creates the note that call deletes).
+    """
+    def timed(i):
+        argument = setup(i) if setup else i
+        start = time.perf_counter()
+        call(argument)
+        return time.perf_counter() - start
+
+    first_call = timed(0)
+    latencies = []
+    started = time.perf_counter()
+    i = 1
+    while i <= ops and (len(latencies) < MIN_OPS or time.perf_counter() - started < time_budget):
+        latencies.append(timed(i))
+        i += 1
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        'ops': len(latencies),
+        'ops_per_sec': round(len(latencies) / total, 1) if total else None,
+        'first_call_ms': round(first_call * 1000, 3),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 4),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 4),
+        'p90_ms': round(percentile(latencies, 0.90) * 1000, 4),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 4),
+        'max_ms': round(latencies[-1] * 1000, 4),
+    }
+
+
+def method_calls(data_service: DataService, notes_service: NotesService,
+                 user_service: UserService, dataset: dict, seed: int) -> list:
+    """(name, call, setup) for every public service method, reads before writes.
+
+    Per-user methods run against the user with the most notes. Writes work
+    on notes and users created for them (untimed, by setup), so reads see
+    the generated data set unchanged.
+    """
+    rng = random.Random(seed)
+    user_id = dataset['heaviest_user_id']
+    user_ids = dataset['user_ids']
+    own_notes = data_service.get_notes_by_user(user_id)
+    note_ids = [note.id for note in own_notes]
+    all_note_count = dataset['notes']
+    words = make_vocabulary(dataset['seed'])[:200]  # frequent words: real result lists
+    oldest = own_notes[-1].created_at if own_notes else 0
+    newest = own_notes[0].created_at if own_notes else 0
+    names = [user_name(i) for i in range(dataset['users'])]
+    # Page cursors spread over the user's notes, for paging from the middle
+    cursors = [None] + [NotesService.note_cursor(note) for note in own_notes[::20]]
+
+    new_user_names = (user_name(10 ** 6 + n) for n in itertools.count())
+
+    def random_note_id():
+        return rng.choice(note_ids) if note_ids else 1
+
+    def month_window():
+        start = rng.randint(oldest, max(oldest, newest - 30 * 86400))
+        return start, start + 30 * 86400
+
+    def new_note(i):
+        return data_service.save_note(Note(id=data_service.get_next_note_id(), title=f"Bench note {i}",
+                                           content="bench body", created_at=now_timestamp(), user_id=user_id))
+
+    def new_user(i):
+        return user_service.create_user(next(new_user_names), "Bench", "01/01/1990", "blue")
+
+    def new_notes(i):
+        return [
+            Note(id=note_id, title=f"Batch {i}", content="bulk body", created_at=now_timestamp(), user_id=user_id)
+            for note_id in data_service.reserve_note_ids(BULK_SIZE)
+        ]
+
+    def new_rows(i):
+        return [{'title': f"Bulk {i} {n}", 'content': f"{rng.choice(words)} bulk"} for n in range(BULK_SIZE)]
+
+    def save_note(note):
+        note.content = "saved again"
+        data_service.save_note(note)
+
+    return [
+        # Reads
+        ('DataService.get_user_by_id', lambda i: data_service.get_user_by_id(rng.choice(user_ids))),
+        ('DataService.get_user_by_name', lambda i: data_service.get_user_by_name(rng.choice(names))),
+        ('DataService.get_all_users', lambda i: data_service.get_all_users()),
+        ('DataService.get_note_by_id', lambda i: data_service.get_note_by_id(rng.randint(1, all_note_count))),
+        ('DataService.get_notes_by_user', lambda i: data_service.get_notes_by_user(user_id)),
+        ('DataService.iter_notes_by_user', lambda i: sum(1 for _ in data_service.iter_notes_by_user(user_id))),
+        ('DataService.get_notes_page', lambda i: data_service.get_notes_page(user_id, 20)),
+        ('DataService.get_notes_by_user_between',
+         lambda i: data_service.get_notes_by_user_between(user_id, *month_window())),
+        ('DataService.get_all_notes', lambda i: data_service.get_all_notes()),
+        ('UserService.get_user_by_id', lambda i: user_service.get_user_by_id(rng.choice(user_ids))),
+        ('UserService.get_user_by_name', lambda i: user_service.get_user_by_name(rng.choice(names))),
+        ('UserService.user_exists', lambda i: user_service.user_exists(rng.choice(names))),
+        ('UserService.get_all_users', lambda i: user_service.get_all_users()),
+        ('NotesService.get_note', lambda i: notes_service.get_note(random_note_id(), user_id)),
+        ('NotesService.get_user_notes', lambda i: notes_service.get_user_notes(user_id)),
+        ('NotesService.list_notes', lambda i: notes_service.list_notes(user_id, 20, rng.choice(cursors))),
+        # What the TUI's notes table shows of a page
+        ('NotesService.list_notes (table rows)',
+         lambda i: [(note.title, note.created_display, note.get_summary(40))
+                    for note in notes_service.list_notes(user_id, 20, rng.choice(cursors))['notes']]),
+        ('NotesService.get_notes_between', lambda i: notes_service.get_notes_between(user_id, *month_window())),
+        ('NotesService.search_notes', lambda i: notes_service.search_notes(rng.choice(words), user_id)),
+        ('NotesService.get_notes_summary', lambda i: notes_service.get_notes_summary(user_id)),
+        ('NotesService.export_notes', lambda i: notes_service.export_notes(user_id, 'jsonl', io.StringIO())),
+        # Writes
+        ('DataService.get_next_note_id', lambda i: data_service.get_next_note_id()),
+        ('NotesService.create_note',
+         lambda i: notes_service.create_note(f"Bench note {i}", f"{rng.choice(words)} body {i}", user_id)),
+        ('NotesService.update_note_title',
+         lambda note: notes_service.update_note_title(note.id, "Retitled", user_id), new_note),
+        ('NotesService.update_note_content',
+         lambda note: notes_service.update_note_content(note.id, f"{rng.choice(words)} rewritten", user_id),
+         new_note),
+        ('DataService.save_note', save_note, new_note),
+        ('DataService.save_notes', data_service.save_notes, new_notes),
+        ('NotesService.bulk_create_notes', lambda rows: notes_service.bulk_create_notes(rows, user_id=user_id),
+         new_rows),
+        ('NotesService.delete_note', lambda note: notes_service.delete_note(note.id, user_id), new_note),
+        ('DataService.delete_note', lambda note: data_service.delete_note(note.id), new_note),
+        ('UserService.create_user', new_user),
+        ('UserService.update_user', lambda user: user_service.update_user(user.id, favorite_color="red"), new_user),
+        ('UserService.delete_user', lambda user: user_service.delete_user(user.id), new_user),
+    ]
+
+
+def run_scale(notes: int, options: dict) -> dict:
+    """Generate one data set and time every method on it (runs in a fresh process)."""
+    data_dir = tempfile.mkdtemp(prefix='notes-bench-')
+    data_options = {'storage': options['storage'], 'cached': options['cached'], 'durable': options['durable'],
+                    'lazy_content': options.get('lazy_content', False)}
+    try:
+        data_service = DataService(data_dir, **data_options)
+        dataset = generate(data_service, notes, options['users'], options['owners'],
+                           options['content'], options['content_size'], options['seed'])
+        data_service.close()
+        rss_after_generate = peak_rss_mb()
+
+        # Time against a freshly opened service, as the app would see the data
+        start = time.perf_counter()
+        data_service = DataService(data_dir, **data_options)
+        open_seconds = time.perf_counter() - start
+        notes_service = NotesService(data_service)
+        user_service = UserService(data_service, notes_service.search_index)
+
+        only = options['methods']
+        results = {}
+        for name, call, *setup in method_calls(data_service, notes_service, user_service,
+                                               dataset, options['seed']):
+            if only and not any(pattern in name for pattern in only):
+                continue
+            results[name] = time_method(call, options['ops'], options['time_budget'], *setup)
+        data_service.close()
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    dataset.pop('user_ids')
+    return {
+        'notes': notes,
+        'dataset': dataset,
+        'open_seconds': round(open_seconds, 4),
+        'peak_rss_mb_after_generate': rss_after_generate,
+        'peak_rss_mb': peak_rss_mb(),
+        'methods': results,
+    }
+
+
+def run_scale_star(args):
+    return run_scale(*args)
+
+
+def run_suite(scales: list, options: dict, quiet: bool = False) -> dict:
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for notes in scales:
+        # A fresh process per scale: peak RSS belongs to that scale alone
+        with context.Pool(1) as pool:
+            result = pool.apply(run_scale_star, ((notes, options),))
+        results.append(result)
+        if not quiet:
+            print_scale(result)
+    return {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'options': options,
+        },
+        'scales': results,
+    }
+
+
+def print_scale(result: dict):
+    dataset = result['dataset']
+    print(f"\n{result['notes']} notes, {dataset['users']} users "
+          f"(heaviest user: {dataset['max_notes_per_user']} notes), "
+          f"generated in {dataset['seconds']} s, {dataset['bytes_on_disk'] / 1e6:.1f} MB on disk, "
+          f"opened in {result['open_seconds'] * 1000:.1f} ms, peak RSS {result['peak_rss_mb']} MB")
+    print(f"  {'method':<40} {'ops/s':>10} {'p50 ms':>10} {'p90 ms':>10} {'p99 ms':>10} {'first ms':>10}")
+    for name, stats in result['methods'].items():
+        print(f"  {name:<40} {stats['ops_per_sec'] or 0:>10.1f} {stats['p50_ms']:>10.3f} "
+              f"{stats['p90_ms']:>10.3f} {stats['p99_ms']:>10.3f} {stats['first_call_ms']:>10.3f}")
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_delta_ms: float) -> list:
+    """Regressions between two result files, as printable lines."""
+    regressions = []
+    baseline_scales = {scale['notes']: scale for scale in baseline['scales']}
+    for scale in current['scales']:
+        old = baseline_scales.get(scale['notes'])
+        if old is None:
+            continue
+        for name, stats in scale['methods'].items():
+            old_stats = old['methods'].get(name)
+            if old_stats is None:
+                continue
+            before, after = old_stats['p50_ms'], stats['p50_ms']
+            if after - before > min_delta_ms and after > before * (1 + threshold):
+                regressions.append(f"{scale['notes']} notes: {name} p50 {before:.3f} -> {after:.3f} ms "
+                                   f"(+{(after / before - 1) * 100 if before else float('inf'):.0f}%)")
+        before, after = old['peak_rss_mb'], scale['peak_rss_mb']
+        if after > before * (1 + threshold):
+            regressions.append(f"{scale['notes']} notes: peak RSS {before} -> {after} MB")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default=",".join(map(str, DEFAULT_SCALES)),
+                        help='Comma-separated note counts, e.g. 1000,10000,100000,1000000.')
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--owners', choices=('uniform', 'zipf'), default='uniform')
+    parser.add_argument('--content', choices=('fixed', 'uniform', 'lognormal'), default='lognormal')
+    parser.add_argument('--content-size', type=int, default=400, help='Mean content length (characters).')
+    parser.add_argument('--storage', choices=('json', 'journal', 'sharded'), default='json')
+    parser.add_argument('--uncached', action='store_true', help='Run without the in-memory cache.')
+    parser.add_argument('--durable', action='store_true', help='fsync every write (slow on some disks).')
+    parser.add_argument('--lazy-content', action='store_true',
+                        help='Keep note contents in notes.content (DataService lazy_content).')
+    parser.add_argument('--ops', type=int, default=DEFAULT_OPS, help='Timed calls per method (at most).')
+    parser.add_argument('--time-budget', type=float, default=DEFAULT_TIME_BUDGET,
+                        help='Seconds per method before it stops early.')
+    parser.add_argument('--methods', default='', help='Only time methods containing one of these (comma-separated).')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='Write results to this JSON file.')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='Compare two result files instead of running.')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown flagged as a regression in compare mode.')
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help='Smaller p50 changes are never flagged.')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold, args.min_delta_ms)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}" if regressions
+              else f"PASS: no regressions above {args.threshold:.0%}")
+        return 1 if regressions else 0
+
+    options = {
+        'users': args.users,
+        'owners': args.owners,
+        'content': args.content,
+        'content_size': args.content_size,
+        'storage': args.storage,
+        'cached': not args.uncached,
+        'durable': args.durable,
+        'lazy_content': args.lazy_content,
+        'ops': args.ops,
+        'time_budget': args.time_budget,
+        'methods': [pattern for pattern in args.methods.split(",") if pattern],
+        'seed': args.seed,
+    }
+    report = run_suite([int(scale) for scale in args.scales.split(",")], options, quiet=args.json)
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Cold start benchmark for Notes Assistant.
+
+Imports backend/src/main.py in fresh interpreters with `python -X importtime`
+and fails (exit code 1) when:
+- the median import time of `main` exceeds the budget, or
+- a heavy UI module is imported eagerly instead of on first use.
+
+Usage:
+    python backend/benchmarks/startup_benchmark.py
+    python backend/benchmarks/startup_benchmark.py --runs 10 --budget-ms 200 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Default budget for importing main (milliseconds). Lazy UI imports brought
+# this from several hundred ms down to well under 100 ms on a laptop.
+DEFAULT_BUDGET_MS = 150.0
+
+# Modules that must only be loaded when the UI actually needs them
+LAZY_MODULES = [
+    'rich', 'questionary', 'pyfiglet', 'alive_progress',
+    'click', 'tabulate', 'prompt_toolkit', 'matplotlib',
+]
+
+
+def measure_once(module: str = 'main') -> dict:
+    """Import a module in a fresh interpreter and parse the -X importtime report."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=SRC_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    total_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _self_us, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            total_us = int(cumulative)
+
+    return {'total_ms': (total_us or 0) / 1000, 'modules': imported}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='Number of cold starts to measure.')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='Fail if the median import time of main exceeds this.')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON.')
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+    timings = [run['total_ms'] for run in runs]
+    median_ms = statistics.median(timings)
+    eager = sorted(
+        module for module in LAZY_MODULES
+        if any(module in run['modules'] for run in runs)
+    )
+
+    report = {
+        'runs': args.runs,
+        'median_ms': round(median_ms, 2),
+        'min_ms': round(min(timings), 2),
+        'max_ms': round(max(timings), 2),
+        'budget_ms': args.budget_ms,
+        'eager_heavy_modules': eager,
+        'passed': median_ms <= args.budget_ms and not eager,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"import main: median {report['median_ms']} ms "
+              f"(min {report['min_ms']}, max {report['max_ms']}, {args.runs} runs), "
+              f"budget {args.budget_ms} ms")
+        if eager:
+            print(f"Heavy modules imported at startup: {', '.join(eager)}")
+        print("PASS" if report['passed'] else "FAIL: cold start regressed")
+
+    return 0 if report['passed'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
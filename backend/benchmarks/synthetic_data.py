@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for Notes Assistant benchmarks.
+
+Fills a data directory with users and notes through DataService, so every
+storage engine lays the data out exactly as the app would. The shape is
+configurable and reproducible from the seed:
+- how notes are spread over users (uniform, or zipf: a few heavy users),
+- how long note contents are (fixed, uniform or lognormal around a mean),
+- words drawn from a fixed vocabulary with zipf frequencies, so searches
+  hit realistic posting-list sizes.
+
+Usage:
+    python backend/benchmarks/synthetic_data.py /tmp/notes-data --notes 100000
+    python backend/benchmarks/synthetic_data.py /tmp/notes-data --users 50 --owners zipf --content lognormal
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from models.note import Note, now_timestamp
+from models.user import User
+from services.data_service import DataService
+
+OWNER_DISTRIBUTIONS = ('uniform', 'zipf')
+CONTENT_DISTRIBUTIONS = ('fixed', 'uniform', 'lognormal')
+COLORS = ('red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink', 'brown')
+
+VOCABULARY_SIZE = 5000
+SYLLABLES = ('ka', 'lo', 'mi', 'ne', 'su', 'ta', 'ri', 'po', 'da', 've', 'xo', 'qui', 'bra', 'nel', 'tor')
+BATCH_SIZE = 10_000  # notes per save_notes() call
+ONE_YEAR = 365 * 24 * 3600
+
+
+def make_vocabulary(seed: int, size: int = VOCABULARY_SIZE) -> list:
+    """Distinct pseudo-words; earlier words are the more frequent ones."""
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+    while len(words) < size:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def zipf_weights(count: int) -> list:
+    """Cumulative weights for random.choices: the k-th item has weight 1/k."""
+    return list(itertools.accumulate(1 / rank for rank in range(1, count + 1)))
+
+
+def content_length(rng: random.Random, distribution: str, mean: int) -> int:
+    """Length in characters of one note's content."""
+    if distribution == 'fixed':
+        return mean
+    if distribution == 'uniform':
+        return rng.randint(1, 2 * mean)
+    # lognormal with the requested mean: mostly short notes, a long tail
+    sigma = 1.0
+    return max(1, int(rng.lognormvariate(0, sigma) * mean / 1.6487))  # e^(sigma^2/2)
+
+
+def make_text(rng: random.Random, vocabulary: list, cum_weights: list, length: int) -> str:
+    """Words from the vocabulary until the text is at least length characters."""
+    words = []
+    size = -1
+    while size < length:
+        word = rng.choices(vocabulary, cum_weights=cum_weights)[0]
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+
+def user_name(index: int) -> str:
+    """A unique, letters-only user name."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('a') + remainder) + letters
+    return "Bench" + letters
+
+
+def generate(data_service: DataService, notes: int, users: int = 100,
+             owners: str = 'uniform', content: str = 'lognormal',
+             content_size: int = 400, seed: int = 0) -> dict:
+    """Create users and notes in data_service. Returns a summary of the data set."""
+    if owners not in OWNER_DISTRIBUTIONS:
+        raise ValueError(f"Unknown owner distribution: {owners}")
+    if content not in CONTENT_DISTRIBUTIONS:
+        raise ValueError(f"Unknown content distribution: {content}")
+
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(seed)
+    word_weights = zipf_weights(len(vocabulary))
+    start = time.perf_counter()
+
+    user_list = [
+        User(id=data_service.get_next_user_id(), name=user_name(i), surname="Tester",
+             birthday="01/01/1990", favorite_color=rng.choice(COLORS))
+        for i in range(users)
+    ]
+    owner_weights = zipf_weights(users) if owners == 'zipf' else None
+
+    # Creation times spread over the last year, increasing with the note ID
+    now = now_timestamp()
+    note_ids = data_service.reserve_note_ids(notes)
+    notes_per_user = Counter()
+    content_chars = 0
+    with data_service.group_commit():
+        for user in user_list:
+            data_service.save_user(user)
+        batch = []
+        for position, note_id in enumerate(note_ids):
+            owner = rng.choices(user_list, cum_weights=owner_weights)[0]
+            text = make_text(rng, vocabulary, word_weights, content_length(rng, content, content_size))
+            batch.append(Note(
+                id=note_id,
+                title=make_text(rng, vocabulary, word_weights, rng.randint(10, 60))[:100],
+                content=text,
+                created_at=now - ONE_YEAR + (ONE_YEAR * position) // max(notes, 1),
+                user_id=owner.id
+            ))
+            notes_per_user[owner.id] += 1
+            content_chars += len(text)
+            if len(batch) == BATCH_SIZE:
+                data_service.save_notes(batch)
+                batch = []
+        data_service.save_notes(batch)
+
+    counts = [notes_per_user[user.id] for user in user_list]
+    return {
+        'users': users,
+        'notes': notes,
+        'owners': owners,
+        'content': content,
+        'content_size': content_size,
+        'seed': seed,
+        'user_ids': [user.id for user in user_list],
+        'heaviest_user_id': max(user_list, key=lambda user: notes_per_user[user.id]).id,
+        'max_notes_per_user': max(counts, default=0),
+        'mean_content_chars': round(content_chars / notes, 1) if notes else 0,
+        'seconds': round(time.perf_counter() - start, 3),
+        'bytes_on_disk': directory_size(data_service.data_dir),
+    }
+
+
+def directory_size(path: str) -> int:
+    """Total size of the files under path."""
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _dirs, names in os.walk(path) for name in names
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('data_dir', help='Directory to fill (created if missing).')
+    parser.add_argument('--notes', type=int, default=10_000)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--owners', choices=OWNER_DISTRIBUTIONS, default='uniform',
+                        help='How notes are spread over users.')
+    parser.add_argument('--content', choices=CONTENT_DISTRIBUTIONS, default='lognormal',
+                        help='Distribution of note content lengths.')
+    parser.add_argument('--content-size', type=int, default=400, help='Mean content length (characters).')
+    parser.add_argument('--storage', choices=('json', 'journal', 'sharded'), default='json')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    data_service = DataService(args.data_dir, storage=args.storage, durable=False)
+    try:
+        summary = generate(data_service, args.notes, args.users, args.owners,
+                           args.content, args.content_size, args.seed)
+    finally:
+        data_service.close()
+    del summary['user_ids']
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""
+API package for Notes Assistant.
+
+Exposes the services over HTTP:
+- NotesApi: Routes JSON requests to UserService/NotesService
+- create_server: Threaded stdlib HTTP server around NotesApi
+"""
+
+from .server import ApiError, NotesApi, create_server
+
+__all__ = ['ApiError', 'NotesApi', 'create_server']
@@ -0,0 +1,290 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from models.validation import content_problem, title_problem
+from services.data_service import DataService
+from services.user_service import UserService
+from services.notes_service import NotesService
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+
+class ApiError(Exception):
+    """An error that maps directly to an HTTP status code."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class NotesApi:
+     # Framework-free JSON API over NotesService/UserService
+     # One shared (cached) DataService; reads run in parallel, changes one at a time
+    """Routes API requests to the services and returns (status, payload)."""
+
+    ROUTES = [
+        ('GET', re.compile(r'^/api/notes$'), 'list_notes'),
+        ('POST', re.compile(r'^/api/notes$'), 'create_note'),
+        ('GET', re.compile(r'^/api/notes/search$'), 'search_notes'),
+        ('GET', re.compile(r'^/api/notes/(\d+)$'), 'get_note'),
+        ('PUT', re.compile(r'^/api/notes/(\d+)$'), 'update_note'),
+        ('DELETE', re.compile(r'^/api/notes/(\d+)$'), 'delete_note'),
+        ('GET', re.compile(r'^/api/users$'), 'list_users'),
+        ('POST', re.compile(r'^/api/users$'), 'create_user'),
+        ('GET', re.compile(r'^/api/users/(\d+)$'), 'get_user'),
+    ]
+
+    def __init__(self, data_service: DataService):
+        self.data_service = data_service
+        self.notes_service = NotesService(data_service)
+        self.user_service = UserService(data_service, self.notes_service.search_index)
+        # Held by requests that change data: their check-then-write steps
+        # (e.g. read a note, then save it) must not interleave. Reads rely on
+        # DataService's readers-writer lock and the SearchIndex's own lock.
+        self.lock = threading.RLock()
+
+    def dispatch(self, method: str, path: str, query: dict, body: Optional[dict]) -> Tuple[int, object]:
+        """Find the handler for a request and run it."""
+        path_matched = False
+        for route_method, pattern, handler_name in self.ROUTES:
+            match = pattern.match(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method == method:
+                handler = getattr(self, handler_name)
+                if method == 'GET':
+                    return handler(query, body or {}, *match.groups())
+                with self.lock:
+                    return handler(query, body or {}, *match.groups())
+        if path_matched:
+            raise ApiError(405, "Method not allowed")
+        raise ApiError(404, "Not found")
+
+    # Request parsing helpers
+    @staticmethod
+    def _int_param(query: dict, name: str, default: Optional[int] = None) -> int:
+        value = query.get(name, [None])[0]
+        if not value:
+            if default is None:
+                raise ApiError(400, f"Missing query parameter: {name}")
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ApiError(400, f"Query parameter {name} must be an integer")
+
+    def _user_id(self, query: dict, body: dict) -> int:
+        """The acting user: ?user_id=... or "user_id" in the JSON body."""
+        if 'user_id' in body:
+            try:
+                return int(body['user_id'])
+            except (TypeError, ValueError):
+                raise ApiError(400, "user_id must be an integer")
+        return self._int_param(query, 'user_id')
+
+    def _page(self, query: dict, key: str, items: list) -> dict:
+        """Slice a list endpoint's results with ?limit=&offset=."""
+        limit = min(max(self._int_param(query, 'limit', DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+        offset = max(self._int_param(query, 'offset', 0), 0)
+        end = offset + limit
+        return {
+            key: [item.to_dict() for item in items[offset:end]],
+            'total': len(items),
+            'limit': limit,
+            'offset': offset,
+            'next_offset': end if end < len(items) else None,
+        }
+
+    # Notes endpoints
+    def list_notes(self, query: dict, body: dict):
+        user_id = self._user_id(query, body)
+        if 'cursor' not in query:
+            return 200, self._page(query, 'notes', self.notes_service.get_user_notes(user_id))
+
+        # Keyset pagination: ?cursor= (empty for the first page), then each
+        # response's next_cursor. Loads only the requested page.
+        limit = min(max(self._int_param(query, 'limit', DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+        try:
+            page = self.notes_service.list_notes(user_id, limit, query['cursor'][0] or None)
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return 200, {
+            'notes': [note.to_dict() for note in page['notes']],
+            'limit': limit,
+            'next_cursor': page['next_cursor'],
+        }
+
+    def search_notes(self, query: dict, body: dict):
+        user_id = self._user_id(query, body)
+        text = query.get('q', [''])[0]
+        return 200, {'notes': [note.to_dict() for note in self.notes_service.search_notes(text, user_id)]}
+
+    def get_note(self, query: dict, body: dict, note_id: str):
+        note = self.notes_service.get_note(int(note_id), self._user_id(query, body))
+        if not note:
+            raise ApiError(404, f"Note {note_id} not found")
+        return 200, note.to_dict()
+
+    def create_note(self, query: dict, body: dict):
+        user_id = self._user_id(query, body)
+        if not self.user_service.get_user_by_id(user_id):
+            raise ApiError(404, f"User {user_id} not found")
+        try:
+            note = self.notes_service.create_note(
+                str(body.get('title', '')), str(body.get('content', '')), user_id
+            )
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return 201, note.to_dict()
+
+    def update_note(self, query: dict, body: dict, note_id: str):
+        user_id = self._user_id(query, body)
+        note = self.notes_service.get_note(int(note_id), user_id)
+        if not note:
+            raise ApiError(404, f"Note {note_id} not found")
+        if 'title' not in body and 'content' not in body:
+            raise ApiError(400, "Nothing to update: send title and/or content")
+        # Check both fields first: a bad content must not leave a new title saved
+        problem = (('title' in body and title_problem(str(body['title']).strip()))
+                   or ('content' in body and content_problem(str(body['content']).strip())))
+        if problem:
+            raise ApiError(400, problem)
+        try:
+            if 'title' in body:
+                note = self.notes_service.update_note_title(note.id, str(body['title']), user_id)
+            if 'content' in body:
+                note = self.notes_service.update_note_content(note.id, str(body['content']), user_id)
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return 200, note.to_dict()
+
+    def delete_note(self, query: dict, body: dict, note_id: str):
+        if not self.notes_service.delete_note(int(note_id), self._user_id(query, body)):
+            raise ApiError(404, f"Note {note_id} not found")
+        return 200, {'deleted': int(note_id)}
+
+    # Users endpoints
+    def list_users(self, query: dict, body: dict):
+        return 200, self._page(query, 'users', self.user_service.get_all_users())
+
+    def create_user(self, query: dict, body: dict):
+        name = str(body.get('name', ''))
+        if self.user_service.user_exists(name):
+            raise ApiError(409, f"User '{name}' already exists")
+        try:
+            user = self.user_service.create_user(
+                name, str(body.get('surname', '')),
+                str(body.get('birthday', '')), str(body.get('favorite_color', ''))
+            )
+        except ValueError as e:
+            raise ApiError(400, str(e))
+        return 201, user.to_dict()
+
+    def get_user(self, query: dict, body: dict, user_id: str):
+        user = self.user_service.get_user_by_id(int(user_id))
+        if not user:
+            raise ApiError(404, f"User {user_id} not found")
+        return 200, user.to_dict()
+
+
+class NotesRequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests to NotesApi calls (JSON in, JSON out)."""
+
+    # Keep-alive, so clients (and the load test) can reuse connections
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle's
+    # algorithm plus delayed ACKs add ~40 ms to every keep-alive response
+    disable_nagle_algorithm = True
+    api: NotesApi = None  # set by create_server
+    quiet = False
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def _read_body(self) -> Optional[dict]:
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise ApiError(400, "Content-Length must be an integer")
+        if not length:
+            return None
+        try:
+            body = json.loads(self.rfile.read(length))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ApiError(400, "Request body must be JSON")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Request body must be a JSON object")
+        return body
+
+    def _handle(self, method: str):
+        url = urlparse(self.path)
+        try:
+            body = self._read_body()
+            query = parse_qs(url.query, keep_blank_values=True)  # keeps ?cursor=
+            status, payload = self.api.dispatch(method, url.path, query, body)
+        except ApiError as e:
+            status, payload = e.status, {'error': e.message}
+        except Exception:  # never let a bug kill the connection silently
+            # Details go to the log, not to the client
+            logger.exception("Error handling %s %s", method, url.path)
+            status, payload = 500, {'error': "Internal server error"}
+        self._send_json(status, payload, use_etag=(method == 'GET' and status == 200))
+
+    def _send_json(self, status: int, payload, use_etag: bool = False):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+
+        if use_etag:
+            etag = '"' + hashlib.sha1(data).hexdigest() + '"'
+            headers['ETag'] = etag
+            if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+                status, data = 304, b''
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def create_server(data_dir: str, host: str = "127.0.0.1", port: int = 8000,
+                  quiet: bool = False, **data_service_options) -> ThreadingHTTPServer:
+    """Build a threaded HTTP server sharing one cached DataService.
+
+    Use server.serve_forever() to run it and server.server_close() plus
+    server.api.data_service.close() to stop it.
+    """
+    data_service = DataService(data_dir, cached=True, **data_service_options)
+    api = NotesApi(data_service)
+    handler = type('BoundNotesRequestHandler', (NotesRequestHandler,), {'api': api, 'quiet': quiet})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.api = api
+    return server
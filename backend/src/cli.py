@@ -0,0 +1,265 @@
+"""
+Command line interface for Notes Assistant.
+
+Non-interactive subcommands for scripting, e.g.:
+    python run.py import notes.jsonl --user Ana
+    python run.py export --user Ana --format markdown -o notes.md
+    python run.py notes list --user Ana
+    python run.py serve --port 8000
+    python run.py compact
+    python run.py --pacing instant          (interactive menu, no pauses)
+
+All output meant for scripts (the notes commands) is JSON on stdout; errors go
+to stderr with a non-zero exit code. Nothing here prompts or sleeps.
+"""
+
+import gzip
+import json
+import os
+import sys
+
+import click
+
+# Add the src directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from models.validation import content_problem, title_problem
+from services.data_service import DataService
+from services.user_service import UserService
+from services.notes_service import NotesService
+from services.note_import import IMPORT_FORMATS, detect_format, read_note_rows
+from services.note_export import EXPORT_FORMATS
+from utils.pacing import PACING_MODES
+
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+class CliContext:
+    """Services shared by every subcommand."""
+
+    def __init__(self, data_dir: str):
+        self.data_service = DataService(data_dir, cached=True)
+        self.notes_service = NotesService(self.data_service)
+        self.user_service = UserService(self.data_service, self.notes_service.search_index)
+
+    def resolve_user(self, name: str):
+        """Look up a user by name or exit with an error."""
+        user = self.user_service.get_user_by_name(name)
+        if not user:
+            raise click.ClickException(f"User '{name}' not found")
+        return user
+
+
+def open_text(path: str, mode: str = 'r', compress: bool = False):
+    """Open a text file, transparently (de)compressing .gz files ('-' is stdin/stdout)."""
+    compress = compress or path.lower().endswith('.gz')
+    if path == '-':
+        if compress:
+            stream = click.get_binary_stream('stdin' if mode == 'r' else 'stdout')
+            return gzip.open(stream, mode + 't', encoding='utf-8', newline='')
+        return click.get_text_stream('stdin' if mode == 'r' else 'stdout')
+    if compress:
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='')
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+@click.group(invoke_without_command=True)
+@click.option('--data-dir', default=DEFAULT_DATA_DIR, show_default=True,
+              help='Directory holding the JSON data files.')
+@click.option('--pacing', type=click.Choice(PACING_MODES),
+              help='Interactive menu only: how long messages pause the UI.')
+@click.pass_context
+def cli(ctx, data_dir, pacing):
+    """Notes Assistant command line tools.
+
+    Without a subcommand, starts the interactive menu.
+    """
+    if ctx.invoked_subcommand is None:
+        from main import main
+        main(data_dir, pacing)
+        return
+    ctx.obj = CliContext(data_dir)
+    ctx.call_on_close(ctx.obj.data_service.close)
+
+
+@cli.command('import')
+@click.argument('path')
+@click.option('--user', 'user_name', help='Owner of rows that have no user_id.')
+@click.option('--format', 'fmt', type=click.Choice(IMPORT_FORMATS),
+              help='Input format (default: from the file extension).')
+@click.option('--strict', is_flag=True, help='Abort without importing anything if a row is invalid.')
+@click.pass_obj
+def import_notes(app: CliContext, path, user_name, fmt, strict):
+    """Bulk-import notes from a JSON-lines or CSV file (.gz supported, '-' for stdin)."""
+    user_id = app.resolve_user(user_name).id if user_name else None
+    fmt = fmt or detect_format(path)
+
+    with open_text(path) as stream:
+        try:
+            result = app.notes_service.bulk_create_notes(
+                read_note_rows(stream, fmt), user_id=user_id, strict=strict
+            )
+        except ValueError as e:
+            raise click.ClickException(str(e))
+
+    for row_number, message in result['errors']:
+        click.echo(f"Row {row_number}: {message}", err=True)
+    click.echo(f"Imported {result['created']} note(s), skipped {len(result['errors'])} invalid row(s).")
+
+
+@cli.command('export')
+@click.option('--user', 'user_name', required=True, help='Whose notes to export.')
+@click.option('--format', 'fmt', type=click.Choice(EXPORT_FORMATS), default='jsonl', show_default=True)
+@click.option('-o', '--output', default='-', show_default=True, help="Output file ('-' for stdout).")
+@click.option('--gzip', 'compress', is_flag=True, help='Gzip the output (implied by a .gz file name).')
+@click.pass_obj
+def export_notes(app: CliContext, user_name, fmt, output, compress):
+    """Stream a user's notes to jsonl, csv or markdown."""
+    user = app.resolve_user(user_name)
+    with open_text(output, 'w', compress=compress) as sink:
+        count = app.notes_service.export_notes(user.id, fmt, sink)
+    click.echo(f"Exported {count} note(s).", err=True)
+
+
+@cli.command('serve')
+@click.option('--host', default='127.0.0.1', show_default=True)
+@click.option('--port', default=8000, show_default=True, type=int)
+@click.option('--quiet', is_flag=True, help='Do not log each request.')
+@click.pass_context
+def serve(ctx, host, port, quiet):
+    """Serve the notes JSON API over HTTP (Ctrl+C to stop)."""
+    from api.server import create_server
+
+    # The server owns its own shared DataService, so release the CLI one
+    ctx.obj.data_service.close()
+    server = create_server(ctx.parent.params['data_dir'], host, port, quiet=quiet)
+    click.echo(f"Serving notes API on http://{host}:{server.server_address[1]}/api/notes", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.api.data_service.close()
+
+
+@cli.command('compact')
+@click.pass_obj
+def compact(app: CliContext):
+    """Reclaim the space edited and deleted notes left in notes.content."""
+    if not os.path.exists(app.data_service.content_file):
+        click.echo("No notes.content to compact.", err=True)
+        return
+    reclaimed = app.data_service.compact_content()
+    click.echo(f"Reclaimed {reclaimed} byte(s) of notes.content.", err=True)
+
+
+# Batch note commands - call NotesService directly, no menu, no delays
+def echo_json(data):
+    """Print data as JSON on stdout."""
+    click.echo(json.dumps(data, ensure_ascii=False))
+
+
+def read_content(content: str) -> str:
+    """'-' means: read the note content from stdin."""
+    return click.get_text_stream('stdin').read() if content == '-' else content
+
+
+@cli.group('notes')
+def notes_group():
+    """Create, read, update, delete and search notes (JSON output)."""
+
+
+@notes_group.command('list')
+@click.option('--user', 'user_name', required=True)
+@click.pass_obj
+def list_notes(app: CliContext, user_name):
+    """List a user's notes, newest first."""
+    user = app.resolve_user(user_name)
+    echo_json([note.to_dict() for note in app.notes_service.get_user_notes(user.id)])
+
+
+@notes_group.command('get')
+@click.argument('note_id', type=int)
+@click.option('--user', 'user_name', required=True)
+@click.pass_obj
+def get_note(app: CliContext, note_id, user_name):
+    """Show one note."""
+    user = app.resolve_user(user_name)
+    note = app.notes_service.get_note(note_id, user.id)
+    if not note:
+        raise click.ClickException(f"Note {note_id} not found")
+    echo_json(note.to_dict())
+
+
+@notes_group.command('create')
+@click.option('--user', 'user_name', required=True)
+@click.option('--title', required=True)
+@click.option('--content', required=True, help="Note content ('-' to read it from stdin).")
+@click.pass_obj
+def create_note(app: CliContext, user_name, title, content):
+    """Create a note and print it."""
+    user = app.resolve_user(user_name)
+    try:
+        note = app.notes_service.create_note(title, read_content(content), user.id)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    echo_json(note.to_dict())
+
+
+@notes_group.command('update')
+@click.argument('note_id', type=int)
+@click.option('--user', 'user_name', required=True)
+@click.option('--title', help='New title.')
+@click.option('--content', help="New content ('-' to read it from stdin).")
+@click.pass_obj
+def update_note(app: CliContext, note_id, user_name, title, content):
+    """Update a note's title and/or content and print it."""
+    user = app.resolve_user(user_name)
+    if title is None and content is None:
+        raise click.UsageError("Nothing to update: pass --title and/or --content")
+    if content is not None:
+        content = read_content(content)
+    # Check both before saving either, so a bad content leaves the title alone
+    problem = ((title is not None and title_problem(title.strip()))
+               or (content is not None and content_problem(content.strip())))
+    if problem:
+        raise click.ClickException(problem)
+    note = app.notes_service.get_note(note_id, user.id)
+    try:
+        if note and title is not None:
+            note = app.notes_service.update_note_title(note_id, title, user.id)
+        if note and content is not None:
+            note = app.notes_service.update_note_content(note_id, content, user.id)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    if not note:
+        raise click.ClickException(f"Note {note_id} not found")
+    echo_json(note.to_dict())
+
+
+@notes_group.command('delete')
+@click.argument('note_id', type=int)
+@click.option('--user', 'user_name', required=True)
+@click.pass_obj
+def delete_note(app: CliContext, note_id, user_name):
+    """Delete a note."""
+    user = app.resolve_user(user_name)
+    if not app.notes_service.delete_note(note_id, user.id):
+        raise click.ClickException(f"Note {note_id} not found")
+    echo_json({'deleted': note_id})
+
+
+@notes_group.command('search')
+@click.argument('query')
+@click.option('--user', 'user_name', required=True)
+@click.pass_obj
+def search_notes(app: CliContext, query, user_name):
+    """Search a user's notes, best match first."""
+    user = app.resolve_user(user_name)
+    echo_json([note.to_dict() for note in app.notes_service.search_notes(query, user.id)])
+
+
+if __name__ == "__main__":
+    cli()
@@ -6,32 +6,6 @@ Notes Assistant - A simple CRUD application for managing personal notes.
 import sys
 import os
 from typing import Optional
-# Import new dependencies from requirements.txt
-import click
-import rich
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.live import Live
-from rich.layout import Layout
-from rich.align import Align
-from rich.columns import Columns
-from rich.markdown import Markdown
-from rich.syntax import Syntax
-from rich.tree import Tree
-from rich.traceback import install as install_rich_traceback
-from rich import print as rprint
-import questionary
-from questionary import Style
-import pyfiglet
-from alive_progress import alive_bar
-import time
-
-# Initialize rich console
-console = Console()
 
 # Add the src directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -45,6 +19,19 @@ from utils.helpers import (
     InputValidator, DisplayHelper, InputHelper, 
     pause, clear_screen
 )
+from utils.lazy_import import LazyObject, lazy_import
+from utils.pacing import pacer, resolve_pacing_mode
+
+# UI libraries are imported on first use, not at startup: importing rich,
+# questionary and pyfiglet up front dominated cold start time.
+# (backend/benchmarks/startup_benchmark.py keeps an eye on this.)
+questionary = lazy_import("questionary")
+pyfiglet = lazy_import("pyfiglet")
+Panel = lazy_import("rich.panel", "Panel")
+Table = lazy_import("rich.table", "Table")
+
+# Rich console, created the first time something is printed
+console = LazyObject(lambda: lazy_import("rich.console", "Console")())
 
 
 class NotesAssistantApp:
@@ -53,12 +40,23 @@ class NotesAssistantApp:
     # Handles: Authentication, Menu system, User interactions
     # Dependencies: All models + services + utils
     
-    def __init__(self):
+    # Notes shown per page: only the visible page is loaded and rendered
+    NOTES_PAGE_SIZE = 20
+    
+    def __init__(self, data_dir: Optional[str] = None, pacing: Optional[str] = None):
         # Use the data directory relative to this source file
-        data_dir = os.path.join(os.path.dirname(__file__), 'data')
-        self.data_service = DataService(data_dir)
-        self.user_service = UserService(self.data_service)
+        data_dir = data_dir or os.path.join(os.path.dirname(__file__), 'data')
+        
+        # Pacing of transient messages: --pacing flag, NOTES_PACING env var,
+        # or "pacing" in data/settings.json (default: short sleeps)
+        pacer.set_mode(resolve_pacing_mode(pacing, os.path.join(data_dir, 'settings.json')))
+        
+        # Cached mode: parse each JSON file once and reuse it between menu actions.
+        # Lazy content: listings read titles and previews; a note's content is
+        # loaded from notes.content only when the note is opened
+        self.data_service = DataService(data_dir, cached=True, lazy_content=True)
         self.notes_service = NotesService(self.data_service)
+        self.user_service = UserService(self.data_service, self.notes_service.search_index)
         self.current_user: Optional[User] = None
     
     def run(self):
@@ -219,12 +217,12 @@ class NotesAssistantApp:
         
         for note in notes:
             title = note.title[:30] + "..." if len(note.title) > 30 else note.title
-            updated = note.updated_at or "Never"
+            updated = note.updated_display or "Never"
             
             row = [
                 str(note.id),
                 title,
-                note.created_at,
+                note.created_display,
                 updated
             ]
             
@@ -236,6 +234,24 @@ class NotesAssistantApp:
         
         console.print(table)
     
+    def browse_notes(self, show_content: bool = False) -> bool:
+        """Show the user's notes a page at a time. Returns False if there are none."""
+        cursor = None
+        page_number = 1
+        while True:
+            page = self.notes_service.list_notes(self.current_user.id, self.NOTES_PAGE_SIZE, cursor)
+            if not page['notes']:
+                return page_number > 1
+            
+            self.display_notes_table_rich(page['notes'], show_content)
+            cursor = page['next_cursor']
+            if not cursor:
+                return True
+            console.print(f"Page {page_number}", style="dim")
+            if not questionary.confirm("Show the next page?", default=False).ask():
+                return True
+            page_number += 1
+    
     def create_note(self):
         """Create a new note."""
         console.print(Panel("🖊️ Create New Note", style="bold blue"))
@@ -259,20 +275,17 @@ class NotesAssistantApp:
             note = self.notes_service.create_note(title, content, self.current_user.id)
             console.print(f"✅ Note '{note.title}' created successfully!", style="green bold")
             console.print(f"📝 Note ID: {note.id}", style="cyan")
-            console.print(f"📅 Created: {note.created_at}", style="cyan")
+            console.print(f"📅 Created: {note.created_display}", style="cyan")
         except ValueError as e:
             console.print(f"❌ Failed to create note: {str(e)}", style="red")
     
     def read_note(self):
         """Read a specific note."""
-        notes = self.notes_service.get_user_notes(self.current_user.id)
-        if not notes:
+        console.print(Panel("📚 Your Notes", style="bold blue"))
+        if not self.browse_notes():
             console.print("⚠️  You don't have any notes yet.", style="yellow")
             return
         
-        console.print(Panel("📚 Your Notes", style="bold blue"))
-        self.display_notes_table_rich(notes)
-        
         try:
             note_id = int(questionary.text("Enter note ID to read:").ask())
             note = self.notes_service.get_note(note_id, self.current_user.id)
@@ -280,9 +293,9 @@ class NotesAssistantApp:
             if note:
                 console.print(Panel(f"📝 Note: {note.title}", style="bold magenta"))
                 console.print(f"📝 ID: {note.id}", style="cyan")
-                console.print(f"📅 Created: {note.created_at}", style="cyan")
+                console.print(f"📅 Created: {note.created_display}", style="cyan")
                 if note.updated_at:
-                    console.print(f"📅 Updated: {note.updated_at}", style="cyan")
+                    console.print(f"📅 Updated: {note.updated_display}", style="cyan")
                 console.rule()
                 console.print(note.content)
                 console.rule()
@@ -296,14 +309,11 @@ class NotesAssistantApp:
     
     def update_note(self):
         """Update an existing note."""
-        notes = self.notes_service.get_user_notes(self.current_user.id)
-        if not notes:
+        console.print(Panel("📝 Update Note", style="bold blue"))
+        if not self.browse_notes():
             console.print("⚠️  You don't have any notes yet.", style="yellow")
             return
         
-        console.print(Panel("📝 Update Note", style="bold blue"))
-        self.display_notes_table_rich(notes)
-        
         try:
             note_id = int(questionary.text("Enter note ID to update:").ask())
             note = self.notes_service.get_note(note_id, self.current_user.id)
@@ -343,14 +353,11 @@ class NotesAssistantApp:
     
     def delete_note(self):
         """Delete a note."""
-        notes = self.notes_service.get_user_notes(self.current_user.id)
-        if not notes:
+        console.print(Panel("❌ Delete Note", style="bold red"))
+        if not self.browse_notes():
             console.print("⚠️  You don't have any notes yet.", style="yellow")
             return
         
-        console.print(Panel("❌ Delete Note", style="bold red"))
-        self.display_notes_table_rich(notes)
-        
         try:
             note_id = int(questionary.text("Enter note ID to delete:").ask())
             note = self.notes_service.get_note(note_id, self.current_user.id)
@@ -390,8 +397,8 @@ class NotesAssistantApp:
         """List all user notes."""
         console.print(Panel("📋 All Notes", style="bold blue"))
         
-        notes = self.notes_service.get_user_notes(self.current_user.id)
-        self.display_notes_table_rich(notes, show_content=True)
+        if not self.browse_notes(show_content=True):
+            console.print("⚠️  No notes found.", style="yellow")
         
         input("\nPress Enter to continue...")
     
@@ -403,24 +410,28 @@ class NotesAssistantApp:
         console.print(f"📝 Total notes: {summary['total_notes']}", style="cyan")
         
         if summary['newest_note']:
-            console.print(f"📅 Newest note: '{summary['newest_note'].title}' ({summary['newest_note'].created_at})", style="cyan")
+            console.print(f"📅 Newest note: '{summary['newest_note'].title}' ({summary['newest_note'].created_display})", style="cyan")
         
         if summary['oldest_note']:
-            console.print(f"📅 Oldest note: '{summary['oldest_note'].title}' ({summary['oldest_note'].created_at})", style="cyan")
+            console.print(f"📅 Oldest note: '{summary['oldest_note'].title}' ({summary['oldest_note'].created_display})", style="cyan")
         
         input("\nPress Enter to continue...")
 
 
-def main(): # This function is called from the run.py file ("from main import main"), to start the application.
+def main(data_dir: Optional[str] = None, pacing: Optional[str] = None): # This function is called from the run.py file ("from main import main"), to start the application.
     """Entry point of the application."""
+    app = None
     try:
-        app = NotesAssistantApp() # Create an instance of the NotesAssistantApp class.
+        app = NotesAssistantApp(data_dir, pacing) # Create an instance of the NotesAssistantApp class.
         app.run() # Run the application, by calling the run() method of the NotesAssistantApp class.
     except KeyboardInterrupt:
         console.print("\n\nApplication terminated by user.", style="yellow") # Print a message to the console, when the user presses Ctrl+C.
     except Exception as e:
         console.print(f"\n❌ Fatal error: {str(e)}", style="red") # Print a message to the console, when an error occurs.
         console.print("Please check your installation and try again.", style="yellow")
+    finally:
+        if app:
+            app.data_service.close() # Give back unused IDs and stop background work.
 
 
 if __name__ == "__main__":
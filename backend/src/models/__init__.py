@@ -4,9 +4,11 @@ Models package for Notes Assistant.
 Contains data models for the application:
 - User: User model with validation
 - Note: Note model with CRUD operations
+- FrozenUser, FrozenNote: immutable variants for read-only working sets
+- LazyNote: note whose content is loaded on first access
 """
 
-from .user import User
-from .note import Note
+from .user import User, FrozenUser
+from .note import Note, FrozenNote, LazyNote
 
-__all__ = ['User', 'Note'] 
\ No newline at end of file
+__all__ = ['User', 'Note', 'FrozenUser', 'FrozenNote', 'LazyNote'] 
\ No newline at end of file
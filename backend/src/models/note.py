@@ -1,50 +1,121 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
+from .slots import slotted
+from .validation import content_problem, title_problem
 
+
+# Timestamps are stored as integer seconds since the epoch, so they sort and
+# compare as plain ints. This is the format they are shown in (and the format
+# older data files stored them in).
+DISPLAY_FORMAT = '%d/%m/%y %H:%M:%S'
+
+
+def now_timestamp() -> int:
+    """Current time as an epoch timestamp."""
+    return int(datetime.now().timestamp())
+
+
+def to_timestamp(value: Union[int, float, str, None]) -> Optional[int]:
+    """Convert a stored time value to an epoch timestamp.
+    
+    Accepts epoch numbers, ISO-8601 strings and the legacy
+    'DD/MM/YY HH:MM:SS' strings written by older versions. Anything else,
+    and numbers outside the range datetime can show, raise ValueError.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        timestamp = value
+    elif not isinstance(value, str):
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    elif value.isdigit():
+        timestamp = int(value)  # epoch seconds read back from text (e.g. CSV)
+    else:
+        try:
+            return int(datetime.strptime(value, DISPLAY_FORMAT).timestamp())
+        except ValueError:
+            pass
+        try:
+            return int(datetime.fromisoformat(value).timestamp())
+        except ValueError:
+            raise ValueError(f"Invalid timestamp: {value}")
+    # Stored timestamps must stay displayable (format_timestamp)
+    try:
+        datetime.fromtimestamp(timestamp)
+    except (OverflowError, OSError, ValueError):
+        raise ValueError(f"Timestamp out of range: {value}")
+    return int(timestamp)
+
+
+def format_timestamp(timestamp: Optional[int]) -> Optional[str]:
+    """Format an epoch timestamp for display (local time)."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).strftime(DISPLAY_FORMAT)
+
+
+@slotted
 @dataclass
 class Note:
-    """Note model for the notes application."""
+    """Note model for the notes application.
+    
+    Slotted (no per-instance __dict__): a large working set of notes costs
+    far less memory. FrozenNote is the read-only variant.
+    """
     id: int
     title: str
     content: str
-    created_at: str
-    updated_at: Optional[str] = None
+    created_at: int                  # epoch seconds
+    updated_at: Optional[int] = None # epoch seconds
     user_id: Optional[int] = None
     
     def __post_init__(self):
         """Validate note data after initialization."""
         self.validate_title()
         self.validate_content()
+        # Accept legacy string timestamps and normalize them
+        self.created_at = to_timestamp(self.created_at)
+        self.updated_at = to_timestamp(self.updated_at)
+    
+    @property
+    def created_display(self) -> str:
+        """Creation time formatted for display."""
+        return format_timestamp(self.created_at)
+    
+    @property
+    def updated_display(self) -> Optional[str]:
+        """Last update time formatted for display (None if never updated)."""
+        return format_timestamp(self.updated_at)
     
     def validate_title(self):
         """Validate that title is not empty and not too long."""
-        if not self.title or not self.title.strip():
-            raise ValueError("Title cannot be empty")
-        if len(self.title) > 100:
-            raise ValueError("Title cannot exceed 100 characters")
+        problem = title_problem(self.title)
+        if problem:
+            raise ValueError(problem)
     
     def validate_content(self):
         """Validate that content is not empty."""
-        if not self.content or not self.content.strip():
-            raise ValueError("Content cannot be empty")
+        problem = content_problem(self.content)
+        if problem:
+            raise ValueError(problem)
     
     def update_content(self, new_content: str):
         """Update note content and timestamp."""
-        if not new_content or not new_content.strip():
-            raise ValueError("Content cannot be empty")
+        problem = content_problem(new_content)
+        if problem:
+            raise ValueError(problem)
         self.content = new_content
-        self.updated_at = datetime.now().strftime('%d/%m/%y %H:%M:%S')
+        self.updated_at = now_timestamp()
     
     def update_title(self, new_title: str):
         """Update note title and timestamp."""
-        if not new_title or not new_title.strip():
-            raise ValueError("Title cannot be empty")
-        if len(new_title) > 100:
-            raise ValueError("Title cannot exceed 100 characters")
+        problem = title_problem(new_title)
+        if problem:
+            raise ValueError(problem)
         self.title = new_title
-        self.updated_at = datetime.now().strftime('%d/%m/%y %H:%M:%S')
+        self.updated_at = now_timestamp()
     
     def to_dict(self) -> dict:
         """Convert note object to dictionary."""
@@ -60,7 +131,31 @@ class Note:
     @classmethod
     def from_dict(cls, data: dict) -> 'Note':
         """Create note object from dictionary."""
-        return cls(**data)
+        # Positional: cheaper than unpacking **data on this hot path
+        return cls(data['id'], data['title'], data['content'], data['created_at'],
+                   data.get('updated_at'), data.get('user_id'))
+    
+    @classmethod
+    def from_storage(cls, data: dict) -> 'Note':
+        """Create a note from a stored record without validating it again.
+        
+        Trusted path for records the app wrote itself: they were validated
+        on the way in and their timestamps are already epoch seconds.
+        Anything user-supplied goes through Note(...) or from_dict.
+        """
+        note = cls.__new__(cls)
+        note.id = data['id']
+        note.title = data['title']
+        note.content = data['content']
+        note.created_at = data['created_at']
+        note.updated_at = data.get('updated_at')
+        note.user_id = data.get('user_id')
+        return note
+    
+    def freeze(self) -> 'FrozenNote':
+        """Read-only copy of this note."""
+        return FrozenNote(self.id, self.title, self.content, self.created_at,
+                          self.updated_at, self.user_id)
     
     def get_summary(self, max_length: int = 50) -> str:
         """Get a summary of the note content."""
@@ -70,4 +165,121 @@ class Note:
     
     def __str__(self) -> str:
         """String representation of the note."""
-        return f"Note {self.id}: {self.title}" 
\ No newline at end of file
+        return f"Note {self.id}: {self.title}" 
+
+
+@slotted
+@dataclass(frozen=True)
+class FrozenNote:
+    """Immutable, hashable note, e.g. for results shared between callers.
+    
+    Built from notes or records that are already valid, so it does not
+    validate again. thaw() gives back an editable Note.
+    """
+    id: int
+    title: str
+    content: str
+    created_at: int                  # epoch seconds
+    updated_at: Optional[int] = None # epoch seconds
+    user_id: Optional[int] = None
+    
+    # Same read-only behaviour as Note
+    created_display = Note.created_display
+    updated_display = Note.updated_display
+    to_dict = Note.to_dict
+    get_summary = Note.get_summary
+    __str__ = Note.__str__
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FrozenNote':
+        """Create a frozen note from a stored note record."""
+        return cls(data['id'], data['title'], data['content'], data['created_at'],
+                   data.get('updated_at'), data.get('user_id'))
+    
+    def thaw(self) -> Note:
+        """Editable copy of this note."""
+        return Note(self.id, self.title, self.content, self.created_at,
+                    self.updated_at, self.user_id)
+
+
+# Characters of content kept next to a lazily loaded note's metadata, enough
+# for the summaries shown in listings
+PREVIEW_LENGTH = 100
+
+# Note's storage for content, which LazyNote.content wraps
+_CONTENT_SLOT = Note.__dict__['content']
+
+
+class LazyNote(Note):
+    """Note whose content is loaded from a content store on first access.
+    
+    Listings only need titles, timestamps and short summaries, so the
+    bodies stay on disk until something reads note.content (e.g. opening
+    the note). Setting content replaces the stored body.
+    """
+    __slots__ = ('_content_source', '_content_ref', '_preview')
+    
+    @property
+    def content(self) -> str:
+        """Note content, read from the content store the first time."""
+        try:
+            return _CONTENT_SLOT.__get__(self, LazyNote)
+        except AttributeError:
+            content = self._content_source.read(self._content_ref)
+            _CONTENT_SLOT.__set__(self, content)
+            return content
+    
+    @content.setter
+    def content(self, value: str):
+        _CONTENT_SLOT.__set__(self, value)
+        self._content_ref = None  # no longer the stored body
+        self._preview = value[:PREVIEW_LENGTH + 1]
+    
+    @property
+    def content_loaded(self) -> bool:
+        """Whether the body has been read (or set) yet."""
+        try:
+            _CONTENT_SLOT.__get__(self, LazyNote)
+        except AttributeError:
+            return False
+        return True
+    
+    @property
+    def content_ref(self):
+        """Reference of the stored body, None if content was changed since loading."""
+        return self._content_ref
+    
+    @property
+    def preview(self) -> Optional[str]:
+        """The stored start of the content (PREVIEW_LENGTH characters and one more)."""
+        return self._preview
+    
+    @classmethod
+    def from_storage(cls, data: dict, source=None) -> 'Note':
+        """Create a note from a stored metadata record.
+        
+        Records with a 'content_ref' get their body from source (a
+        ContentStore) when first needed; records with inline content
+        are plain notes.
+        """
+        if 'content_ref' not in data:
+            return Note.from_storage(data)
+        note = cls.__new__(cls)
+        note.id = data['id']
+        note.title = data['title']
+        note.created_at = data['created_at']
+        note.updated_at = data.get('updated_at')
+        note.user_id = data.get('user_id')
+        note._content_source = source
+        note._content_ref = data['content_ref']
+        note._preview = data.get('preview')
+        return note
+    
+    def get_summary(self, max_length: int = 50) -> str:
+        """Get a summary of the note content, from the preview if it is enough."""
+        preview = self._preview
+        if preview is None or max_length > PREVIEW_LENGTH or self.content_loaded:
+            return super().get_summary(max_length)
+        if len(preview) <= max_length:
+            return preview
+        return preview[:max_length] + "..."
\ No newline at end of file
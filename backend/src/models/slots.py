@@ -0,0 +1,39 @@
+import dataclasses
+
+
+def slotted(cls):
+    """Rebuild a dataclass with __slots__ instead of a per-instance __dict__.
+
+    Same as @dataclass(slots=True), which needs Python 3.10. Apply it on
+    top of @dataclass:
+
+        @slotted
+        @dataclass
+        class Point:
+            x: int
+            y: int = 0
+    """
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = field_names
+    # Class-level defaults would clash with the slots; __init__ already has them
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+
+    if cls.__dataclass_params__.frozen:
+        # Frozen classes block __setattr__, which default slot unpickling uses
+        def __getstate__(self):
+            return [getattr(self, name) for name in field_names]
+
+        def __setstate__(self, state):
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+
+        namespace['__getstate__'] = __getstate__
+        namespace['__setstate__'] = __setstate__
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 from typing import Optional
-import re
 
+from .slots import slotted
+from .validation import birthday_problem, color_problem, name_problem
 
+
+@slotted
 @dataclass
 class User:
-    """User model for the notes application."""
+    """User model for the notes application (slotted; FrozenUser is read-only)."""
     id: int
     name: str
     surname: str
@@ -22,27 +25,21 @@ class User:
     
     def validate_name(self):
         """Validate that name and surname contain only letters."""
-        if not self.name.replace(' ', '').isalpha():
-            raise ValueError("Name must contain only letters")
-        if not self.surname.replace(' ', '').isalpha():
-            raise ValueError("Surname must contain only letters")
+        problem = name_problem(self.name) or name_problem(self.surname, "Surname")
+        if problem:
+            raise ValueError(problem)
     
     def validate_birthday(self):
         """Validate birthday format (DD-MM-YYYY or DD/MM/YYYY)."""
-        pattern1 = re.compile(r'^\d{2}-\d{2}-\d{4}$')
-        pattern2 = re.compile(r'^\d{2}/\d{2}/\d{4}$')
-        if not (pattern1.match(self.birthday) or pattern2.match(self.birthday)):
-            raise ValueError("Birthday must be in DD-MM-YYYY or DD/MM/YYYY format")
+        problem = birthday_problem(self.birthday)
+        if problem:
+            raise ValueError(problem)
     
     def validate_color(self):
-        """Validate that color is a valid CSS color name."""
-        # Basic color validation - can be extended
-        valid_colors = [
-            'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink', 
-            'brown', 'black', 'white', 'gray', 'grey', 'cyan', 'magenta'
-        ]
-        if self.favorite_color.lower() not in valid_colors:
-            raise ValueError(f"Color must be one of: {', '.join(valid_colors)}")
+        """Validate that color is one of the accepted colors (models.validation.VALID_COLORS)."""
+        problem = color_problem(self.favorite_color)
+        if problem:
+            raise ValueError(problem)
     
     def to_dict(self) -> dict:
         """Convert user object to dictionary."""
@@ -57,4 +54,48 @@ class User:
     @classmethod
     def from_dict(cls, data: dict) -> 'User':
         """Create user object from dictionary."""
-        return cls(**data) 
\ No newline at end of file
+        # Positional: cheaper than unpacking **data on this hot path
+        return cls(data['id'], data['name'], data['surname'], data['birthday'],
+                   data['favorite_color'])
+    
+    @classmethod
+    def from_storage(cls, data: dict) -> 'User':
+        """Create a user from a stored record without validating it again.
+        
+        Trusted path for records the app wrote itself (validated on save);
+        user input goes through User(...) or from_dict.
+        """
+        user = cls.__new__(cls)
+        user.id = data['id']
+        user.name = data['name']
+        user.surname = data['surname']
+        user.birthday = data['birthday']
+        user.favorite_color = data['favorite_color']
+        return user
+    
+    def freeze(self) -> 'FrozenUser':
+        """Read-only copy of this user."""
+        return FrozenUser(self.id, self.name, self.surname, self.birthday, self.favorite_color)
+
+
+@slotted
+@dataclass(frozen=True)
+class FrozenUser:
+    """Immutable, hashable user, built from already valid data (no validation)."""
+    id: int
+    name: str
+    surname: str
+    birthday: str       # DD-MM-YYYY format
+    favorite_color: str
+    
+    to_dict = User.to_dict
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'FrozenUser':
+        """Create a frozen user from a stored user record."""
+        return cls(data['id'], data['name'], data['surname'], data['birthday'],
+                   data['favorite_color'])
+    
+    def thaw(self) -> User:
+        """Editable copy of this user."""
+        return User(self.id, self.name, self.surname, self.birthday, self.favorite_color) 
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Validation rules shared by the models, the input prompts and bulk import.
+
+Each *_problem function returns the error message for an invalid value, or
+None if the value is fine: the models raise it as a ValueError, the UI
+prompts only need the yes/no answer, and validate_many collects them.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Accepted favorite colors, in the order they are offered to the user
+VALID_COLORS = (
+    'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink',
+    'brown', 'black', 'white', 'gray', 'grey', 'cyan', 'magenta'
+)
+COLOR_SET = frozenset(VALID_COLORS)
+
+# DD-MM-YYYY or DD/MM/YYYY (one separator style, not mixed)
+BIRTHDAY_PATTERN = re.compile(r'^(?:\d{2}-\d{2}-\d{4}|\d{2}/\d{2}/\d{4})$')
+
+TITLE_MAX_LENGTH = 100
+
+
+# User fields
+def name_problem(name: str, field: str = "Name") -> Optional[str]:
+    """Letters and spaces only."""
+    if not name or not name.replace(' ', '').isalpha():
+        return f"{field} must contain only letters"
+    return None
+
+
+def birthday_problem(birthday: str) -> Optional[str]:
+    """DD-MM-YYYY or DD/MM/YYYY."""
+    if not birthday or not BIRTHDAY_PATTERN.match(birthday):
+        return "Birthday must be in DD-MM-YYYY or DD/MM/YYYY format"
+    return None
+
+
+def color_problem(color: str) -> Optional[str]:
+    """One of VALID_COLORS, in any case."""
+    if not color or color.lower() not in COLOR_SET:
+        return f"Color must be one of: {', '.join(VALID_COLORS)}"
+    return None
+
+
+# Note fields
+def title_problem(title: str) -> Optional[str]:
+    """Not blank, at most TITLE_MAX_LENGTH characters."""
+    if not title or not title.strip():
+        return "Title cannot be empty"
+    if len(title) > TITLE_MAX_LENGTH:
+        return f"Title cannot exceed {TITLE_MAX_LENGTH} characters"
+    return None
+
+
+def content_problem(content: str) -> Optional[str]:
+    """Not blank."""
+    if not content or not content.strip():
+        return "Content cannot be empty"
+    return None
+
+
+# Whole records
+def user_problem(record: dict) -> Optional[str]:
+    """First problem with a user record, in the order User checks them."""
+    return (name_problem(record.get('name'))
+            or name_problem(record.get('surname'), "Surname")
+            or birthday_problem(record.get('birthday'))
+            or color_problem(record.get('favorite_color')))
+
+
+def note_problem(record: dict) -> Optional[str]:
+    """First problem with a note record, in the order Note checks them."""
+    return title_problem(record.get('title')) or content_problem(record.get('content'))
+
+
+# Field rules of each record kind, in the order the models check them
+FIELD_RULES: Dict[str, Tuple[Tuple[str, Callable[[Optional[str]], Optional[str]]], ...]] = {
+    'user': (
+        ('name', name_problem),
+        ('surname', lambda surname: name_problem(surname, "Surname")),
+        ('birthday', birthday_problem),
+        ('favorite_color', color_problem),
+    ),
+    'note': (
+        ('title', title_problem),
+        ('content', content_problem),
+    ),
+}
+
+
+def validate_many(records: Sequence[dict], kind: str = 'note') -> List[Tuple[int, str]]:
+    """Check many user or note records, one field at a time.
+
+    Each rule is looked up once and run over the whole column of values;
+    a record keeps the problem of the first rule it fails, as user_problem
+    and note_problem would report. Returns (index, message) for every
+    invalid record, by index; an empty list means all of them are valid, so
+    they can be hydrated without validating again (e.g. with Note.from_storage).
+    """
+    problems: Dict[int, str] = {}
+    for field, rule in FIELD_RULES[kind]:
+        for index, problem in enumerate(map(rule, [record.get(field) for record in records])):
+            if problem and index not in problems:
+                problems[index] = problem
+    return sorted(problems.items())
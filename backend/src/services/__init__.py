@@ -3,12 +3,22 @@ Services package for Notes Assistant.
 
 Contains business logic services:
 - DataService: Handles data persistence with JSON files
+- JournalStore: Append-only journal storage engine for notes
+- SQLiteDataService: DataService alternative backed by sqlite3
 - UserService: Manages user operations
 - NotesService: Manages notes operations
+- AsyncDataService / AsyncNotesService: Awaitable (asyncio) versions
 """
 
+from .journal_store import JournalStore
 from .data_service import DataService
+from .sqlite_data_service import SQLiteDataService
 from .user_service import UserService
 from .notes_service import NotesService
+from .async_data_service import AsyncDataService
+from .async_notes_service import AsyncNotesService
 
-__all__ = ['DataService', 'UserService', 'NotesService'] 
\ No newline at end of file
+__all__ = [
+    'DataService', 'JournalStore', 'SQLiteDataService',
+    'UserService', 'NotesService', 'AsyncDataService', 'AsyncNotesService'
+] 
\ No newline at end of file
@@ -0,0 +1,228 @@
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from models.note import Note
+from models.user import User
+from services.data_service import DataService
+
+
+class AsyncDataService:
+     # Awaitable mirror of DataService for asyncio servers and UIs
+     # Blocking file I/O runs on a small thread pool, never on the event loop
+    """Asyncio front end for a DataService.
+
+    - Every call runs on a bounded thread pool. Calls run in parallel:
+      DataService and SearchIndex are thread-safe themselves, so reads are
+      never held up behind writes or other reads.
+    - Writes to the same file that arrive while a write to it is queued
+      or in progress are coalesced: the next batch is applied inside one
+      DataService.group_commit(), i.e. one write (and fsync) per file.
+    - Reads of the same file that arrive while one is queued are run
+      together inside one DataService.shared_loads(), i.e. the file is
+      parsed once for the whole batch, whatever each read asks for.
+      Identical reads in a batch run once and their callers get the same
+      objects, so treat read results as read-only, or copy them first.
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+    ITER_CHUNK_SIZE = 100
+
+    def __init__(self, data_service: DataService, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.data_service = data_service
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="notes-io")
+        self._read_queues = {}      # file -> {(method name, args): future}
+        self._read_flushers = {}    # file -> task running that file's queued reads
+        self._write_queues = {}     # file -> [(func, args, future)]
+        self._write_flushers = {}   # file -> task writing that file's queue
+
+    @property
+    def data_dir(self) -> str:
+        return self.data_service.data_dir
+
+    # Executor plumbing
+    async def run(self, func: Callable, *args):
+        """Run a blocking function on the I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _read(self, file_path: str, method_name: str, *args):
+        """Queue a read of file_path; queued reads share one load of the file."""
+        queue = self._read_queues.setdefault(file_path, {})
+        key = (method_name, args)
+        future = queue.get(key)
+        if future is None:
+            future = queue[key] = asyncio.get_running_loop().create_future()
+        if file_path not in self._read_flushers:
+            self._read_flushers[file_path] = asyncio.ensure_future(self._flush_reads(file_path))
+        # shield: one caller being cancelled must not cancel the others' read
+        return await asyncio.shield(future)
+
+    async def _flush_reads(self, file_path: str):
+        try:
+            # Let readers scheduled in the same loop iteration join the batch
+            await asyncio.sleep(0)
+            while self._read_queues.get(file_path):
+                batch = self._read_queues.pop(file_path)
+                try:
+                    results = await self.run(self._apply_reads, list(batch))
+                except Exception as e:
+                    results = [(False, e)] * len(batch)
+                for future, (ok, value) in zip(batch.values(), results):
+                    if future.done():
+                        continue
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+        finally:
+            del self._read_flushers[file_path]
+
+    def _apply_reads(self, batch: list) -> list:
+        """Run a batch of reads with one load per file (runs on the pool)."""
+        results = []
+        with self.data_service.shared_loads():
+            for method_name, args in batch:
+                try:
+                    results.append((True, getattr(self.data_service, method_name)(*args)))
+                except Exception as e:
+                    results.append((False, e))
+        return results
+
+    async def _write(self, file_path: str, method_name: str, *args):
+        """Queue a write to file_path; queued writes are committed together."""
+        future = asyncio.get_running_loop().create_future()
+        self._write_queues.setdefault(file_path, []).append(
+            (getattr(self.data_service, method_name), args, future)
+        )
+        if file_path not in self._write_flushers:
+            self._write_flushers[file_path] = asyncio.ensure_future(self._flush_writes(file_path))
+        return await future
+
+    async def _flush_writes(self, file_path: str):
+        try:
+            # Let writers scheduled in the same loop iteration join the batch
+            await asyncio.sleep(0)
+            while self._write_queues.get(file_path):
+                batch = self._write_queues.pop(file_path)
+                try:
+                    results = await self.run(self._apply_writes, batch)
+                except Exception as e:
+                    results = [(False, e)] * len(batch)
+                for (_func, _args, future), (ok, value) in zip(batch, results):
+                    if future.done():
+                        continue  # caller was cancelled
+                    if ok:
+                        future.set_result(value)
+                    else:
+                        future.set_exception(value)
+        finally:
+            del self._write_flushers[file_path]
+
+    def _apply_writes(self, batch: list) -> list:
+        """Apply a batch of writes with one group commit (runs on the pool)."""
+        results = []
+        try:
+            with self.data_service.group_commit():
+                for func, args, _future in batch:
+                    try:
+                        results.append((True, func(*args)))
+                    except Exception as e:
+                        results.append((False, e))
+        except Exception as e:
+            # The combined write itself failed, so none of the batch is saved
+            return [(False, e)] * len(batch)
+        return results
+
+    async def flush(self):
+        """Wait until every queued write has been committed."""
+        while self._write_flushers:
+            await asyncio.gather(*self._write_flushers.values(), return_exceptions=True)
+
+    async def close(self):
+        """Commit queued writes, finish queued reads, close the DataService and stop the pool."""
+        await self.flush()
+        while self._read_flushers:
+            await asyncio.gather(*self._read_flushers.values(), return_exceptions=True)
+        await self.run(self.data_service.close)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncDataService':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def clear_cache(self):
+        await self.run(self.data_service.clear_cache)
+
+    # ID allocation
+    async def get_next_user_id(self) -> int:
+        return await self.run(self.data_service.get_next_user_id)
+
+    async def get_next_note_id(self) -> int:
+        return await self.run(self.data_service.get_next_note_id)
+
+    async def reserve_note_ids(self, count: int) -> range:
+        return await self.run(self.data_service.reserve_note_ids, count)
+
+    # User operations
+    async def save_user(self, user: User) -> User:
+        return await self._write(self.data_service.users_file, 'save_user', user)
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        return await self._read(self.data_service.users_file, 'get_user_by_id', user_id)
+
+    async def get_user_by_name(self, name: str) -> Optional[User]:
+        return await self._read(self.data_service.users_file, 'get_user_by_name', name)
+
+    async def get_all_users(self) -> List[User]:
+        return await self._read(self.data_service.users_file, 'get_all_users')
+
+    async def delete_user(self, user_id: int) -> bool:
+        return await self._write(self.data_service.users_file, 'delete_user', user_id)
+
+    # Note operations
+    async def save_note(self, note: Note) -> Note:
+        return await self._write(self.data_service.notes_file, 'save_note', note)
+
+    async def save_notes(self, notes: List[Note]) -> List[Note]:
+        return await self._write(self.data_service.notes_file, 'save_notes', notes)
+
+    async def get_note_by_id(self, note_id: int, user_id: Optional[int] = None) -> Optional[Note]:
+        return await self._read(self.data_service.notes_file, 'get_note_by_id', note_id, user_id)
+
+    async def get_notes_by_user(self, user_id: int) -> List[Note]:
+        return await self._read(self.data_service.notes_file, 'get_notes_by_user', user_id)
+
+    async def iter_notes_by_user(self, user_id: int, newest_first: bool = True) -> AsyncIterator[Note]:
+        """Yield a user's notes, fetching them from the pool in small chunks."""
+        notes = self.data_service.iter_notes_by_user(user_id, newest_first)
+
+        def next_chunk():
+            return list(itertools.islice(notes, self.ITER_CHUNK_SIZE))
+
+        while True:
+            chunk = await self.run(next_chunk)
+            for note in chunk:
+                yield note
+            if len(chunk) < self.ITER_CHUNK_SIZE:
+                return
+
+    async def get_notes_by_user_between(self, user_id: int, start: Optional[int] = None,
+                                        end: Optional[int] = None) -> List[Note]:
+        return await self._read(self.data_service.notes_file, 'get_notes_by_user_between', user_id, start, end)
+
+    async def get_notes_page(self, user_id: int, limit: int,
+                             after: Optional[Tuple[int, int]] = None) -> List[Note]:
+        return await self._read(self.data_service.notes_file, 'get_notes_page', user_id, limit, after)
+
+    async def get_all_notes(self) -> List[Note]:
+        return await self._read(self.data_service.notes_file, 'get_all_notes')
+
+    async def delete_note(self, note_id: int) -> bool:
+        return await self._write(self.data_service.notes_file, 'delete_note', note_id)
+
+    async def delete_notes_by_user(self, user_id: int) -> int:
+        return await self._write(self.data_service.notes_file, 'delete_notes_by_user', user_id)
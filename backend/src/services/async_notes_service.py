@@ -0,0 +1,115 @@
+from typing import IO, Iterable, List, Optional, Union
+
+from models.note import Note, now_timestamp
+from services.async_data_service import AsyncDataService
+from services.notes_service import NotesService
+from services.search_index import SearchIndex
+
+
+class AsyncNotesService:
+     # Awaitable mirror of NotesService on top of AsyncDataService
+     # Single-note writes go through the coalescing write queue
+    """Asyncio counterpart of NotesService."""
+
+    def __init__(self, data: AsyncDataService, search_index: Optional[SearchIndex] = None):
+        self.data = data
+        # Multi-step operations (search, bulk import, export) reuse the sync
+        # service, run on the I/O pool as a single call
+        self._sync = NotesService(data.data_service, search_index)
+        self.search_index = self._sync.search_index
+
+    # Note creation method - creates a new note
+    async def create_note(self, title: str, content: str, user_id: int) -> Note:
+        """Create a new note."""
+        note = Note(
+            id=await self.data.get_next_note_id(),
+            title=title.strip(),
+            content=content.strip(),
+            created_at=now_timestamp(),
+            user_id=user_id
+        )
+
+        note = await self.data.save_note(note)
+        await self.data.run(self.search_index.add_note, note)
+        return note
+
+    async def bulk_create_notes(self, rows: Iterable[Union[dict, Exception]],
+                                user_id: Optional[int] = None, strict: bool = False) -> dict:
+        """Create many notes at once (see NotesService.bulk_create_notes)."""
+        return await self.data.run(self._sync.bulk_create_notes, rows, user_id, strict)
+
+    # Note retrieval methods
+    async def get_note(self, note_id: int, user_id: int) -> Optional[Note]:
+        """Get a note by ID, ensuring it belongs to the user."""
+        note = await self.data.get_note_by_id(note_id, user_id)
+        if note and note.user_id == user_id:
+            return note
+        return None
+
+    async def get_user_notes(self, user_id: int) -> List[Note]:
+        """Get all notes for a user."""
+        return await self.data.get_notes_by_user(user_id)
+
+    async def list_notes(self, user_id: int, limit: int = NotesService.DEFAULT_PAGE_SIZE,
+                         after_cursor: Optional[str] = None) -> dict:
+        """Get one page of a user's notes, newest first (see NotesService.list_notes)."""
+        if limit < 1:
+            raise ValueError("Page size must be at least 1")
+        after = NotesService.parse_cursor(after_cursor) if after_cursor else None
+        notes = await self.data.get_notes_page(user_id, limit + 1, after)
+        next_cursor = NotesService.note_cursor(notes[limit - 1]) if len(notes) > limit else None
+        return {'notes': notes[:limit], 'next_cursor': next_cursor}
+
+    async def get_notes_between(self, user_id: int, start: Optional[int] = None,
+                                end: Optional[int] = None) -> List[Note]:
+        """Get a user's notes created in [start, end] (epoch seconds), newest first."""
+        return await self.data.get_notes_by_user_between(user_id, start, end)
+
+    # Note update methods
+    async def _update_note(self, note_id: int, user_id: int, change) -> Optional[Note]:
+        # Load a private copy: batched read results are shared
+        note = await self.data.run(self.data.data_service.get_note_by_id, note_id, user_id)
+        if not note or note.user_id != user_id:
+            return None
+        change(note)
+        note = await self.data.save_note(note)
+        await self.data.run(self.search_index.add_note, note)
+        return note
+
+    async def update_note_title(self, note_id: int, new_title: str, user_id: int) -> Optional[Note]:
+        """Update a note's title."""
+        return await self._update_note(note_id, user_id, lambda note: note.update_title(new_title.strip()))
+
+    async def update_note_content(self, note_id: int, new_content: str, user_id: int) -> Optional[Note]:
+        """Update a note's content."""
+        return await self._update_note(note_id, user_id, lambda note: note.update_content(new_content.strip()))
+
+    # Note deletion method - deletes a note (with ownership check)
+    async def delete_note(self, note_id: int, user_id: int) -> bool:
+        """Delete a note, ensuring it belongs to the user."""
+        note = await self.get_note(note_id, user_id)
+        if note and await self.data.delete_note(note_id):
+            await self.data.run(self.search_index.remove_note, user_id, note_id)
+            return True
+        return False
+
+    async def search_notes(self, query: str, user_id: int) -> List[Note]:
+        """Search notes by title or content, best match first."""
+        if not query or not query.strip():
+            return await self.get_user_notes(user_id)
+        return await self.data.run(self._sync.search_notes, query, user_id)
+
+    async def export_notes(self, user_id: int, fmt: str, sink: IO[str]) -> int:
+        """Export a user's notes as jsonl, csv or markdown. Returns the number exported."""
+        return await self.data.run(self._sync.export_notes, user_id, fmt, sink)
+
+    async def get_notes_summary(self, user_id: int) -> dict:
+        """Get a summary of user's notes."""
+        notes = await self.get_user_notes(user_id)
+
+        return {
+            'total_notes': len(notes),
+            'recent_notes': notes[:5],  # First 5 (most recent)
+            'oldest_note': notes[-1] if notes else None,
+            'newest_note': notes[0] if notes else None
+        }
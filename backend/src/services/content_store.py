@@ -0,0 +1,177 @@
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.file_io import fsync_directory
+
+
+HEADER = "notes-content {:08d}\n"  # the file's generation
+HEADER_SIZE = len(HEADER.format(0))
+
+
+class ContentStore:
+     # Append-only file of note bodies (notes.content)
+     # Note records keep only metadata plus a reference into it
+    """Append-only store of note contents, so note listings never load them.
+
+    A reference is [offset, length, generation]. The generation is in the
+    file's header and goes up with every compact(), which writes a new
+    file; references into an older generation keep working in the process
+    that compacted, through the old file handle, until the store is closed.
+
+    Writers must be serialized (DataService holds data.lock around writes).
+    Updating or deleting a note leaves its old body behind as garbage until
+    compact() rewrites the file with the live bodies only. The file it
+    replaces is kept as notes.content.previous until drop_previous(), so
+    records still pointing into it (e.g. after a crash before they were
+    rewritten) stay readable.
+    """
+
+    def __init__(self, file_path: str, durable: bool = True, read_only: bool = False):
+        self.file_path = file_path
+        self.previous_file = file_path + ".previous"
+        # durable: fsync after each append, or once per sync() when deferred
+        self.durable = durable
+        # read_only: only read() works, and the file is never opened for writing
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._unsynced = False
+        self._writer = None
+        self._readers: Dict[int, object] = {}  # generation -> open file
+        self._open()
+
+    def _open(self):
+        """Open the current content file for appending and reading (caller holds _lock)."""
+        if self._writer:
+            self._writer.close()
+        if self.read_only:
+            reader = open(self.file_path, 'rb')
+            self._inode = os.fstat(reader.fileno()).st_ino
+        else:
+            self._writer = open(self.file_path, 'ab')
+            if not os.fstat(self._writer.fileno()).st_size:
+                self._writer.write(HEADER.format(1).encode('ascii'))
+                self._writer.flush()
+            self._inode = os.fstat(self._writer.fileno()).st_ino
+            reader = open(self.file_path, 'rb')
+        self.generation = int(reader.read(HEADER_SIZE).split()[1])
+        stale = self._readers.pop(self.generation, None)
+        if stale:
+            stale.close()
+        self._readers[self.generation] = reader
+
+    def _current_inode(self) -> Optional[int]:
+        try:
+            return os.stat(self.file_path).st_ino
+        except FileNotFoundError:
+            return None
+
+    def reopen(self):
+        """Follow a compaction done by another process, if there was one."""
+        with self._lock:
+            if self._current_inode() != self._inode:
+                self._open()
+
+    def append(self, content: str, defer_sync: bool = False) -> List[int]:
+        """Store a note body. Returns its reference."""
+        if self.read_only:
+            raise ValueError(f"{self.file_path} was opened read-only")
+        data = content.encode('utf-8')
+        with self._lock:
+            if self._current_inode() != self._inode:
+                self._open()  # compacted by another process
+            offset = os.fstat(self._writer.fileno()).st_size
+            self._writer.write(data)
+            self._writer.flush()
+            if self.durable:
+                if defer_sync:
+                    self._unsynced = True
+                else:
+                    os.fsync(self._writer.fileno())
+        return [offset, len(data), self.generation]
+
+    def sync(self):
+        """fsync appends made with defer_sync (before saving records that refer to them)."""
+        with self._lock:
+            if self._unsynced:
+                os.fsync(self._writer.fileno())
+                self._unsynced = False
+
+    def read(self, ref: List[int]) -> str:
+        """Load the note body a reference points to."""
+        offset, length, generation = ref
+        data = os.pread(self._reader(generation).fileno(), length, offset)
+        if len(data) != length:
+            raise LookupError(f"Note content is missing from {self.file_path}")
+        return data.decode('utf-8')
+
+    def _reader(self, generation: int):
+        """Open file of a generation: the current file, or the one it replaced."""
+        reader = self._readers.get(generation)
+        if reader is None:
+            self.reopen()  # a reference into a file another process compacted into
+            with self._lock:
+                reader = self._readers.get(generation)
+                if reader is None and os.path.exists(self.previous_file):
+                    previous = open(self.previous_file, 'rb')
+                    if int(previous.read(HEADER_SIZE).split()[1]) == generation:
+                        reader = self._readers[generation] = previous
+                    else:
+                        previous.close()
+            if reader is None:
+                raise LookupError(f"Note content is no longer in {self.file_path}")
+        return reader
+
+    def compact(self, bodies: Iterable[Tuple[str, str]]) -> Dict[str, List[int]]:
+        """Rewrite the file with only the given (key, content) bodies.
+
+        Returns the new reference of every key; the caller must save them
+        in its records, then call drop_previous().
+        """
+        temp_file = self.file_path + ".compacting"
+        new_refs = {}
+        generation = self.generation + 1
+        with open(temp_file, 'wb') as f:
+            f.write(HEADER.format(generation).encode('ascii'))
+            offset = HEADER_SIZE
+            for key, content in bodies:
+                data = content.encode('utf-8')
+                f.write(data)
+                new_refs[key] = [offset, len(data), generation]
+                offset += len(data)
+            f.flush()
+            if self.durable:
+                os.fsync(f.fileno())
+        with self._lock:
+            if os.path.exists(self.previous_file):
+                os.remove(self.previous_file)
+            os.link(self.file_path, self.previous_file)
+            os.replace(temp_file, self.file_path)
+            if self.durable:
+                fsync_directory(os.path.dirname(os.path.abspath(self.file_path)))
+            self._unsynced = False
+            self._open()
+        return new_refs
+
+    def drop_previous(self):
+        """Delete the file compact() replaced, once no record refers to it."""
+        try:
+            os.remove(self.previous_file)
+        except FileNotFoundError:
+            pass
+
+    def size(self) -> int:
+        """Bytes in the content file, live or garbage."""
+        with self._lock:
+            return os.fstat(self._writer.fileno()).st_size
+
+    def close(self):
+        """Close the files (a later read opens them again, for notes still loading)."""
+        with self._lock:
+            if self._writer:
+                self._writer.close()
+            self._writer = None
+            self._inode = None
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
@@ -1,10 +1,38 @@
+import bisect
+import functools
 import json
 import os
-from typing import Dict, List, Optional
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 from models.user import User
-from models.note import Note
+from models.note import PREVIEW_LENGTH, LazyNote, Note
+from services.content_store import HEADER_SIZE, ContentStore
+from services.journal_store import JournalStore
+from services.file_io import atomic_write_json, file_lock, fsync_directory
+from services.id_allocator import IdAllocator
+from services.locks import ReadWriteLock
+
+
+def _reads(method):
+    """Run a DataService method under the shared (read) lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._refresh_if_changed()
+        with self._rwlock.read_locked():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _writes(method):
+    """Run a DataService method under the exclusive (write) locks."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_locked():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class DataService:
@@ -12,92 +40,904 @@ class DataService:
      # File management: users.json, notes.json, counters.json
     """Service for handling data persistence with JSON files."""
     
-    def __init__(self, data_dir: str = "data"):
+    CHANGES_LOG_LIMIT = 256 * 1024  # bytes of changes.log before it is started afresh
+    # Lazy content: compact notes.content when more than this share of it is
+    # garbage, measured after every CONTENT_CHECK_BYTES appended (and on close)
+    CONTENT_GARBAGE_RATIO = 0.5
+    CONTENT_CHECK_BYTES = 1024 * 1024
+    CONTENT_COMPACT_MIN_SIZE = 1024 * 1024  # smaller files are left alone
+    # counters.json field set once every note has epoch timestamps
+    TIMESTAMPS_MIGRATED = "timestamps_migrated"
+    
+    def __init__(self, data_dir: str = "data", cached: bool = False,
+                 storage: str = "json",
+                 compact_threshold: int = JournalStore.DEFAULT_COMPACT_THRESHOLD,
+                 background_compaction: bool = False,
+                 durable: bool = True, fsync_dir: bool = False,
+                 id_block_size: int = IdAllocator.DEFAULT_BLOCK_SIZE,
+                 recover_ids: bool = False,
+                 migrate_timestamps: bool = True,
+                 lazy_content: bool = False):
         self.data_dir = data_dir
         self.users_file = os.path.join(data_dir, "users.json")
         self.notes_file = os.path.join(data_dir, "notes.json")
+        self.notes_journal_file = os.path.join(data_dir, "notes.journal")
+        self.notes_dir = os.path.join(data_dir, "notes")
         self.counters_file = os.path.join(data_dir, "counters.json")
+        self.content_file = os.path.join(data_dir, "notes.content")
+        
+        # Cached mode keeps each parsed file in memory, keyed by path.
+        # Each entry is (file signature, data); the signature lets us notice
+        # edits made by other processes and reload only when needed.
+        self.cached = cached
+        self._cache: Dict[str, Tuple[Tuple[int, int, int], dict]] = {}
+        # Inside shared_loads(): path -> data parsed by this thread's block
+        self._shared_loads = threading.local()
+        
+        # Secondary index: case-folded name -> user key, derived from the
+        # users table it was built from and rebuilt whenever that is reloaded
+        self._name_index: Dict[str, str] = {}
+        self._name_index_source: Optional[dict] = None
+        
+        # Secondary index: user_id -> that user's (created_at, note ID) pairs in
+        # creation order, derived from the notes table the same way
+        self._user_notes_index: Dict[Optional[int], List[Tuple[int, int]]] = {}
+        self._user_notes_index_source: Optional[dict] = None
+        
+        # Durability: every save is a temp-file write + fsync + os.replace.
+        # fsync_dir also flushes the directory entry after the rename.
+        self.durable = durable
+        self.fsync_dir = fsync_dir
+        # Group commit: while active, saves are held here (path -> data) and
+        # written once, with one fsync per file, when the group ends
+        self._group_depth = 0
+        self._pending: Dict[str, dict] = {}
+        
+        # Concurrency: public methods take a readers-writer lock, so threads
+        # can read in parallel while every load -> mutate -> save runs alone.
+        # Writers also hold an fcntl lock on data.lock, which serializes them
+        # with writers in other processes (reads need no lock: files are
+        # replaced atomically). The fcntl lock is held once per process and
+        # counted, so a background compaction and a writer thread can share it.
+        self._rwlock = ReadWriteLock()
+        self.lock_file = os.path.join(data_dir, "data.lock")
+        self._process_lock_mutex = threading.Lock()
+        self._process_lock_holders = 0
+        self._process_lock = ExitStack()
+        
+        # Change notification between processes: after writing, a writer
+        # appends the names of the files it changed to changes.log. That log
+        # only grows (until it is rotated), so one stat tells a reader whether
+        # anyone else wrote, and the new lines tell it which files to reload.
+        self.changes_file = os.path.join(data_dir, "changes.log")
+        self._changed_files = set()
+        self._compactions_published = 0
+        self._changes_position = self._changes_log_position()
+        
+        # Notes storage engine: "json" rewrites notes.json on every change,
+        # "journal" appends each change to notes.journal (notes.json becomes
+        # the snapshot that the journal is compacted into), "sharded" keeps
+        # each user's notes in notes/<user_id>.json
+        if storage not in ("json", "journal", "sharded"):
+            raise ValueError(f"Unknown storage engine: {storage}")
+        self.storage = storage
+        
+        # Sharded storage: note key -> owner, to find the shard of a note
+        # looked up by ID alone. Entries are hints, checked against the shard.
+        self._note_owners: Dict[str, int] = {}
+        # user_id -> the shard dict that user's index entries were built from
+        self._shard_index_sources: Dict[int, dict] = {}
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
         
+        # Lazy content: note records hold metadata plus a reference into
+        # notes.content, and notes load their content only when it is read.
+        # The store is also opened without lazy_content if it exists, so
+        # notes saved with it can still be read (new saves are inline).
+        self.lazy_content = lazy_content
+        self._content: Optional[ContentStore] = None
+        if lazy_content or os.path.exists(self.content_file):
+            self._content = ContentStore(self.content_file, durable=durable)
+        # Content appended, and whether notes were replaced or deleted, since
+        # the store's garbage was last measured
+        self._content_appended = 0
+        self._content_changed = False
+        
         # Initialize files if they don't exist
         self._initialize_files()
+        
+        self._journal: Optional[JournalStore] = None
+        if storage == "journal":
+            self._journal = JournalStore(
+                self.notes_file, self.notes_journal_file,
+                compact_threshold=compact_threshold,
+                background=background_compaction,
+                durable=durable,
+                compaction_lock=self._compaction_locked
+            )
+        elif storage == "sharded":
+            os.makedirs(self.notes_dir, exist_ok=True)
+            self._shard_existing_notes()
+        
+        # ID allocation: blocks of IDs are leased from counters.json under a
+        # file lock, so creating a note does not rewrite counters.json.
+        # recover_ids makes every lease start above the highest stored ID.
+        self._user_ids = IdAllocator(
+            self.counters_file, "user_id_counter", block_size=id_block_size,
+            recover=lambda: self._max_id(self._load_json(self.users_file)),
+            recover_always=recover_ids, durable=durable
+        )
+        self._note_ids = IdAllocator(
+            self.counters_file, "note_id_counter", block_size=id_block_size,
+            recover=lambda: self._max_id(self._load_notes()),
+            recover_always=recover_ids, durable=durable
+        )
+        
+        # One pass over the notes, rewriting any pre-epoch data, then never
+        # again: new saves always store epoch timestamps
+        if migrate_timestamps and not self._counters_flag(self.TIMESTAMPS_MIGRATED):
+            self.migrate_timestamps()
+    
+    @staticmethod
+    def detect_storage(data_dir: str) -> str:
+        """The notes storage engine a data directory was written with."""
+        if os.path.isdir(os.path.join(data_dir, "notes")):
+            return "sharded"
+        if os.path.exists(os.path.join(data_dir, "notes.journal")):
+            return "journal"
+        return "json"
     
     def _initialize_files(self):
         """Initialize JSON files if they don't exist."""
-        if not os.path.exists(self.users_file):
-            with open(self.users_file, 'w') as f:
-                json.dump({}, f)
-        
-        if not os.path.exists(self.notes_file):
-            with open(self.notes_file, 'w') as f:
-                json.dump({}, f)
+        # Under data.lock: another process may be creating and writing them
+        with file_lock(self.lock_file):
+            if not os.path.exists(self.users_file):
+                atomic_write_json(self.users_file, {})
+            
+            if self.storage != "sharded" and not os.path.exists(self.notes_file):
+                atomic_write_json(self.notes_file, {})
         
-        if not os.path.exists(self.counters_file):
-            with open(self.counters_file, 'w') as f:
-                json.dump({"user_id_counter": 0, "note_id_counter": 0}, f)
+        # counters.json is created by the ID allocators on their first lease;
+        # if it goes missing they recover from the highest stored ID instead
+    
+    @staticmethod
+    def _file_signature(file_path: str) -> Optional[Tuple[int, int, int]]:
+        """Return (inode, mtime_ns, size) for a file, or None if it is missing."""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
     
     def _load_json(self, file_path: str) -> dict:
-        """Load JSON data from file."""
+        """Load JSON data from file (or from the in-memory cache)."""
+        if file_path in self._pending:
+            return self._pending[file_path]
+        
+        shared = getattr(self._shared_loads, 'files', None)
+        if shared is not None and file_path in shared:
+            return shared[file_path]
+        
+        if self.cached:
+            entry = self._cache.get(file_path)
+            if entry and entry[0] == self._file_signature(file_path):
+                return entry[1]
+        
+        signature = self._file_signature(file_path)
         try:
             with open(file_path, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {}
+            data = {}
+        
+        if self.cached:
+            self._cache[file_path] = (signature, data)
+        if shared is not None:
+            shared[file_path] = data
+        return data
+    
+    @contextmanager
+    def shared_loads(self):
+        """Parse each file at most once for all reads made inside the block.
+        
+        Uncached, every read parses its file again; AsyncDataService runs
+        each batch of concurrent reads in one of these blocks. Applies to
+        the calling thread only, and only reads belong inside it.
+        """
+        outermost = getattr(self._shared_loads, 'files', None) is None
+        if outermost:
+            self._shared_loads.files = {}
+        try:
+            yield self
+        finally:
+            if outermost:
+                self._shared_loads.files = None
     
     def _save_json(self, file_path: str, data: dict):
-        """Save data to JSON file."""
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        """Save data to JSON file (writing through the cache)."""
+        if self._group_depth:
+            self._pending[file_path] = data
+            return
+        
+        self._write_json(file_path, data)
+        if self.fsync_dir:
+            fsync_directory(os.path.dirname(file_path))
+    
+    def _write_json(self, file_path: str, data: dict):
+        """Atomically replace a JSON file and refresh its cache entry."""
+        atomic_write_json(file_path, data, fsync=self.durable)
+        self._changed_files.add(file_path)
+        
+        if self.cached:
+            self._cache[file_path] = (self._file_signature(file_path), data)
+    
+    # Locking - see __init__
+    @contextmanager
+    def _write_locked(self):
+        """Hold the in-process write lock and the cross-process file lock."""
+        with self._rwlock.write_locked(), self._process_locked():
+            yield
+    
+    @contextmanager
+    def _process_locked(self):
+        """Hold data.lock for this process (caller holds the write lock to acquire).
+        
+        Whoever takes it first catches up with other processes' changes;
+        whoever releases it last announces this process's changes.
+        """
+        with self._process_lock_mutex:
+            if not self._process_lock_holders:
+                self._process_lock.enter_context(file_lock(self.lock_file))
+                self._refresh_external_changes()
+            self._process_lock_holders += 1
+        try:
+            yield
+        finally:
+            with self._process_lock_mutex:
+                self._process_lock_holders -= 1
+                if not self._process_lock_holders:
+                    try:
+                        self._publish_changes()
+                    finally:
+                        self._process_lock.close()
+    
+    @contextmanager
+    def _compaction_locked(self):
+        """Keep other processes out while the journal is compacted.
+        
+        Only the acquisition needs the write lock; this process's threads
+        keep reading and writing while the snapshot is written.
+        """
+        with ExitStack() as stack:
+            with self._rwlock.write_locked():
+                stack.enter_context(self._process_locked())
+            yield
+    
+    # Change notification - see __init__
+    def _changes_log_position(self) -> Optional[Tuple[int, int]]:
+        """(inode, size) of changes.log, or None if it does not exist."""
+        signature = self._file_signature(self.changes_file)
+        return (signature[0], signature[2]) if signature else None
+    
+    def _refresh_if_changed(self):
+        """Catch up with other processes' writes, if there were any (one stat if not)."""
+        if self._changes_log_position() == self._changes_position or self._rwlock.reading():
+            return
+        with self._rwlock.write_locked(), self._process_lock_mutex:
+            if self._process_lock_holders:
+                return  # this process holds data.lock, so it is already up to date
+            with file_lock(self.lock_file, shared=True):
+                self._refresh_external_changes()
+    
+    def _read_changes(self) -> Optional[set]:
+        """Names of the files changed since the last call, or None if unknown."""
+        position = self._changes_log_position()
+        seen = self._changes_position
+        if seen is None and position:
+            seen = (position[0], 0)  # the first change ever: read the new log from the start
+        if not position or position[0] != seen[0] or position[1] < seen[1]:
+            # The log was rotated (or removed): anything may have changed
+            self._changes_position = position
+            return None
+        
+        offset = seen[1]
+        with open(self.changes_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read(position[1] - offset)
+        complete = data[:data.rfind(b"\n") + 1]  # a line may still be being appended
+        self._changes_position = (position[0], offset + len(complete))
+        return set(complete.decode('utf-8').split())
+    
+    def _change_name(self, file_path: str) -> str:
+        """How a data file is named in changes.log, e.g. 'users.json' or 'notes/3.json'."""
+        return os.path.relpath(file_path, self.data_dir).replace(os.sep, "/")
+    
+    def _refresh_external_changes(self):
+        """Reload what other processes changed (caller holds the write lock).
+        
+        Only the files named in changes.log are dropped from the cache. In
+        journal mode, new journal lines are applied record by record and the
+        per-user index is patched for just those records; a new snapshot
+        (another process compacted) means a full reload.
+        """
+        if self._changes_log_position() == self._changes_position:
+            return
+        changed = self._read_changes()
+        
+        for file_path in list(self._cache):
+            if changed is None or self._change_name(file_path) in changed:
+                self._cache.pop(file_path, None)
+        
+        if not self._journal:
+            return
+        if changed is None or self._change_name(self.notes_file) in changed:
+            self._journal.load()  # new records dict: the user index is rebuilt
+        elif self._change_name(self.notes_journal_file) in changed:
+            changes = self._journal.refresh()
+            if changes and self._user_notes_index_source is self._journal.records:
+                for key, old_data in changes.items():
+                    if old_data:
+                        self._unindex_note(self._user_notes_index, old_data)
+                    new_data = self._journal.records.get(key)
+                    if new_data:
+                        self._index_note(self._user_notes_index, new_data)
+        self._compactions_published = self._journal.compactions
+    
+    def _publish_changes(self):
+        """Announce the files this process changed (caller holds data.lock)."""
+        if self._journal and self._journal.compactions != self._compactions_published:
+            self._changed_files.add(self.notes_file)
+            self._compactions_published = self._journal.compactions
+        if not self._changed_files:
+            return
+        names = "".join(sorted(self._change_name(path) + "\n" for path in self._changed_files))
+        self._changed_files.clear()
+        
+        position = self._changes_log_position()
+        if position and position[1] >= self.CHANGES_LOG_LIMIT:
+            # Start a new log; readers see a new inode and check everything once
+            os.remove(self.changes_file)
+        with open(self.changes_file, 'a') as f:
+            f.write(names)
+        self._changes_position = self._changes_log_position()
+    
+    @contextmanager
+    def group_commit(self):
+        """Batch every save made inside the block into one write per file.
+        
+        Usage:
+            with data_service.group_commit():
+                for note in notes:
+                    data_service.save_note(note)
+        
+        Reads inside the block see the pending data. Groups can be nested;
+        the outermost one writes (and fsyncs) each touched file exactly once.
+        The group holds the write locks: other threads wait until it ends,
+        and other processes cannot write meanwhile.
+        """
+        with self._write_locked():
+            self._group_depth += 1
+            try:
+                if self._journal and self._group_depth == 1:
+                    with self._journal.group_commit():
+                        yield self
+                else:
+                    yield self
+            finally:
+                self._group_depth -= 1
+                if self._group_depth == 0:
+                    self.flush()
+    
+    @_writes
+    def flush(self):
+        """Write every pending group-commit save to disk."""
+        pending, self._pending = self._pending, {}
+        if self._content:
+            self._content.sync()  # the contents the records refer to, first
+        for file_path, data in pending.items():
+            self._write_json(file_path, data)
+        if pending and self.fsync_dir:
+            for directory in {os.path.dirname(file_path) for file_path in pending}:
+                fsync_directory(directory)
+    
+    @_writes
+    def clear_cache(self):
+        """Drop every cached file so the next read goes to disk."""
+        self._cache.clear()
+    
+    def close(self):
+        """Release storage resources (unused IDs, background compaction, content store)."""
+        with self._write_locked():
+            self._user_ids.release()
+            self._note_ids.release()
+            if self._content:
+                self._compact_content_if_wasteful(closing=True)
+                self._content.close()
+        # Outside the lock: a background compaction may be waiting for it
+        if self._journal:
+            self._journal.close()
+    
+    # Notes table access - routes through the configured storage engine
+    def _load_notes(self) -> dict:
+        """Get the notes table as a dict of note_id -> note data.
+        
+        Sharded storage merges every shard into a new dict, so there this
+        is only for whole-table reads (get_all_notes, ID recovery).
+        """
+        if self._journal:
+            return self._journal.records
+        if self.storage == "sharded":
+            notes = {}
+            for user_id in self._shard_user_ids():
+                shard = self._load_shard(user_id)
+                for key in shard:
+                    self._note_owners[key] = user_id
+                notes.update(shard)
+            return notes
+        return self._load_json(self.notes_file)
+    
+    def _user_notes(self, user_id: int) -> Tuple[dict, List[Tuple[int, int]]]:
+        """Get a table holding the user's notes, and the user's index entries."""
+        if self.storage == "sharded":
+            shard = self._load_shard(user_id)
+            return shard, self._get_shard_index(user_id, shard)
+        notes = self._load_notes()
+        return notes, self._get_user_notes_index(notes).get(user_id, [])
+    
+    def _put_note_data(self, key: str, note_data: dict):
+        """Insert or replace one note record."""
+        if self.storage == "sharded":
+            self._put_shard_record(key, note_data)
+            return
+        
+        notes = self._load_notes()
+        user_index = self._get_user_notes_index(notes)
+        old_data = notes.get(key)
+        
+        if self._journal:
+            self._journal.put(key, note_data)
+            self._changed_files.add(self.notes_journal_file)
+        else:
+            notes[key] = note_data
+            self._save_json(self.notes_file, notes)
+        
+        if old_data:
+            self._unindex_note(user_index, old_data)
+        self._index_note(user_index, note_data)
+    
+    def _delete_note_data(self, keys: List[str]) -> int:
+        """Delete note records by key. Returns how many existed."""
+        if self.storage == "sharded":
+            keys_by_owner: Dict[int, List[str]] = {}
+            for key in keys:
+                owner = self._locate_note(key)
+                if owner is not None:
+                    keys_by_owner.setdefault(owner, []).append(key)
+            return sum(
+                self._delete_shard_records(owner, owner_keys)
+                for owner, owner_keys in keys_by_owner.items()
+            )
+        
+        notes = self._load_notes()
+        user_index = self._get_user_notes_index(notes)
+        deleted = [(key, notes[key]) for key in keys if key in notes]
+        
+        if self._journal:
+            for key, _note_data in deleted:
+                self._journal.delete(key)
+            if deleted:
+                self._changed_files.add(self.notes_journal_file)
+        elif deleted:
+            for key, _note_data in deleted:
+                del notes[key]
+            self._save_json(self.notes_file, notes)
+        
+        for _key, note_data in deleted:
+            self._unindex_note(user_index, note_data)
+        return len(deleted)
+    
+    # Lazy content - note bodies in notes.content, see __init__
+    def _note_from_record(self, note_data: dict) -> Note:
+        """Hydrate a stored note record (a LazyNote if its content is in the store)."""
+        if 'content_ref' in note_data:
+            return LazyNote.from_storage(note_data, self._content)
+        return Note.from_storage(note_data)
+    
+    def _note_record(self, note: Note) -> dict:
+        """The record to store for a note: metadata and a content reference if lazy."""
+        if not self.lazy_content:
+            return note.to_dict()
+        if isinstance(note, LazyNote) and note.content_ref is not None:
+            ref, preview = note.content_ref, note.preview  # content unchanged
+        else:
+            # Inside a group the fsync waits for flush(); the journal writes
+            # its records before that, so in journal mode it cannot wait
+            defer_sync = self._group_depth > 0 and not self._journal
+            ref = self._content.append(note.content, defer_sync=defer_sync)
+            self._content_appended += ref[1]
+            preview = note.content[:PREVIEW_LENGTH + 1]
+        return {
+            'id': note.id,
+            'title': note.title,
+            'content_ref': ref,
+            'preview': preview,
+            'created_at': note.created_at,
+            'updated_at': note.updated_at,
+            'user_id': note.user_id
+        }
+    
+    @_writes
+    def compact_content(self) -> int:
+        """Rewrite notes.content with only the live contents. Returns bytes reclaimed.
+        
+        Updated and deleted notes leave their old content behind in the
+        store; this drops it. Notes stored inline (before lazy_content was
+        turned on) are moved into the store too, so the result can be
+        negative. Notes another process loaded but has not read the content
+        of yet must be loaded again afterwards.
+        """
+        if not self._content:
+            return 0
+        self._content.reopen()  # another process may have compacted it already
+        notes = self._load_notes()
+        before = self._content.size()
+        bodies = (
+            (key, self._content.read(note_data['content_ref'])
+             if 'content_ref' in note_data else note_data['content'])
+            for key, note_data in notes.items()
+        )
+        new_refs = self._content.compact(bodies)
+        with self.group_commit():
+            for key, ref in new_refs.items():
+                record = dict(notes[key], content_ref=ref)
+                if 'content' in record:
+                    record['preview'] = record.pop('content')[:PREVIEW_LENGTH + 1]
+                self._put_note_data(key, record)
+        self._content.drop_previous()
+        self._content_appended = 0
+        self._content_changed = False
+        return before - self._content.size()
+    
+    def _compact_content_if_wasteful(self, closing: bool = False):
+        """Compact notes.content if most of it is garbage (caller holds the write lock).
+        
+        Live bytes are summed from the note records' references, no content
+        is read. That pass runs after every CONTENT_CHECK_BYTES appended, or
+        on close if notes were saved or deleted since the last one.
+        """
+        if not self.lazy_content or self._group_depth:
+            return
+        if not (self._content_changed if closing else self._content_appended >= self.CONTENT_CHECK_BYTES):
+            return
+        self._content_appended = 0
+        self._content_changed = False
+        self._content.reopen()
+        size = self._content.size()
+        if size < self.CONTENT_COMPACT_MIN_SIZE:
+            return
+        generation = self._content.generation
+        live = HEADER_SIZE + sum(
+            note_data['content_ref'][1] for note_data in self._load_notes().values()
+            if 'content_ref' in note_data and note_data['content_ref'][2] == generation
+        )
+        if size - live > self.CONTENT_GARBAGE_RATIO * size:
+            self.compact_content()
+    
+    # Sharded storage - one notes/<user_id>.json file per user
+    def _shard_file(self, user_id: int) -> str:
+        """Path of a user's notes shard."""
+        return os.path.join(self.notes_dir, f"{user_id}.json")
+    
+    def _shard_owner(self, file_path: str) -> Optional[int]:
+        """The user a shard path belongs to, or None if it is not a shard."""
+        if os.path.dirname(file_path) != self.notes_dir:
+            return None
+        stem, extension = os.path.splitext(os.path.basename(file_path))
+        if extension != ".json" or not stem.lstrip("-").isdigit():
+            return None
+        return int(stem)
+    
+    def _shard_user_ids(self) -> List[int]:
+        """Owners of every shard, on disk or pending in a group commit."""
+        try:
+            paths = [os.path.join(self.notes_dir, name) for name in os.listdir(self.notes_dir)]
+        except FileNotFoundError:
+            paths = []
+        owners = {self._shard_owner(path) for path in paths + list(self._pending)}
+        owners.discard(None)
+        return sorted(owners)
+    
+    def _load_shard(self, user_id: int) -> dict:
+        """Get one user's notes (an empty dict if the user has none)."""
+        return self._load_json(self._shard_file(user_id))
+    
+    def _get_shard_index(self, user_id: int, shard: dict) -> List[Tuple[int, int]]:
+        """Get the user's index entries for this shard, building them if needed."""
+        if self._shard_index_sources.get(user_id) is not shard:
+            entries = sorted(self._index_key(note_data) for note_data in shard.values())
+            for key in shard:
+                self._note_owners[key] = user_id
+            self._user_notes_index[user_id] = entries
+            self._shard_index_sources[user_id] = shard
+            return entries
+        return self._user_notes_index.get(user_id, [])
+    
+    def _locate_note(self, key: str) -> Optional[int]:
+        """Find the owner of a note; scans every shard if the hint is missing or stale."""
+        owner = self._note_owners.get(key)
+        if owner is not None and key in self._load_shard(owner):
+            return owner
+        self._load_notes()  # refreshes _note_owners from every shard
+        owner = self._note_owners.get(key)
+        if owner is not None and key in self._load_shard(owner):
+            return owner
+        self._note_owners.pop(key, None)
+        return None
+    
+    def _put_shard_record(self, key: str, note_data: dict):
+        """Insert or replace a note in its owner's shard."""
+        user_id = note_data['user_id']
+        previous_owner = self._note_owners.get(key)
+        if previous_owner is not None and previous_owner != user_id:
+            self._delete_shard_records(previous_owner, [key])  # the note changed hands
+        
+        shard = self._load_shard(user_id)
+        self._get_shard_index(user_id, shard)
+        old_data = shard.get(key)
+        shard[key] = note_data
+        self._save_json(self._shard_file(user_id), shard)
+        
+        if old_data:
+            self._unindex_note(self._user_notes_index, old_data)
+        self._index_note(self._user_notes_index, note_data)
+        self._note_owners[key] = user_id
+    
+    def _delete_shard_records(self, user_id: int, keys: List[str]) -> int:
+        """Delete notes from one user's shard. Returns how many existed."""
+        shard = self._load_shard(user_id)
+        self._get_shard_index(user_id, shard)
+        deleted = [(key, shard.pop(key)) for key in keys if key in shard]
+        if deleted:
+            self._save_json(self._shard_file(user_id), shard)
+        for key, note_data in deleted:
+            self._unindex_note(self._user_notes_index, note_data)
+            self._note_owners.pop(key, None)
+        return len(deleted)
+    
+    def _remove_shard(self, user_id: int) -> int:
+        """Delete a user's whole shard file. Returns how many notes it held."""
+        file_path = self._shard_file(user_id)
+        shard = self._load_shard(user_id)
+        for key in shard:
+            if self._note_owners.get(key) == user_id:
+                del self._note_owners[key]
+        self._pending.pop(file_path, None)
+        self._cache.pop(file_path, None)
+        self._user_notes_index.pop(user_id, None)
+        self._shard_index_sources.pop(user_id, None)
+        try:
+            os.remove(file_path)
+            self._changed_files.add(file_path)
+        except FileNotFoundError:
+            pass
+        return len(shard)
+    
+    def _shard_existing_notes(self):
+        """Move notes.json (and notes.journal) into per-user shards, once.
+        
+        The old files are kept as *.pre-sharding backups.
+        """
+        with self._write_locked():
+            legacy_files = [path for path in (self.notes_file, self.notes_journal_file)
+                            if os.path.exists(path)]
+            if not legacy_files:
+                return
+            # Replays the snapshot plus any journal, whichever exist
+            legacy = JournalStore(self.notes_file, self.notes_journal_file, durable=self.durable)
+            records = legacy.records
+            legacy.close()
+            
+            with self.group_commit():
+                for key, note_data in records.items():
+                    shard = self._load_shard(note_data['user_id'])
+                    shard[key] = note_data
+                    self._save_json(self._shard_file(note_data['user_id']), shard)
+            for path in legacy_files + [self.notes_journal_file]:
+                if os.path.exists(path):
+                    os.replace(path, path + ".pre-sharding")
+    
+    # Per-user note index - O(k) listing of one user's k notes
+    @staticmethod
+    def _index_key(note_data: dict) -> Tuple[int, int]:
+        """Sort key of a note record: (created_at, id), both integers."""
+        return (note_data['created_at'], note_data['id'])
+    
+    def _get_user_notes_index(self, notes: dict) -> Dict[Optional[int], List[Tuple[int, int]]]:
+        """Get the user -> notes index for this notes table, building it if needed."""
+        if self._user_notes_index_source is not notes:
+            # Built aside and published index-first: concurrent readers may
+            # each build one, but never see a half-built index
+            user_index = {}
+            for note_data in notes.values():
+                user_index.setdefault(note_data.get('user_id'), []).append(
+                    self._index_key(note_data)
+                )
+            for entries in user_index.values():
+                entries.sort()
+            self._user_notes_index = user_index
+            self._user_notes_index_source = notes
+            return user_index
+        return self._user_notes_index
+    
+    def _index_note(self, user_index: Dict[Optional[int], List[Tuple[int, int]]], note_data: dict):
+        """Add a note record to its owner's list."""
+        entries = user_index.setdefault(note_data.get('user_id'), [])
+        entry = self._index_key(note_data)
+        if not entries or entries[-1] < entry:
+            entries.append(entry)  # the common case: the newest note
+        else:
+            bisect.insort(entries, entry)
+    
+    def _unindex_note(self, user_index: Dict[Optional[int], List[Tuple[int, int]]], note_data: dict):
+        """Remove a note record from its owner's list."""
+        user_id = note_data.get('user_id')
+        entries = user_index.get(user_id)
+        if not entries:
+            return
+        entry = self._index_key(note_data)
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+        if not entries:
+            del user_index[user_id]
+    
+    # Timestamp migration - legacy 'DD/MM/YY HH:MM:SS' strings to epoch ints
+    def _counters_flag(self, name: str) -> bool:
+        """Whether a one-time step recorded in counters.json has been done."""
+        try:
+            with open(self.counters_file, 'r') as f:
+                return bool(json.load(f).get(name))
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            return False
+    
+    def _set_counters_flag(self, name: str):
+        """Record a one-time step in counters.json, next to the ID counters."""
+        # Same lock as the ID allocators, which rewrite the file too
+        with file_lock(self.counters_file + ".lock"):
+            try:
+                with open(self.counters_file, 'r') as f:
+                    counters = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                counters = {}
+            counters[name] = True
+            atomic_write_json(self.counters_file, counters, fsync=self.durable)
+    
+    @_writes
+    def migrate_timestamps(self) -> int:
+        """Rewrite notes whose timestamps are still strings. Returns how many changed.
+        
+        Records the migration in counters.json, so later starts skip the scan.
+        """
+        notes = self._load_notes()
+        legacy = [
+            note_data for note_data in notes.values()
+            if not isinstance(note_data.get('created_at'), int)
+            or isinstance(note_data.get('updated_at'), str)
+        ]
+        if legacy:
+            # Bypasses _put_note_data: the user index cannot order mixed
+            # str/int timestamps, so it is simply rebuilt afterwards
+            with self.group_commit():
+                for note_data in legacy:
+                    note = Note.from_dict(note_data)  # normalizes timestamps
+                    if self._journal:
+                        self._journal.put(str(note.id), note.to_dict())
+                        self._changed_files.add(self.notes_journal_file)
+                    elif self.storage == "sharded":
+                        shard = self._load_shard(note.user_id)
+                        shard[str(note.id)] = note.to_dict()
+                        self._save_json(self._shard_file(note.user_id), shard)
+                    else:
+                        notes[str(note.id)] = note.to_dict()
+                if self.storage == "json":
+                    self._save_json(self.notes_file, notes)
+            self._user_notes_index_source = None
+            self._shard_index_sources.clear()
+        self._set_counters_flag(self.TIMESTAMPS_MIGRATED)
+        return len(legacy)
     
     # ID Management - ensures unique IDs for users and notes
+    @staticmethod
+    def _max_id(records: dict) -> int:
+        """Highest numeric key of a table (0 if empty)."""
+        return max((int(key) for key in records), default=0)
+    
     def get_next_user_id(self) -> int:
         """Get the next available user ID."""
-        counters = self._load_json(self.counters_file)
-        counters["user_id_counter"] += 1
-        self._save_json(self.counters_file, counters)
-        return counters["user_id_counter"]
+        return self._user_ids.next_id()
     
     def get_next_note_id(self) -> int:
         """Get the next available note ID."""
-        counters = self._load_json(self.counters_file)
-        counters["note_id_counter"] += 1
-        self._save_json(self.counters_file, counters)
-        return counters["note_id_counter"]
+        return self._note_ids.next_id()
+    
+    def reserve_note_ids(self, count: int) -> range:
+        """Get count consecutive note IDs at once (for bulk creation)."""
+        return self._note_ids.reserve(count)
+    
+    # User name index - O(1) lookup by name
+    def _get_name_index(self, users: dict) -> Dict[str, str]:
+        """Get the name index for this users table, building it if needed."""
+        if self._name_index_source is not users:
+            name_index = {}
+            for key, user_data in users.items():
+                name_index.setdefault(user_data['name'].casefold(), key)
+            self._name_index = name_index
+            self._name_index_source = users
+            return name_index
+        return self._name_index
+    
+    def _unindex_name(self, users: dict, name: str, key: str):
+        """Drop name -> key from the index, falling back to another user with that name."""
+        name_index = self._get_name_index(users)
+        folded = name.casefold()
+        if name_index.get(folded) != key:
+            return
+        del name_index[folded]
+        for other_key, user_data in users.items():
+            if other_key != key and user_data['name'].casefold() == folded:
+                name_index[folded] = other_key
+                break
     
     # User CRUD operations - Create, Read, Update, Delete
+    @_writes
     def save_user(self, user: User) -> User:
         """Save a user to the database."""
         users = self._load_json(self.users_file)
-        users[str(user.id)] = user.to_dict()
+        key = str(user.id)
+        name_index = self._get_name_index(users)
+        old_data = users.get(key)
+        if old_data and old_data['name'].casefold() != user.name.casefold():
+            # Renamed (e.g. by UserService.update_user)
+            self._unindex_name(users, old_data['name'], key)
+        users[key] = user.to_dict()
+        name_index.setdefault(user.name.casefold(), key)
         self._save_json(self.users_file, users)
+        if self.storage == "sharded" and not old_data:
+            # New user: the shard is created with the user, deleted with it too
+            shard_file = self._shard_file(user.id)
+            if not os.path.exists(shard_file):
+                self._save_json(shard_file, self._load_json(shard_file))
         return user
     
+    @_reads
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get a user by ID."""
         users = self._load_json(self.users_file)
         user_data = users.get(str(user_id))
-        return User.from_dict(user_data) if user_data else None
+        return User.from_storage(user_data) if user_data else None
     
+    @_reads
     def get_user_by_name(self, name: str) -> Optional[User]:
         """Get a user by name."""
         users = self._load_json(self.users_file)
-        for user_data in users.values():
-            if user_data['name'].lower() == name.lower():
-                return User.from_dict(user_data)
-        return None
+        key = self._get_name_index(users).get(name.casefold())
+        return User.from_storage(users[key]) if key else None
     
+    @_reads
     def get_all_users(self) -> List[User]:
         """Get all users."""
         users = self._load_json(self.users_file)
-        return [User.from_dict(user_data) for user_data in users.values()]
+        return [User.from_storage(user_data) for user_data in users.values()]
     
+    @_writes
     def delete_user(self, user_id: int) -> bool:
         """Delete a user by ID."""
         users = self._load_json(self.users_file)
-        if str(user_id) in users:
-            del users[str(user_id)]
+        key = str(user_id)
+        if key in users:
+            self._unindex_name(users, users[key]['name'], key)
+            del users[key]
             self._save_json(self.users_file, users)
             # Also delete user's notes
             self.delete_notes_by_user(user_id)
@@ -105,57 +945,101 @@ class DataService:
         return False
     
     # Note CRUD operations - Create, Read, Update, Delete
+    @_writes
     def save_note(self, note: Note) -> Note:
         """Save a note to the database."""
-        notes = self._load_json(self.notes_file)
-        notes[str(note.id)] = note.to_dict()
-        self._save_json(self.notes_file, notes)
+        self._put_note_data(str(note.id), self._note_record(note))
+        self._content_changed = True
+        self._compact_content_if_wasteful()
         return note
     
-    def get_note_by_id(self, note_id: int) -> Optional[Note]:
-        """Get a note by ID."""
-        notes = self._load_json(self.notes_file)
-        note_data = notes.get(str(note_id))
-        return Note.from_dict(note_data) if note_data else None
+    @_writes
+    def save_notes(self, notes: List[Note]) -> List[Note]:
+        """Save many notes with a single write per file."""
+        with self.group_commit():
+            for note in notes:
+                self._put_note_data(str(note.id), self._note_record(note))
+        self._content_changed = True
+        self._compact_content_if_wasteful()
+        return notes
     
+    @_reads
+    def get_note_by_id(self, note_id: int, user_id: Optional[int] = None) -> Optional[Note]:
+        """Get a note by ID.
+        
+        With user_id, only that user's note is returned (None if the note
+        belongs to someone else); with sharded storage only their shard is
+        read, so a miss never loads the other shards.
+        """
+        key = str(note_id)
+        if self.storage == "sharded":
+            owner = self._locate_note(key) if user_id is None else user_id
+            note_data = self._load_shard(owner).get(key) if owner is not None else None
+        else:
+            note_data = self._load_notes().get(key)
+            if note_data and user_id is not None and note_data.get('user_id') != user_id:
+                note_data = None
+        return self._note_from_record(note_data) if note_data else None
+    
+    @_reads
     def get_notes_by_user(self, user_id: int) -> List[Note]:
-        """Get all notes for a specific user."""
-        notes = self._load_json(self.notes_file)
-        user_notes = []
-        for note_data in notes.values():
-            if note_data.get('user_id') == user_id:
-                user_notes.append(Note.from_dict(note_data))
-        return sorted(user_notes, key=lambda x: x.created_at, reverse=True)
+        """Get all notes for a specific user, newest first."""
+        notes, entries = self._user_notes(user_id)
+        return [self._note_from_record(notes[str(note_id)]) for _created_at, note_id in reversed(entries)]
+    
+    def iter_notes_by_user(self, user_id: int, newest_first: bool = True) -> Iterator[Note]:
+        """Yield a user's notes one at a time, without building a list of notes."""
+        # The lock is taken per step, never held while the caller consumes
+        self._refresh_if_changed()
+        with self._rwlock.read_locked():
+            notes, entries = self._user_notes(user_id)
+            entries = list(entries)
+        for _created_at, note_id in (reversed(entries) if newest_first else entries):
+            with self._rwlock.read_locked():
+                note_data = notes.get(str(note_id))
+            if note_data:
+                yield self._note_from_record(note_data)
+    
+    @_reads
+    def get_notes_by_user_between(self, user_id: int, start: Optional[int] = None,
+                                  end: Optional[int] = None) -> List[Note]:
+        """Get a user's notes created in [start, end] (epoch seconds), newest first."""
+        notes, entries = self._user_notes(user_id)
+        low = 0 if start is None else bisect.bisect_left(entries, (start, float('-inf')))
+        high = len(entries) if end is None else bisect.bisect_right(entries, (end, float('inf')))
+        return [self._note_from_record(notes[str(note_id)]) for _created_at, note_id in reversed(entries[low:high])]
     
+    @_reads
+    def get_notes_page(self, user_id: int, limit: int,
+                       after: Optional[Tuple[int, int]] = None) -> List[Note]:
+        """Get up to limit of a user's notes, newest first, after a keyset position.
+        
+        after is the (created_at, id) of the last note of the previous page;
+        the page holds the notes that sort before it. Only the page's notes
+        are loaded, found by bisecting the per-user index.
+        """
+        notes, entries = self._user_notes(user_id)
+        high = len(entries) if after is None else bisect.bisect_left(entries, tuple(after))
+        low = max(high - limit, 0)
+        return [self._note_from_record(notes[str(note_id)]) for _created_at, note_id in reversed(entries[low:high])]
+    
+    @_reads
     def get_all_notes(self) -> List[Note]:
         """Get all notes."""
-        notes = self._load_json(self.notes_file)
-        return [Note.from_dict(note_data) for note_data in notes.values()]
+        notes = self._load_notes()
+        return [self._note_from_record(note_data) for note_data in notes.values()]
     
+    @_writes
     def delete_note(self, note_id: int) -> bool:
         """Delete a note by ID."""
-        notes = self._load_json(self.notes_file)
-        if str(note_id) in notes:
-            del notes[str(note_id)]
-            self._save_json(self.notes_file, notes)
-            return True
-        return False
+        self._content_changed = True
+        return self._delete_note_data([str(note_id)]) > 0
     
+    @_writes
     def delete_notes_by_user(self, user_id: int) -> int:
         """Delete all notes for a specific user. Returns count of deleted notes."""
-        notes = self._load_json(self.notes_file)
-        deleted_count = 0
-        notes_to_delete = []
-        
-        for note_id, note_data in notes.items():
-            if note_data.get('user_id') == user_id:
-                notes_to_delete.append(note_id)
-        
-        for note_id in notes_to_delete:
-            del notes[note_id]
-            deleted_count += 1
-        
-        if deleted_count > 0:
-            self._save_json(self.notes_file, notes)
-        
-        return deleted_count 
\ No newline at end of file
+        self._content_changed = True
+        if self.storage == "sharded":
+            return self._remove_shard(user_id)  # one unlink, however many notes
+        notes, entries = self._user_notes(user_id)
+        return self._delete_note_data([str(note_id) for _created_at, note_id in entries])
@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, fall back to in-process only
+    fcntl = None
+
+
+def fsync_directory(dir_path: str):
+    """Flush a directory entry to disk so a rename inside it survives a crash."""
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened on some platforms (e.g. Windows)
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(file_path: str, data, indent: Optional[int] = 2,
+                      fsync: bool = True, fsync_dir: bool = False):
+    """Write JSON so that readers see either the old file or the new one.
+
+    The data goes to a temp file in the same directory, is optionally
+    fsynced, and then replaces the target with os.replace (atomic on POSIX
+    and Windows). A crash mid-write leaves the previous file untouched.
+    """
+    dir_path = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_file = tempfile.mkstemp(
+        prefix=os.path.basename(file_path) + ".", suffix=".tmp", dir=dir_path
+    )
+    try:
+        with os.fdopen(fd, 'w') as f:
+            if indent is None:
+                json.dump(data, f, separators=(',', ':'))
+            else:
+                json.dump(data, f, indent=indent)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp creates 0600 files; keep the permissions of the file we replace
+        try:
+            os.chmod(temp_file, os.stat(file_path).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_file, file_path)
+    except BaseException:
+        # Includes KeyboardInterrupt: never leave temp files behind
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
+        raise
+
+    if fsync_dir:
+        fsync_directory(dir_path)
+
+
+@contextmanager
+def file_lock(lock_path: str, shared: bool = False):
+    """Hold an advisory lock on lock_path across processes (fcntl.flock).
+
+    shared=True takes a reader lock that other readers can share. On
+    platforms without fcntl this is a no-op.
+    """
+    with open(lock_path, 'a+') as lock_file:
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,91 @@
+import json
+import threading
+from typing import Callable, Optional
+
+from services.file_io import atomic_write_json, file_lock
+
+
+class IdAllocator:
+     # Leases blocks of IDs from counters.json under a file lock
+     # IDs inside a leased block are handed out from memory, no file I/O
+    """Unique ID allocator shared safely between threads and processes."""
+
+    DEFAULT_BLOCK_SIZE = 1000
+
+    def __init__(self, counters_file: str, counter_name: str,
+                 block_size: int = DEFAULT_BLOCK_SIZE,
+                 recover: Optional[Callable[[], int]] = None,
+                 recover_always: bool = False,
+                 durable: bool = True):
+        self.counters_file = counters_file
+        self.lock_file = counters_file + ".lock"
+        self.counter_name = counter_name
+        self.block_size = max(1, block_size)
+        # recover() returns the highest ID already stored. It is used when the
+        # counter is missing or unreadable, or on every lease if recover_always
+        self.recover = recover
+        self.recover_always = recover_always
+        self.durable = durable
+
+        self._lock = threading.Lock()
+        self._next = 1
+        self._limit = 0  # last ID of the current lease
+
+    def _read_counters(self) -> Optional[dict]:
+        try:
+            with open(self.counters_file, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _lease(self, count: int):
+        """Reserve at least count IDs (caller holds self._lock)."""
+        with file_lock(self.lock_file):
+            counters = self._read_counters()
+            last_id = (counters or {}).get(self.counter_name)
+            if counters is None:
+                counters = {}
+            if last_id is None or self.recover_always:
+                recovered = self.recover() if self.recover else 0
+                last_id = max(last_id or 0, recovered)
+
+            start = last_id + 1
+            end = last_id + max(count, self.block_size)
+            counters[self.counter_name] = end
+            atomic_write_json(self.counters_file, counters, fsync=self.durable)
+
+        self._next, self._limit = start, end
+
+    def next_id(self) -> int:
+        """Get the next unique ID."""
+        with self._lock:
+            if self._next > self._limit:
+                self._lease(1)
+            allocated = self._next
+            self._next += 1
+            return allocated
+
+    def reserve(self, count: int) -> range:
+        """Get count consecutive unique IDs at once."""
+        with self._lock:
+            if self._limit - self._next + 1 < count:
+                self._lease(count)
+            ids = range(self._next, self._next + count)
+            self._next += count
+            return ids
+
+    def release(self):
+        """Give back the unused part of the current lease, if nobody leased after us.
+
+        Keeps IDs dense across restarts of a single process; skipping it is
+        always safe (unused IDs just become gaps).
+        """
+        with self._lock:
+            if self._next > self._limit:
+                return
+            with file_lock(self.lock_file):
+                counters = self._read_counters()
+                if counters and counters.get(self.counter_name) == self._limit:
+                    counters[self.counter_name] = self._next - 1
+                    atomic_write_json(self.counters_file, counters, fsync=self.durable)
+            self._next, self._limit = 1, 0
@@ -0,0 +1,276 @@
+import json
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Dict, Optional, Tuple
+
+from services.file_io import atomic_write_json, fsync_directory
+
+
+class JournalStore:
+     # Append-only storage engine: snapshot file + JSON-lines journal
+     # Every mutation is one appended line; compaction folds the journal into the snapshot
+    """Key/value record store backed by a JSON snapshot and an append-only journal.
+
+    Several processes may share one store if their writers are serialized
+    (e.g. by DataService's data.lock, passed in as compaction_lock) and each
+    calls refresh() before writing to catch up with the others.
+    """
+
+    DEFAULT_COMPACT_THRESHOLD = 1024 * 1024  # bytes of journal before compaction
+
+    def __init__(self, snapshot_file: str, journal_file: str,
+                 compact_threshold: int = DEFAULT_COMPACT_THRESHOLD,
+                 background: bool = False, durable: bool = True,
+                 compaction_lock: Optional[Callable[[], ContextManager]] = None,
+                 snapshot_indent: Optional[int] = 2, compact_ratio: float = 0):
+        self.snapshot_file = snapshot_file
+        self.journal_file = journal_file
+        # Journal being folded into the snapshot; only exists while compacting
+        self.compacting_file = journal_file + ".compacting"
+        self.compact_threshold = compact_threshold
+        # Also wait until the journal is this fraction of the snapshot's size,
+        # so a growing store is not rewritten every compact_threshold bytes
+        self.compact_ratio = compact_ratio
+        self.background = background
+        # durable: fsync the journal after each append (or once per group commit)
+        self.durable = durable
+        # Indentation of the snapshot JSON (None: compact, for machine-only files)
+        self.snapshot_indent = snapshot_indent
+        self._group_depth = 0
+        self._unsynced = False
+        # Held around compaction so no other writer appends meanwhile
+        self._compaction_lock = compaction_lock or nullcontext
+        self.compactions = 0
+
+        self.records: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+        # Only one compaction may own the .compacting file at a time
+        self._compact_lock = threading.Lock()
+        self._journal = None
+        # Bytes of the journal applied to self.records. With other processes
+        # appending, refresh() continues reading from here.
+        self._journal_size = 0
+        # What load() read: a different snapshot or journal file on disk
+        # means another process compacted, so refresh() reloads everything
+        self._snapshot_signature: Optional[Tuple[int, int, int]] = None
+        self._journal_inode: Optional[int] = None
+
+        # Background compaction runs on a daemon thread woken up by an event
+        self._compact_requested = threading.Event()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+
+        self.load()
+
+        if background:
+            self._worker = threading.Thread(target=self._compaction_worker, daemon=True)
+            self._worker.start()
+
+    @staticmethod
+    def _signature(file_path: str) -> Optional[Tuple[int, int, int]]:
+        """Return (inode, mtime_ns, size) for a file, or None if it is missing."""
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    # Startup - replay snapshot, then any interrupted compaction, then the journal
+    def load(self):
+        """Rebuild the in-memory records from snapshot plus journal."""
+        with self._lock:
+            self._snapshot_signature = self._signature(self.snapshot_file)
+            try:
+                with open(self.snapshot_file, 'r') as f:
+                    self.records = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.records = {}
+
+            self._replay(self.compacting_file)
+
+            # (Re)open the journal first, so the file replayed is the one appended to
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self.journal_file, 'a')
+            self._journal_inode = os.fstat(self._journal.fileno()).st_ino
+            self._journal_size, _changes = self._replay(self.journal_file)
+
+    @classmethod
+    def read_records(cls, snapshot_file: str, journal_file: str) -> Dict[str, dict]:
+        """The records a store holds, read without opening (or creating) any file for writing."""
+        store = cls.__new__(cls)
+        try:
+            with open(snapshot_file, 'r') as f:
+                store.records = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            store.records = {}
+        store._replay(journal_file + ".compacting")
+        store._replay(journal_file)
+        return store.records
+
+    def refresh(self) -> Optional[Dict[str, Optional[dict]]]:
+        """Catch up with entries other processes appended since the last look.
+
+        Returns {key: previous value (None if new)} for every record that
+        changed, or None if the store had to be reloaded from scratch
+        because another process compacted it.
+        """
+        with self._lock:
+            journal_signature = self._signature(self.journal_file)
+            if (self._signature(self.snapshot_file) != self._snapshot_signature
+                    or not journal_signature or journal_signature[0] != self._journal_inode):
+                self.load()
+                return None
+            if journal_signature[2] == self._journal_size:
+                return {}
+            self._journal_size, changes = self._replay(self.journal_file, self._journal_size)
+            return changes
+
+    def _replay(self, file_path: str, offset: int = 0) -> Tuple[int, Dict[str, Optional[dict]]]:
+        """Apply every complete entry of a journal file from offset on.
+
+        Returns the offset after the last complete line and the previous
+        value of every record that changed.
+        """
+        changes: Dict[str, Optional[dict]] = {}
+        try:
+            with open(file_path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # still being appended (or torn by a crash)
+                    offset += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn line from a crash mid-append; skip it
+                        continue
+                    key = entry.get('key')
+                    if key not in changes:
+                        changes[key] = self.records.get(key)
+                    self._apply(entry)
+        except FileNotFoundError:
+            pass
+        return offset, changes
+
+    def _apply(self, entry: dict):
+        """Apply a single journal entry to the records."""
+        if entry.get('op') == 'put':
+            self.records[entry['key']] = entry['value']
+        elif entry.get('op') == 'del':
+            self.records.pop(entry['key'], None)
+
+    # Mutations - one appended line each
+    def put(self, key: str, value: dict):
+        """Insert or replace a record."""
+        self._append({'op': 'put', 'key': key, 'value': value})
+
+    def delete(self, key: str) -> bool:
+        """Delete a record. Returns False if it did not exist."""
+        with self._lock:
+            if key not in self.records:
+                return False
+            self._append({'op': 'del', 'key': key})
+            return True
+
+    def _append(self, entry: dict):
+        """Write an entry to the journal and apply it in memory."""
+        line = json.dumps(entry, separators=(',', ':')) + "\n"
+        with self._lock:
+            size = os.fstat(self._journal.fileno()).st_size
+            if size != self._journal_size:
+                # Bytes not applied yet can only be the torn tail of a crashed
+                # append; end that line so it cannot swallow this entry
+                line = "\n" + line
+            self._journal.write(line)
+            self._journal.flush()
+            if self.durable:
+                if self._group_depth:
+                    self._unsynced = True
+                else:
+                    os.fsync(self._journal.fileno())
+            self._journal_size = size + len(line)
+            self._apply(entry)
+            snapshot_size = self._snapshot_signature[2] if self._snapshot_signature else 0
+            needs_compaction = self._journal_size >= max(self.compact_threshold,
+                                                         self.compact_ratio * snapshot_size)
+
+        if needs_compaction:
+            if self.background:
+                self._compact_requested.set()
+            else:
+                self.compact()
+
+    @contextmanager
+    def group_commit(self):
+        """Share one journal fsync between all appends made inside the block."""
+        with self._lock:
+            self._group_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._group_depth -= 1
+                if self._group_depth == 0 and self._unsynced:
+                    self._unsynced = False
+                    os.fsync(self._journal.fileno())
+
+    # Compaction - fold the journal into a fresh snapshot
+    def compact(self):
+        """Write all records to the snapshot and start an empty journal."""
+        with self._compaction_lock(), self._compact_lock:
+            self._compact()
+
+    def _compact(self):
+        """Rotate the journal and write the snapshot (caller holds _compact_lock)."""
+        with self._lock:
+            # Rotate the journal so new writes never wait for the snapshot
+            if self._unsynced:
+                # The rotated journal must be durable before the snapshot replaces it
+                os.fsync(self._journal.fileno())
+                self._unsynced = False
+            self._journal.close()
+            if os.path.exists(self.compacting_file):
+                # Left over from an interrupted compaction; its entries are
+                # already in self.records, so fold it in with this one
+                with open(self.compacting_file, 'a') as old, open(self.journal_file, 'r') as new:
+                    old.write(new.read())
+                os.remove(self.journal_file)
+            else:
+                os.replace(self.journal_file, self.compacting_file)
+            self._journal = open(self.journal_file, 'a')
+            self._journal_inode = os.fstat(self._journal.fileno()).st_ino
+            self._journal_size = 0
+            snapshot = dict(self.records)
+
+        atomic_write_json(self.snapshot_file, snapshot, indent=self.snapshot_indent, fsync=self.durable)
+        os.remove(self.compacting_file)
+        if self.durable:
+            fsync_directory(os.path.dirname(os.path.abspath(self.snapshot_file)))
+        with self._lock:
+            self._snapshot_signature = self._signature(self.snapshot_file)
+            self.compactions += 1
+
+    def _compaction_worker(self):
+        """Compact whenever a writer crosses the size threshold."""
+        while True:
+            self._compact_requested.wait()
+            self._compact_requested.clear()
+            if self._closed:
+                return
+            self.compact()
+
+    def close(self, compact: bool = False):
+        """Stop the background worker and close the journal."""
+        self._closed = True
+        if self._worker:
+            self._compact_requested.set()
+            self._worker.join()
+            self._worker = None
+        if compact:
+            self.compact()
+        with self._lock:
+            if self._journal:
+                self._journal.close()
+                self._journal = None
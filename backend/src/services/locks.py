@@ -0,0 +1,82 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+     # Many concurrent readers or one writer, within one process
+     # Writers are preferred so a steady stream of reads cannot starve them
+    """Readers-writer lock with reentrant reads and writes.
+
+    Usage:
+        with lock.read_locked():
+            ...
+        with lock.write_locked():
+            ...
+
+    A thread holding the write lock may take it (or the read lock) again.
+    A thread holding only the read lock cannot upgrade to the write lock:
+    that raises RuntimeError instead of deadlocking.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer = None     # ident of the thread holding the write lock
+        self._local = threading.local()
+
+    def _read_depth(self) -> int:
+        return getattr(self._local, 'reads', 0)
+
+    def reading(self) -> bool:
+        """True if the current thread holds the read lock."""
+        return self._read_depth() > 0
+
+    @contextmanager
+    def read_locked(self):
+        """Hold the lock shared for the duration of the block."""
+        if self._writer == threading.get_ident():
+            yield  # the writer can read what it is changing
+            return
+
+        with self._cond:
+            # A thread that already reads must not wait for a queued writer,
+            # which would itself be waiting for this thread to finish
+            if not self._read_depth():
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+            self._readers += 1
+            self._local.reads = self._read_depth() + 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                self._local.reads -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        """Hold the lock exclusively for the duration of the block."""
+        me = threading.get_ident()
+        if self._writer == me:
+            yield
+            return
+        if self._read_depth():
+            raise RuntimeError("Cannot take the write lock while holding the read lock")
+
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
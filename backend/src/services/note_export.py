@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from typing import IO, Iterable, Iterator
+
+from models.note import Note
+
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'markdown')
+
+CSV_FIELDS = ['id', 'title', 'content', 'created_at', 'updated_at', 'user_id']
+
+
+def _jsonl_chunks(notes: Iterable[Note]) -> Iterator[str]:
+    for note in notes:
+        yield json.dumps(note.to_dict(), ensure_ascii=False) + "\n"
+
+
+def _csv_chunks(notes: Iterable[Note]) -> Iterator[str]:
+    # One small reusable buffer: csv.writer handles quoting, we hand out each row
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for note in notes:
+        writer.writerow(note.to_dict())
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _markdown_chunks(notes: Iterable[Note]) -> Iterator[str]:
+    for note in notes:
+        yield f"## {note.title}\n\n"
+        yield f"*Created: {note.created_display}*"
+        if note.updated_at:
+            yield f" · *Updated: {note.updated_display}*"
+        yield f"\n\n{note.content}\n\n---\n\n"
+
+
+FORMATTERS = {
+    'jsonl': _jsonl_chunks,
+    'csv': _csv_chunks,
+    'markdown': _markdown_chunks,
+}
+
+
+def format_notes(notes: Iterable[Note], fmt: str) -> Iterator[str]:
+    """Turn a stream of notes into a stream of text chunks in the given format."""
+    formatter = FORMATTERS.get(fmt)
+    if formatter is None:
+        raise ValueError(f"Unsupported export format: {fmt} (use one of: {', '.join(EXPORT_FORMATS)})")
+    return formatter(notes)
+
+
+def write_chunks(chunks: Iterable[str], sink: IO[str]) -> int:
+    """Write text chunks to a sink as they are produced. Returns characters written."""
+    written = 0
+    for chunk in chunks:
+        if chunk:
+            sink.write(chunk)
+            written += len(chunk)
+    return written
@@ -0,0 +1,45 @@
+import csv
+import json
+from typing import IO, Iterator, Union
+
+
+IMPORT_FORMATS = ('jsonl', 'csv')
+
+
+def detect_format(file_name: str) -> str:
+    """Guess the import format from a file name (defaults to jsonl)."""
+    name = file_name.lower()
+    if name.endswith('.gz'):
+        name = name[:-3]
+    return 'csv' if name.endswith('.csv') else 'jsonl'
+
+
+def read_note_rows(stream: IO[str], fmt: str) -> Iterator[Union[dict, ValueError]]:
+    """Yield note rows from a JSON-lines or CSV text stream, one at a time.
+
+    Each row is a dict with 'title', 'content' and optionally 'user_id' and
+    'created_at'. A line that cannot be parsed is yielded as a ValueError
+    instead, so the caller can report it and keep going.
+    """
+    if fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ValueError(f"line {line_number}: invalid JSON ({e.msg})")
+                continue
+            if not isinstance(row, dict):
+                yield ValueError(f"line {line_number}: expected a JSON object")
+                continue
+            yield row
+    elif fmt == 'csv':
+        # Expects a header row: title,content[,user_id][,created_at]
+        for row in csv.DictReader(stream):
+            yield {
+                key: value for key, value in row.items()
+                if key is not None and value not in (None, '')
+            }
+    else:
+        raise ValueError(f"Unsupported import format: {fmt} (use one of: {', '.join(IMPORT_FORMATS)})")
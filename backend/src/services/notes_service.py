@@ -1,23 +1,32 @@
-from typing import List, Optional
-from datetime import datetime
+import os
+from typing import IO, Iterable, List, Optional, Tuple, Union
 
-from models.note import Note
+from models.note import Note, now_timestamp, to_timestamp
 from models.user import User
+from models.validation import validate_many
 from services.data_service import DataService
+from services.search_index import SearchIndex
+from services.note_export import format_notes, write_chunks
 
 
 class NotesService:
      # Note-specific operations and user-note association
     """Service for handling notes business logic."""
     
-    def __init__(self, data_service: DataService):
+    DEFAULT_PAGE_SIZE = 20
+    
+    def __init__(self, data_service: DataService, search_index: Optional[SearchIndex] = None):
         self.data_service = data_service
+        # Full-text index kept next to the data files, updated on every change
+        self.search_index = search_index or SearchIndex(
+            os.path.join(data_service.data_dir, "search_index")
+        )
     
     # Note creation method - creates a new note
     def create_note(self, title: str, content: str, user_id: int) -> Note:
         """Create a new note."""
         note_id = self.data_service.get_next_note_id()
-        created_at = datetime.now().strftime('%d/%m/%y %H:%M:%S')
+        created_at = now_timestamp()
         
         note = Note(
             id=note_id,
@@ -27,12 +36,79 @@ class NotesService:
             user_id=user_id
         )
         
-        return self.data_service.save_note(note)
+        note = self.data_service.save_note(note)
+        self.search_index.add_note(note)
+        return note
+    
+    # Bulk creation method - validates rows, one ID block, one write
+    def bulk_create_notes(self, rows: Iterable[Union[dict, Exception]],
+                          user_id: Optional[int] = None, strict: bool = False) -> dict:
+        """Create many notes at once.
+        
+        rows yields dicts with 'title', 'content' and optionally 'user_id'
+        (defaults to user_id) and 'created_at'. Rows that are exceptions
+        (e.g. unparseable lines from read_note_rows) or belong to a user
+        that does not exist count as errors.
+        
+        Every row is validated before anything is written; invalid rows are
+        skipped and reported, or abort the import if strict. All note IDs
+        are reserved as one block and all notes are committed with a single
+        write. Returns {'created': count, 'errors': [(row_number, message)]}.
+        """
+        records = []
+        row_numbers = []
+        errors = []
+        now = now_timestamp()
+        # user_id -> whether that user exists, looked up once per import
+        owners_exist = {}
+        
+        # Normalize every row into a note record...
+        for row_number, row in enumerate(rows, start=1):
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                owner = row.get('user_id', user_id)
+                if owner is None:
+                    raise ValueError("No user_id given")
+                owner = int(owner)
+                if owner not in owners_exist:
+                    owners_exist[owner] = self.data_service.get_user_by_id(owner) is not None
+                if not owners_exist[owner]:
+                    raise ValueError(f"User {owner} does not exist")
+                created_at = to_timestamp(row.get('created_at'))
+                records.append({
+                    'id': 0,  # real IDs are assigned once all rows are validated
+                    'title': str(row.get('title') or '').strip(),
+                    'content': str(row.get('content') or '').strip(),
+                    'created_at': now if created_at is None else created_at,
+                    'user_id': owner
+                })
+                row_numbers.append(row_number)
+            except (ValueError, TypeError) as e:
+                errors.append((row_number, str(e)))
+        
+        # ...then check all records in one batch; the valid ones need no
+        # further validation when they become Notes
+        invalid = dict(validate_many(records, 'note'))
+        errors.extend((row_numbers[index], message) for index, message in invalid.items())
+        errors.sort()
+        if errors and strict:
+            row_number, message = errors[0]
+            raise ValueError(f"Row {row_number}: {message}")
+        pending = [Note.from_storage(record) for index, record in enumerate(records) if index not in invalid]
+        
+        if pending:
+            for note, note_id in zip(pending, self.data_service.reserve_note_ids(len(pending))):
+                note.id = note_id
+            self.data_service.save_notes(pending)
+            self.search_index.add_notes(pending)
+        
+        return {'created': len(pending), 'errors': errors}
     
     # Single note retrieval method - returns a single note (with ownership check)
     def get_note(self, note_id: int, user_id: int) -> Optional[Note]:
         """Get a note by ID, ensuring it belongs to the user."""
-        note = self.data_service.get_note_by_id(note_id)
+        note = self.data_service.get_note_by_id(note_id, user_id)
         if note and note.user_id == user_id:
             return note
         return None
@@ -42,13 +118,53 @@ class NotesService:
         """Get all notes for a user."""
         return self.data_service.get_notes_by_user(user_id)
     
+    # Paginated listing method - one page at a time, keyset on (created_at, id)
+    def list_notes(self, user_id: int, limit: int = DEFAULT_PAGE_SIZE,
+                   after_cursor: Optional[str] = None) -> dict:
+        """Get one page of a user's notes, newest first.
+        
+        Pass the previous page's next_cursor as after_cursor to get the next
+        page. Cursors are positions, not offsets: pages stay stable when
+        notes are added or deleted meanwhile. Returns
+        {'notes': [...], 'next_cursor': str or None on the last page}.
+        """
+        if limit < 1:
+            raise ValueError("Page size must be at least 1")
+        after = self.parse_cursor(after_cursor) if after_cursor else None
+        # One extra note tells whether another page follows
+        notes = self.data_service.get_notes_page(user_id, limit + 1, after)
+        next_cursor = self.note_cursor(notes[limit - 1]) if len(notes) > limit else None
+        return {'notes': notes[:limit], 'next_cursor': next_cursor}
+    
+    @staticmethod
+    def note_cursor(note: Note) -> str:
+        """Cursor pointing just past a note in the listing."""
+        return f"{note.created_at}:{note.id}"
+    
+    @staticmethod
+    def parse_cursor(cursor: str) -> Tuple[int, int]:
+        """Turn a cursor back into the (created_at, id) key it points past."""
+        try:
+            created_at, note_id = cursor.split(":")
+            return int(created_at), int(note_id)
+        except ValueError:
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+    
+    # Time range retrieval method - e.g. notes from last week
+    def get_notes_between(self, user_id: int, start: Optional[int] = None,
+                          end: Optional[int] = None) -> List[Note]:
+        """Get a user's notes created in [start, end] (epoch seconds), newest first."""
+        return self.data_service.get_notes_by_user_between(user_id, start, end)
+    
     # Note title update method - updates a note's title
     def update_note_title(self, note_id: int, new_title: str, user_id: int) -> Optional[Note]:
         """Update a note's title."""
         note = self.get_note(note_id, user_id)
         if note:
             note.update_title(new_title.strip())
-            return self.data_service.save_note(note)
+            note = self.data_service.save_note(note)
+            self.search_index.add_note(note)
+            return note
         return None
     
     # Note content update method - updates a note's content
@@ -57,31 +173,61 @@ class NotesService:
         note = self.get_note(note_id, user_id)
         if note:
             note.update_content(new_content.strip())
-            return self.data_service.save_note(note)
+            note = self.data_service.save_note(note)
+            self.search_index.add_note(note)
+            return note
         return None
     
     # Note deletion method - deletes a note (with ownership check)
     def delete_note(self, note_id: int, user_id: int) -> bool:
         """Delete a note, ensuring it belongs to the user."""
         note = self.get_note(note_id, user_id)
-        if note:
-            return self.data_service.delete_note(note_id)
+        if note and self.data_service.delete_note(note_id):
+            self.search_index.remove_note(user_id, note_id)
+            return True
         return False
     
     # Note search method - searches notes by title or content
     def search_notes(self, query: str, user_id: int) -> List[Note]:
-        """Search notes by title or content."""
-        user_notes = self.get_user_notes(user_id)
-        query_lower = query.lower()
+        """Search notes by title or content.
+        
+        Every word of the query must start a word of the note's title or
+        content. Results are ranked by relevance (BM25), best first.
+        """
+        if not query or not query.strip():
+            return self.get_user_notes(user_id)
+        
+        # First search in this process: catch up with notes changed elsewhere
+        if not self.search_index.is_synced(user_id):
+            self.search_index.sync(user_id, self.data_service.iter_notes_by_user(user_id))
         
         matching_notes = []
-        for note in user_notes:
-            if (query_lower in note.title.lower() or 
-                query_lower in note.content.lower()):
+        for note_id, _score in self.search_index.search(user_id, query):
+            note = self.get_note(note_id, user_id)
+            if note:
                 matching_notes.append(note)
         
         return matching_notes
     
+    # Note export method - streams a user's notes to a text sink
+    def export_notes(self, user_id: int, fmt: str, sink: IO[str]) -> int:
+        """Export a user's notes (oldest first) as jsonl, csv or markdown.
+        
+        Notes are read, formatted and written one at a time, so memory use
+        does not grow with the number of notes. Returns the number exported.
+        """
+        exported = 0
+        
+        def counted(notes):
+            nonlocal exported
+            for note in notes:
+                exported += 1
+                yield note
+        
+        notes = self.data_service.iter_notes_by_user(user_id, newest_first=False)
+        write_chunks(format_notes(counted(notes), fmt), sink)
+        return exported
+    
     # Note summary method - returns a summary of user's notes.
     def get_notes_summary(self, user_id: int) -> dict:
         """Get a summary of user's notes."""
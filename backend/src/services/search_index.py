@@ -0,0 +1,323 @@
+import bisect
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.note import Note
+from services.file_io import atomic_write_json, file_lock
+from services.journal_store import JournalStore
+
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class _UserIndex:
+     # In-memory inverted index for one user's notes
+     # docs: forward index (note_id -> term frequencies), used to undo a note's postings
+     # postings: term -> {note_id: term frequency}
+     # terms: sorted vocabulary, so prefix lookups are two binary searches
+    """Inverted index over the notes of a single user."""
+
+    def __init__(self):
+        self.docs: Dict[int, Dict[str, int]] = {}
+        self.stamps: Dict[int, Optional[int]] = {}
+        self.lengths: Dict[int, int] = {}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.terms: List[str] = []
+        self.total_length = 0
+
+    def add(self, note_id: int, term_freqs: Dict[str, int], stamp: Optional[int]):
+        """Index a document, replacing any previous version of it."""
+        self.remove(note_id)
+        self.docs[note_id] = term_freqs
+        self.stamps[note_id] = stamp
+        length = sum(term_freqs.values())
+        self.lengths[note_id] = length
+        self.total_length += length
+        for term, freq in term_freqs.items():
+            posting = self.postings.get(term)
+            if posting is None:
+                posting = self.postings[term] = {}
+                bisect.insort(self.terms, term)
+            posting[note_id] = freq
+
+    def remove(self, note_id: int) -> bool:
+        """Remove a document. Returns False if it was not indexed."""
+        term_freqs = self.docs.pop(note_id, None)
+        if term_freqs is None:
+            return False
+        self.stamps.pop(note_id, None)
+        self.total_length -= self.lengths.pop(note_id, 0)
+        for term in term_freqs:
+            posting = self.postings[term]
+            del posting[note_id]
+            if not posting:
+                del self.postings[term]
+                del self.terms[bisect.bisect_left(self.terms, term)]
+        return True
+
+    def expand(self, prefix: str) -> List[str]:
+        """Return every indexed term starting with prefix."""
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + '\U0010ffff')
+        return self.terms[start:end]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> '_UserIndex':
+        """Rebuild an index from its serialized forward index."""
+        index = cls()
+        postings = index.postings
+        for note_id, doc in data.get('docs', {}).items():
+            note_id = int(note_id)
+            term_freqs = doc['terms']
+            index.docs[note_id] = term_freqs
+            index.stamps[note_id] = doc.get('stamp')
+            length = sum(term_freqs.values())
+            index.lengths[note_id] = length
+            index.total_length += length
+            for term, freq in term_freqs.items():
+                postings.setdefault(term, {})[note_id] = freq
+        index.terms = sorted(postings)  # one sort, not an insort per term
+        return index
+
+
+class SearchIndex:
+     # Persistent full-text index: per user, a snapshot of the forward index
+     # (<user_id>.snapshot.json) and a journal of changes since (<user_id>.journal)
+     # Kept up to date incrementally by NotesService on every note change
+    """Token-level inverted index with prefix matching and BM25 ranking."""
+
+    # BM25 tuning constants (standard defaults)
+    K1 = 1.2
+    B = 0.75
+
+    # Journal bytes before it is folded into the snapshot: at least this, and
+    # at least half the snapshot, so rewriting a big index stays rare
+    COMPACT_THRESHOLD = 256 * 1024
+    COMPACT_RATIO = 0.5
+
+    def __init__(self, index_dir: str):
+        self.index_dir = index_dir
+        os.makedirs(index_dir, exist_ok=True)
+        # user_id -> (that user's store, index built from its records)
+        self._indexes: Dict[int, Tuple[JournalStore, _UserIndex]] = {}
+        # Users whose index has been checked against stored notes in this process
+        self._synced: Set[int] = set()
+        # Threads share the in-memory indexes; writers in other processes
+        # are kept out of a journal while it is appended to or compacted
+        self._lock = threading.RLock()
+        self.lock_file = os.path.join(index_dir, "index.lock")
+
+    # Persistence helpers
+    def _snapshot_file(self, user_id: int) -> str:
+        return os.path.join(self.index_dir, f"{user_id}.snapshot.json")
+
+    def _journal_file(self, user_id: int) -> str:
+        return os.path.join(self.index_dir, f"{user_id}.journal")
+
+    def _legacy_file(self, user_id: int) -> str:
+        """Whole index rewritten on every change (older versions)."""
+        return os.path.join(self.index_dir, f"{user_id}.json")
+
+    def _open(self, user_id: int) -> Tuple[JournalStore, _UserIndex]:
+        """Get a user's store and index, caught up with other processes' changes."""
+        entry = self._indexes.get(user_id)
+        if entry:
+            store, index = entry
+            changes = store.refresh()
+            if changes is None:
+                # Another process compacted: rebuild from the new snapshot
+                index = _UserIndex.from_dict({'docs': store.records})
+                self._indexes[user_id] = (store, index)
+            else:
+                for key in changes:
+                    index.remove(int(key))
+                    doc = store.records.get(key)
+                    if doc:
+                        index.add(int(key), doc['terms'], doc.get('stamp'))
+            return store, index
+
+        snapshot_file = self._snapshot_file(user_id)
+        self._convert_legacy(user_id, snapshot_file)
+        store = JournalStore(
+            snapshot_file, self._journal_file(user_id),
+            compact_threshold=self.COMPACT_THRESHOLD, compact_ratio=self.COMPACT_RATIO,
+            durable=False,  # the index can always be rebuilt from the notes
+            snapshot_indent=None
+        )
+        index = _UserIndex.from_dict({'docs': store.records})
+        self._indexes[user_id] = (store, index)
+        return store, index
+
+    def _convert_legacy(self, user_id: int, snapshot_file: str):
+        """Turn an index file written by an older version into a snapshot, once."""
+        legacy_file = self._legacy_file(user_id)
+        if not os.path.exists(legacy_file):
+            return
+        with file_lock(self.lock_file):
+            if not os.path.exists(legacy_file):
+                return
+            if not os.path.exists(snapshot_file):
+                try:
+                    with open(legacy_file, 'r') as f:
+                        docs = json.load(f).get('docs', {})
+                except (json.JSONDecodeError, AttributeError):
+                    docs = {}  # sync() reindexes whatever is missing
+                atomic_write_json(snapshot_file, docs, indent=None, fsync=False)
+            os.remove(legacy_file)
+
+    def _get(self, user_id: int) -> _UserIndex:
+        """Get a user's index, caught up with other processes' changes."""
+        return self._open(user_id)[1]
+
+    @staticmethod
+    def _analyze(note: Note) -> Dict[str, int]:
+        """Term frequencies for a note's title and content."""
+        return dict(Counter(tokenize(note.title) + tokenize(note.content)))
+
+    @staticmethod
+    def _stamp(note: Note) -> Optional[int]:
+        """Version marker used to detect notes changed behind the index."""
+        return note.updated_at or note.created_at
+
+    def _put(self, store: JournalStore, index: _UserIndex, note_id: int,
+             term_freqs: Dict[str, int], stamp: Optional[int]):
+        """Index a note and journal it (caller holds the locks)."""
+        index.add(note_id, term_freqs, stamp)
+        store.put(str(note_id), {'stamp': stamp, 'terms': term_freqs})
+
+    def _delete(self, store: JournalStore, index: _UserIndex, note_id: int) -> bool:
+        """Unindex a note and journal it (caller holds the locks)."""
+        store.delete(str(note_id))
+        return index.remove(note_id)
+
+    # Incremental maintenance - one journal line per change
+    def add_note(self, note: Note):
+        """Index a new note or re-index an updated one."""
+        term_freqs = self._analyze(note)
+        with self._lock, file_lock(self.lock_file):
+            store, index = self._open(note.user_id)
+            self._put(store, index, note.id, term_freqs, self._stamp(note))
+
+    def add_notes(self, notes: Iterable[Note]):
+        """Index many notes."""
+        analyzed = [(note, self._analyze(note)) for note in notes]
+        with self._lock, file_lock(self.lock_file):
+            for note, term_freqs in analyzed:
+                store, index = self._open(note.user_id)
+                self._put(store, index, note.id, term_freqs, self._stamp(note))
+
+    def remove_note(self, user_id: int, note_id: int):
+        """Remove a note from its owner's index."""
+        with self._lock, file_lock(self.lock_file):
+            store, index = self._open(user_id)
+            self._delete(store, index, note_id)
+
+    def drop_user(self, user_id: int):
+        """Delete a user's whole index."""
+        with self._lock, file_lock(self.lock_file):
+            entry = self._indexes.pop(user_id, None)
+            if entry:
+                entry[0].close()
+            self._synced.discard(user_id)
+            journal_file = self._journal_file(user_id)
+            for file_path in (self._snapshot_file(user_id), journal_file,
+                              journal_file + ".compacting", self._legacy_file(user_id)):
+                try:
+                    os.remove(file_path)
+                except FileNotFoundError:
+                    pass
+
+    def sync(self, user_id: int, notes: Iterable[Note]):
+        """Reconcile a user's index with the notes actually stored.
+
+        Only notes that are missing, stale or gone are (re)indexed, so this is
+        cheap when the index is already up to date.
+
+        notes is consumed under the index lock. Pass a lazy iterable (e.g.
+        DataService.iter_notes_by_user) so a note saved and indexed by another
+        thread cannot fall between reading the notes and reconciling them.
+        """
+        with self._lock, file_lock(self.lock_file):
+            store, index = self._open(user_id)
+            seen = set()
+            for note in notes:
+                seen.add(note.id)
+                stamp = self._stamp(note)
+                if note.id not in index.docs or index.stamps.get(note.id) != stamp:
+                    self._put(store, index, note.id, self._analyze(note), stamp)
+            for note_id in [note_id for note_id in index.docs if note_id not in seen]:
+                self._delete(store, index, note_id)
+            self._synced.add(user_id)
+
+    def close(self):
+        """Close every open journal."""
+        with self._lock:
+            for store, _index in self._indexes.values():
+                store.close()
+            self._indexes.clear()
+
+    def is_synced(self, user_id: int) -> bool:
+        """True once sync() has run for this user in this process."""
+        return user_id in self._synced
+
+    # Querying
+    def search(self, user_id: int, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Find notes containing every query term (as a word prefix).
+
+        Returns (note_id, score) pairs ranked by BM25, best first.
+        """
+        query_terms = tokenize(query)
+        if not query_terms:
+            return []
+
+        with self._lock:
+            return self._search(self._get(user_id), query_terms, limit)
+
+    def _search(self, index: _UserIndex, query_terms: List[str],
+                limit: Optional[int]) -> List[Tuple[int, float]]:
+        """Rank one user's notes for the query terms (caller holds the lock)."""
+        doc_count = len(index.docs)
+        if doc_count == 0:
+            return []
+        avg_length = index.total_length / doc_count
+
+        # Each query term matches the union of postings of the terms it prefixes
+        matches = []
+        for query_term in dict.fromkeys(query_terms):
+            expanded = index.expand(query_term)
+            if not expanded:
+                return []
+            matches.append(expanded)
+
+        # AND: intersect candidate sets, smallest first
+        candidate_sets = []
+        for expanded in matches:
+            docs = set()
+            for term in expanded:
+                docs.update(index.postings[term])
+            candidate_sets.append(docs)
+        candidate_sets.sort(key=len)
+        candidates = candidate_sets[0].intersection(*candidate_sets[1:])
+
+        scores: Dict[int, float] = {}
+        for expanded in matches:
+            for term in expanded:
+                posting = index.postings[term]
+                idf = math.log(1 + (doc_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                for note_id in candidates.intersection(posting):
+                    freq = posting[note_id]
+                    norm = self.K1 * (1 - self.B + self.B * index.lengths[note_id] / avg_length)
+                    scores[note_id] = scores.get(note_id, 0.0) + idf * freq * (self.K1 + 1) / (freq + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -item[0]))
+        return ranked[:limit] if limit is not None else ranked
@@ -0,0 +1,371 @@
+import json
+import os
+import sqlite3
+from typing import Iterator, List, Optional, Tuple
+
+from models.user import User
+from models.note import Note, to_timestamp
+from services.content_store import ContentStore
+from services.data_service import DataService
+from services.journal_store import JournalStore
+
+
+class SQLiteDataService:
+     # Drop-in alternative to DataService backed by the stdlib sqlite3 module
+     # File management: notes.db (plus -wal/-shm files while open)
+    """Service for handling data persistence with SQLite."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            surname TEXT NOT NULL,
+            birthday TEXT NOT NULL,
+            favorite_color TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS notes (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER,
+            user_id INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_notes_user_id ON notes (user_id);
+        CREATE INDEX IF NOT EXISTS idx_notes_created_at ON notes (created_at);
+        CREATE INDEX IF NOT EXISTS idx_notes_user_created ON notes (user_id, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_users_name_lower ON users (lower(name));
+        INSERT OR IGNORE INTO counters (name, value) VALUES ('user_id_counter', 0);
+        INSERT OR IGNORE INTO counters (name, value) VALUES ('note_id_counter', 0);
+    """
+
+    # Bumped (PRAGMA user_version) whenever existing databases need upgrading
+    SCHEMA_VERSION = 1
+
+    USER_COLUMNS = "id, name, surname, birthday, favorite_color"
+    NOTE_COLUMNS = "id, title, content, created_at, updated_at, user_id"
+
+    def __init__(self, data_dir: str = "data", db_name: str = "notes.db"):
+        self.data_dir = data_dir
+        self.db_file = os.path.join(data_dir, db_name)
+
+        # Create data directory if it doesn't exist
+        os.makedirs(data_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.row_factory = sqlite3.Row
+        # WAL lets readers run while a writer commits
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._upgrade_schema()
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def _upgrade_schema(self):
+        """Bring databases created by older versions up to SCHEMA_VERSION."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # v1: created_at/updated_at become epoch integers instead of
+            # 'DD/MM/YY HH:MM:SS' text, so they sort correctly.
+            # Every row is converted before the schema is touched, so a value
+            # that cannot be converted leaves the database as it was.
+            rows = []
+            for row in self.conn.execute(f"SELECT {self.NOTE_COLUMNS} FROM notes"):
+                try:
+                    created_at = to_timestamp(row['created_at'])
+                    updated_at = to_timestamp(row['updated_at'])
+                    if created_at is None:
+                        raise ValueError("created_at is missing")
+                except ValueError as e:
+                    raise ValueError(f"Cannot upgrade {self.db_file}, note {row['id']}: {e}")
+                rows.append((row['id'], row['title'], row['content'],
+                             created_at, updated_at, row['user_id']))
+
+            # One explicit transaction around the rebuild, DDL included
+            # (executescript would commit), so a crash or error midway
+            # leaves the old table in place
+            self.conn.execute("BEGIN")
+            try:
+                self.conn.execute("DROP TABLE notes")
+                for statement in self.SCHEMA.split(";"):
+                    if statement.strip():
+                        self.conn.execute(statement)
+                self.conn.executemany(
+                    f"INSERT INTO notes ({self.NOTE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)", rows
+                )
+                self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    # Row conversion helpers
+    @staticmethod
+    def _row_to_user(row: Optional[sqlite3.Row]) -> Optional[User]:
+        return User.from_storage(dict(row)) if row else None
+
+    @staticmethod
+    def _row_to_note(row: Optional[sqlite3.Row]) -> Optional[Note]:
+        return Note.from_storage(dict(row)) if row else None
+
+    # ID Management - ensures unique IDs for users and notes
+    def _next_counter(self, name: str, count: int = 1) -> int:
+        """Increase a counter by count and return its new value."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE counters SET value = value + ? WHERE name = ?", (count, name)
+            )
+            row = self.conn.execute(
+                "SELECT value FROM counters WHERE name = ?", (name,)
+            ).fetchone()
+        return row['value']
+
+    def get_next_user_id(self) -> int:
+        """Get the next available user ID."""
+        return self._next_counter('user_id_counter')
+
+    def get_next_note_id(self) -> int:
+        """Get the next available note ID."""
+        return self._next_counter('note_id_counter')
+
+    def reserve_note_ids(self, count: int) -> range:
+        """Get count consecutive note IDs at once (for bulk creation)."""
+        last_id = self._next_counter('note_id_counter', count)
+        return range(last_id - count + 1, last_id + 1)
+
+    # User CRUD operations - Create, Read, Update, Delete
+    def save_user(self, user: User) -> User:
+        """Save a user to the database."""
+        with self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO users ({self.USER_COLUMNS}) "
+                "VALUES (:id, :name, :surname, :birthday, :favorite_color)",
+                user.to_dict()
+            )
+        return user
+
+    def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """Get a user by ID."""
+        row = self.conn.execute(
+            f"SELECT {self.USER_COLUMNS} FROM users WHERE id = ?", (user_id,)
+        ).fetchone()
+        return self._row_to_user(row)
+
+    def get_user_by_name(self, name: str) -> Optional[User]:
+        """Get a user by name."""
+        # lower(name) matches the expression index idx_users_name_lower
+        row = self.conn.execute(
+            f"SELECT {self.USER_COLUMNS} FROM users WHERE lower(name) = lower(?) "
+            "ORDER BY id LIMIT 1", (name,)
+        ).fetchone()
+        return self._row_to_user(row)
+
+    def get_all_users(self) -> List[User]:
+        """Get all users."""
+        rows = self.conn.execute(f"SELECT {self.USER_COLUMNS} FROM users ORDER BY id")
+        return [self._row_to_user(row) for row in rows]
+
+    def delete_user(self, user_id: int) -> bool:
+        """Delete a user by ID."""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
+            if cursor.rowcount == 0:
+                return False
+            # Also delete user's notes (same transaction)
+            self.conn.execute("DELETE FROM notes WHERE user_id = ?", (user_id,))
+        return True
+
+    # Note CRUD operations - Create, Read, Update, Delete
+    def save_note(self, note: Note) -> Note:
+        """Save a note to the database."""
+        with self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO notes ({self.NOTE_COLUMNS}) "
+                "VALUES (:id, :title, :content, :created_at, :updated_at, :user_id)",
+                note.to_dict()
+            )
+        return note
+
+    def save_notes(self, notes: List[Note]) -> List[Note]:
+        """Save many notes in a single transaction."""
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO notes ({self.NOTE_COLUMNS}) "
+                "VALUES (:id, :title, :content, :created_at, :updated_at, :user_id)",
+                (note.to_dict() for note in notes)
+            )
+        return notes
+
+    def get_note_by_id(self, note_id: int, user_id: Optional[int] = None) -> Optional[Note]:
+        """Get a note by ID (with user_id, only if it is that user's note)."""
+        if user_id is None:
+            row = self.conn.execute(
+                f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE id = ?", (note_id,)
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE id = ? AND user_id = ?", (note_id, user_id)
+            ).fetchone()
+        return self._row_to_note(row)
+
+    def get_notes_by_user(self, user_id: int) -> List[Note]:
+        """Get all notes for a specific user."""
+        rows = self.conn.execute(
+            f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE user_id = ? "
+            "ORDER BY created_at DESC, id DESC", (user_id,)
+        )
+        return [self._row_to_note(row) for row in rows]
+
+    def iter_notes_by_user(self, user_id: int, newest_first: bool = True) -> Iterator[Note]:
+        """Yield a user's notes one at a time straight from the cursor."""
+        order = "DESC" if newest_first else "ASC"
+        cursor = self.conn.execute(
+            f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE user_id = ? "
+            f"ORDER BY created_at {order}, id {order}", (user_id,)
+        )
+        for row in cursor:
+            yield self._row_to_note(row)
+
+    def get_notes_by_user_between(self, user_id: int, start: Optional[int] = None,
+                                  end: Optional[int] = None) -> List[Note]:
+        """Get a user's notes created in [start, end] (epoch seconds), newest first."""
+        rows = self.conn.execute(
+            f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE user_id = ? "
+            "AND created_at >= COALESCE(?, created_at) AND created_at <= COALESCE(?, created_at) "
+            "ORDER BY created_at DESC, id DESC", (user_id, start, end)
+        )
+        return [self._row_to_note(row) for row in rows]
+
+    def get_notes_page(self, user_id: int, limit: int,
+                       after: Optional[Tuple[int, int]] = None) -> List[Note]:
+        """Get up to limit of a user's notes, newest first, after a keyset position."""
+        if after is None:
+            rows = self.conn.execute(
+                f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE user_id = ? "
+                "ORDER BY created_at DESC, id DESC LIMIT ?", (user_id, limit)
+            )
+        else:
+            rows = self.conn.execute(
+                f"SELECT {self.NOTE_COLUMNS} FROM notes WHERE user_id = ? "
+                "AND (created_at < ? OR (created_at = ? AND id < ?)) "
+                "ORDER BY created_at DESC, id DESC LIMIT ?",
+                (user_id, after[0], after[0], after[1], limit)
+            )
+        return [self._row_to_note(row) for row in rows]
+
+    def get_all_notes(self) -> List[Note]:
+        """Get all notes."""
+        rows = self.conn.execute(f"SELECT {self.NOTE_COLUMNS} FROM notes ORDER BY id")
+        return [self._row_to_note(row) for row in rows]
+
+    def delete_note(self, note_id: int) -> bool:
+        """Delete a note by ID."""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+        return cursor.rowcount > 0
+
+    def delete_notes_by_user(self, user_id: int) -> int:
+        """Delete all notes for a specific user. Returns count of deleted notes."""
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM notes WHERE user_id = ?", (user_id,))
+        return cursor.rowcount
+
+    # Migration - one-shot import of the JSON files written by DataService
+    def migrate_from_json(self, json_dir: Optional[str] = None, storage: Optional[str] = None) -> dict:
+        """Import the users, notes and counters written by DataService into the database.
+
+        Every notes layout migrates: notes.json, notes.json plus
+        notes.journal, the per-user shards in notes/ and contents kept in
+        notes.content. storage names the layout (see
+        DataService.detect_storage, used when it is None). The source files
+        are only read: nothing in json_dir is created, changed or renamed.
+
+        Runs once per database; later calls return without touching it.
+        Returns the number of imported users and notes.
+        """
+        json_dir = json_dir or self.data_dir
+        storage = storage or DataService.detect_storage(json_dir)
+
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+            return {'users': 0, 'notes': 0}
+
+        def load(file_name: str) -> dict:
+            try:
+                with open(os.path.join(json_dir, file_name), 'r') as f:
+                    return json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                return {}
+
+        users = load("users.json")
+        counters = load("counters.json")
+        notes = self._read_json_notes(json_dir, storage)
+
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO users ({self.USER_COLUMNS}) "
+                "VALUES (:id, :name, :surname, :birthday, :favorite_color)",
+                (User.from_dict(data).to_dict() for data in users.values())
+            )
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO notes ({self.NOTE_COLUMNS}) "
+                "VALUES (:id, :title, :content, :created_at, :updated_at, :user_id)",
+                # from_dict validates and converts legacy string timestamps
+                (Note.from_dict(note_data).to_dict() for note_data in notes)
+            )
+            # Never hand out an ID that already exists in the imported data
+            for name, table in (('user_id_counter', 'users'), ('note_id_counter', 'notes')):
+                self.conn.execute(
+                    f"UPDATE counters SET value = MAX(value, ?, "
+                    f"(SELECT COALESCE(MAX(id), 0) FROM {table})) WHERE name = ?",
+                    (counters.get(name, 0), name)
+                )
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('json_migrated', ?)",
+                (os.path.abspath(json_dir),)
+            )
+
+        return {'users': len(users), 'notes': len(notes)}
+
+    @staticmethod
+    def _read_json_notes(json_dir: str, storage: str) -> List[dict]:
+        """Every note record of a DataService directory, with its content inline."""
+        # notes.json plus any journal; with sharded storage these are notes
+        # not moved into the shards yet, and the shards take precedence
+        records = JournalStore.read_records(os.path.join(json_dir, "notes.json"),
+                                            os.path.join(json_dir, "notes.journal"))
+        notes_dir = os.path.join(json_dir, "notes")
+        if storage == "sharded" and os.path.isdir(notes_dir):
+            for file_name in sorted(os.listdir(notes_dir)):
+                if not file_name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(notes_dir, file_name), 'r') as f:
+                        records.update(json.load(f))
+                except (FileNotFoundError, json.JSONDecodeError):
+                    pass
+
+        content_file = os.path.join(json_dir, "notes.content")
+        content = None
+        notes = []
+        try:
+            for note_data in records.values():
+                if 'content_ref' in note_data:
+                    if content is None:
+                        content = ContentStore(content_file, read_only=True)
+                    note_data = dict(note_data, content=content.read(note_data['content_ref']))
+                notes.append(note_data)
+        finally:
+            if content:
+                content.close()
+        return notes
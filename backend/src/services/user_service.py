@@ -1,14 +1,20 @@
+import os
 from typing import Optional, List
 from models.user import User
 from services.data_service import DataService
+from services.search_index import SearchIndex
 
 
 class UserService:
      # User-specific operations and validation
     """Service for handling user business logic."""
     
-    def __init__(self, data_service: DataService):
+    def __init__(self, data_service: DataService, search_index: Optional[SearchIndex] = None):
         self.data_service = data_service
+        # The notes' full-text index (share NotesService's): dropped with the user
+        self.search_index = search_index or SearchIndex(
+            os.path.join(data_service.data_dir, "search_index")
+        )
     
      # User creation with validation
     def create_user(self, name: str, surname: str, birthday: str, favorite_color: str) -> User:
@@ -73,4 +79,7 @@ class UserService:
     # User deletion and cleanup method - deletes a user and all their notes
     def delete_user(self, user_id: int) -> bool:
         """Delete a user and all their notes."""
-        return self.data_service.delete_user(user_id) 
\ No newline at end of file
+        if not self.data_service.delete_user(user_id):
+            return False
+        self.search_index.drop_user(user_id)
+        return True 
\ No newline at end of file
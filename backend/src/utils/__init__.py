@@ -5,14 +5,19 @@ Contains utility functions and helpers:
 - InputValidator: Input validation functions
 - DisplayHelper: Display formatting functions
 - InputHelper: User input handling functions
+- lazy_import: Deferred imports for heavy modules
+- pacing: Configurable pauses for transient UI messages
 """
 
 from .helpers import (
     InputValidator, DisplayHelper, InputHelper,
     pause, clear_screen
 )
+from .lazy_import import LazyObject, lazy_import
+from .pacing import PACING_MODES, Pacer, pacer, resolve_pacing_mode
 
 __all__ = [
     'InputValidator', 'DisplayHelper', 'InputHelper',
-    'pause', 'clear_screen'
+    'pause', 'clear_screen', 'LazyObject', 'lazy_import',
+    'PACING_MODES', 'Pacer', 'pacer', 'resolve_pacing_mode'
 ] 
\ No newline at end of file
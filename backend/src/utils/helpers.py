@@ -1,8 +1,8 @@
-import re
-import time
 from typing import List, Optional
 from colorama import Fore, Style, init
-from tabulate import tabulate
+
+from models.validation import VALID_COLORS, birthday_problem, color_problem, name_problem
+from .pacing import pacer
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
@@ -15,34 +15,25 @@ class InputValidator:
     def validate_name(name: str) -> bool:
         # Letters and spaces only
         """Validate that a name contains only letters and spaces."""
-        return bool(name and name.replace(' ', '').isalpha())
+        return name_problem(name) is None
     
     @staticmethod
     def validate_birthday(birthday: str) -> bool:
         # DD-MM-YYYY or DD/MM/YYYY format checking
         """Validate birthday format (DD-MM-YYYY or DD/MM/YYYY)."""
-        pattern1 = re.compile(r'^\d{2}-\d{2}-\d{4}$')
-        pattern2 = re.compile(r'^\d{2}/\d{2}/\d{4}$')
-        return bool(pattern1.match(birthday) or pattern2.match(birthday))
+        return birthday_problem(birthday) is None
     
     @staticmethod
     def validate_color(color: str) -> bool:
-        # Predefined list of valid colors
+        # Same color table as the User model (models.validation)
         """Validate that color is in the accepted list."""
-        valid_colors = [
-            'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink',
-            'brown', 'black', 'white', 'gray', 'grey', 'cyan', 'magenta'
-        ]
-        return color.lower() in valid_colors
+        return color_problem(color) is None
     
     @staticmethod
     def get_valid_colors() -> List[str]:
         # Available colors list
         """Get list of valid colors."""
-        return [
-            'red', 'blue', 'green', 'yellow', 'orange', 'purple', 'pink',
-            'brown', 'black', 'white', 'gray', 'grey', 'cyan', 'magenta'
-        ]
+        return list(VALID_COLORS)
 
 
 class DisplayHelper:
@@ -118,14 +109,15 @@ class DisplayHelper:
             row = [
                 note.id,
                 note.title[:30] + "..." if len(note.title) > 30 else note.title,
-                note.created_at,
-                note.updated_at or "Never"
+                note.created_display,
+                note.updated_display or "Never"
             ]
             if show_content:
                 content_preview = note.get_summary(40)
                 row.append(content_preview)
             table_data.append(row)
         
+        from tabulate import tabulate  # only needed here; keeps startup light
         print(tabulate(table_data, headers=headers, tablefmt="grid"))
     
     @staticmethod
@@ -199,11 +191,13 @@ class InputHelper:
 
 
 def pause(seconds: float = 1.0):
-    """Pause execution for specified seconds."""
-    time.sleep(seconds)
+    """Pause for specified seconds, according to the pacing mode (see utils.pacing)."""
+    pacer.pause(seconds)
 
 
 def clear_screen():
-    """Clear the terminal screen."""
+    """Clear the terminal screen (unless a non-blocking pause is still showing a message)."""
     import os
+    if pacer.holding_screen():
+        return
     os.system('cls' if os.name == 'nt' else 'clear') 
\ No newline at end of file
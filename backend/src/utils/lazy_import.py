@@ -0,0 +1,41 @@
+import importlib
+from typing import Any, Callable, Optional
+
+
+class LazyObject:
+    """Stand-in that builds the real object on first use.
+
+    Attribute access and calls are forwarded to the object returned by
+    factory(), which runs only once, the first time it is needed.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._target = None
+        self._resolved = False
+
+    def _resolve(self) -> Any:
+        if not self._resolved:
+            self._target = self._factory()
+            self._resolved = True
+        return self._target
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names not found on the proxy itself
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._resolve()(*args, **kwargs)
+
+
+def lazy_import(module_name: str, attribute: Optional[str] = None) -> LazyObject:
+    """Import a module (or one attribute of it) the first time it is used.
+
+    Usage:
+        questionary = lazy_import("questionary")
+        Panel = lazy_import("rich.panel", "Panel")
+    """
+    def load():
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute) if attribute else module
+    return LazyObject(load)
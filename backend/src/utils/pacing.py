@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# Pacing modes for transient UI messages:
+# - default:      pause() sleeps, so the user has time to read the message
+# - instant:      pause() returns immediately
+# - non-blocking: pause() returns immediately, but the next screen clear is
+#                 skipped until the pause would have ended, so the message stays
+#                 visible without holding up the input loop
+PACING_MODES = ('default', 'instant', 'non-blocking')
+DEFAULT_PACING = 'default'
+
+# Environment variable and config-file key that select the mode
+PACING_ENV_VAR = 'NOTES_PACING'
+PACING_CONFIG_KEY = 'pacing'
+
+
+class Pacer:
+    """Decides how long transient messages hold up the UI."""
+
+    def __init__(self, mode: str = DEFAULT_PACING):
+        self.set_mode(mode)
+        self._hold_until = 0.0
+
+    def set_mode(self, mode: str):
+        """Switch pacing mode."""
+        if mode not in PACING_MODES:
+            raise ValueError(f"Pacing must be one of: {', '.join(PACING_MODES)}")
+        self.mode = mode
+
+    def pause(self, seconds: float):
+        """Give the user time to read the last message (mode permitting)."""
+        if self.mode == 'default':
+            time.sleep(seconds)
+        elif self.mode == 'non-blocking':
+            self._hold_until = max(self._hold_until, time.monotonic() + seconds)
+
+    def holding_screen(self) -> bool:
+        """True while a non-blocking pause says the last message should stay visible."""
+        return self.mode == 'non-blocking' and time.monotonic() < self._hold_until
+
+
+def _valid_mode(value, source: str) -> Optional[str]:
+    """The value if it is a pacing mode; None (with a warning) if it is set but unknown."""
+    if not value:
+        return None
+    if value not in PACING_MODES:
+        logger.warning("Ignoring unknown pacing mode %r from %s (expected one of: %s)",
+                       value, source, ', '.join(PACING_MODES))
+        return None
+    return value
+
+
+def resolve_pacing_mode(cli_value: Optional[str] = None,
+                        config_file: Optional[str] = None) -> str:
+    """Pick the pacing mode: CLI flag, then NOTES_PACING, then config file, then default.
+
+    An unknown value is logged and skipped, so a typo in the environment
+    or settings.json never stops the app from starting.
+    """
+    mode = _valid_mode(cli_value, "--pacing")
+    if mode:
+        return mode
+
+    mode = _valid_mode(os.environ.get(PACING_ENV_VAR), PACING_ENV_VAR)
+    if mode:
+        return mode
+
+    if config_file:
+        try:
+            with open(config_file, 'r') as f:
+                config_value = json.load(f).get(PACING_CONFIG_KEY)
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            config_value = None
+        mode = _valid_mode(config_value, config_file)
+        if mode:
+            return mode
+
+    return DEFAULT_PACING
+
+
+# Process-wide pacer used by utils.helpers.pause and clear_screen
+pacer = Pacer()
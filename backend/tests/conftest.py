@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The application imports its packages from backend/src (e.g. "from services.x import Y")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
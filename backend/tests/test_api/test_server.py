@@ -0,0 +1,67 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from api.server import NotesApi, create_server
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = create_server(str(tmp_path), port=0, quiet=True, durable=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    server.api.data_service.close()
+
+
+def request(server, method, path, body=None, headers=None):
+    conn = http.client.HTTPConnection(*server.server_address)
+    data = json.dumps(body) if body is not None else None
+    conn.request(method, path, body=data, headers=headers or {})
+    response = conn.getresponse()
+    payload = json.loads(response.read() or b'null')
+    conn.close()
+    return response.status, payload
+
+
+@pytest.fixture
+def note(server):
+    _status, user = request(server, 'POST', '/api/users', {
+        'name': 'Alice', 'surname': 'Tester', 'birthday': '01/01/1990', 'favorite_color': 'blue'
+    })
+    _status, note = request(server, 'POST', '/api/notes', {'user_id': user['id'], 'title': 'Old', 'content': 'Text'})
+    return note
+
+
+def test_invalid_update_changes_nothing(server, note):
+    status, payload = request(server, 'PUT', f"/api/notes/{note['id']}",
+                              {'user_id': note['user_id'], 'title': 'New', 'content': '   '})
+    assert (status, payload['error']) == (400, "Content cannot be empty")
+
+    _status, stored = request(server, 'GET', f"/api/notes/{note['id']}?user_id={note['user_id']}")
+    assert (stored['title'], stored['content']) == ('Old', 'Text')
+
+
+def test_bad_content_length_is_a_bad_request(server):
+    conn = http.client.HTTPConnection(*server.server_address)
+    conn.putrequest('POST', '/api/users')
+    conn.putheader('Content-Length', 'abc')
+    conn.endheaders()
+    response = conn.getresponse()
+    assert response.status == 400
+    conn.close()
+
+
+def test_internal_errors_are_not_echoed(server, monkeypatch, caplog):
+    def broken(self, query, body):
+        raise RuntimeError("secret detail")
+    monkeypatch.setattr(NotesApi, 'list_users', broken)
+
+    status, payload = request(server, 'GET', '/api/users')
+
+    assert (status, payload) == (500, {'error': "Internal server error"})
+    assert "secret detail" in caplog.text
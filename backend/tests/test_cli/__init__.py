@@ -0,0 +1 @@
+"""Tests for the command line interface."""
@@ -0,0 +1,28 @@
+import json
+
+from click.testing import CliRunner
+
+from cli import cli
+from services.data_service import DataService
+from services.user_service import UserService
+
+
+def run(data_dir, *args):
+    return CliRunner().invoke(cli, ['--data-dir', data_dir, *args])
+
+
+def test_invalid_update_changes_nothing(tmp_path):
+    data_dir = str(tmp_path)
+    data_service = DataService(data_dir)
+    UserService(data_service).create_user("Ann", "Lee", "01/01/1990", "red")
+    data_service.close()
+    created = json.loads(run(data_dir, 'notes', 'create', '--user', 'Ann',
+                             '--title', 'Old', '--content', 'Text').output)
+
+    result = run(data_dir, 'notes', 'update', str(created['id']), '--user', 'Ann',
+                 '--title', 'New', '--content', '')
+
+    assert result.exit_code == 1
+    assert "Content cannot be empty" in result.output
+    stored = json.loads(run(data_dir, 'notes', 'get', str(created['id']), '--user', 'Ann').output)
+    assert (stored['title'], stored['content']) == ('Old', 'Text')
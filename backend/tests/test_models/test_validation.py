@@ -0,0 +1,28 @@
+from models.validation import note_problem, user_problem, validate_many
+
+
+def test_validate_many_reports_each_records_first_problem():
+    notes = [
+        {'title': "Fine", 'content': "Fine"},
+        {'title': "", 'content': ""},
+        {'title': "x" * 101, 'content': "Fine"},
+        {'title': "Fine", 'content': "   "},
+        {},
+    ]
+
+    assert validate_many(notes, 'note') == [
+        (index, note_problem(note)) for index, note in enumerate(notes) if note_problem(note)
+    ]
+    assert validate_many(notes[1:2], 'note') == [(0, "Title cannot be empty")]
+
+
+def test_validate_many_checks_users_in_model_order():
+    users = [
+        {'name': "Ann", 'surname': "Lee", 'birthday': "01/01/1990", 'favorite_color': "Blue"},
+        {'name': "Ann", 'surname': "L33", 'birthday': "bad", 'favorite_color': "blue"},
+        {'name': "Ann", 'surname': "Lee", 'birthday': "01-01-1990", 'favorite_color': "teal"},
+    ]
+
+    assert validate_many(users, 'user') == [(1, user_problem(users[1])), (2, user_problem(users[2]))]
+    assert user_problem(users[1]) == "Surname must contain only letters"
+    assert validate_many([], 'user') == []
@@ -0,0 +1 @@
+"""Tests for the storage and business logic services."""
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+from models.note import Note, now_timestamp
+from services.async_data_service import AsyncDataService
+from services.data_service import DataService
+
+
+def test_concurrent_reads_of_one_file_share_one_load(tmp_path, monkeypatch):
+    data_service = DataService(str(tmp_path), durable=False)  # uncached: every read parses
+    for i in range(5):
+        data_service.save_note(Note(data_service.get_next_note_id(), f"Note {i}", "Text",
+                                    now_timestamp(), user_id=1))
+
+    loads = []
+    json_load = json.load
+
+    def counting_load(f, *args, **kwargs):
+        loads.append(f.name)
+        return json_load(f, *args, **kwargs)
+    monkeypatch.setattr(json, 'load', counting_load)
+
+    async def main():
+        async with AsyncDataService(data_service) as data:
+            return await asyncio.gather(
+                *[data.get_note_by_id(note_id) for note_id in range(1, 6)],
+                data.get_notes_by_user(1), data.get_all_notes(), data.get_note_by_id(1),
+            )
+
+    results = asyncio.run(main())
+
+    assert [note.id for note in results[:5]] == [1, 2, 3, 4, 5]
+    assert len(results[5]) == len(results[6]) == 5
+    assert results[7] is results[0]  # identical reads run once
+    assert loads.count(data_service.notes_file) == 1
+
+
+def test_reads_after_a_write_see_it(tmp_path):
+    data_service = DataService(str(tmp_path), durable=False)
+
+    async def main():
+        async with AsyncDataService(data_service) as data:
+            assert await data.get_note_by_id(1) is None
+            await data.save_note(Note(1, "Saved", "Text", now_timestamp(), user_id=1))
+            return await data.get_note_by_id(1)
+
+    assert asyncio.run(main()).title == "Saved"
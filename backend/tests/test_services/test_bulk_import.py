@@ -0,0 +1,93 @@
+import io
+import os
+
+import pytest
+
+from services.data_service import DataService
+from services.note_import import read_note_rows
+from services.notes_service import NotesService
+from services.user_service import UserService
+
+
+@pytest.fixture
+def services(tmp_path):
+    data_service = DataService(str(tmp_path), durable=False)
+    notes_service = NotesService(data_service)
+    user_service = UserService(data_service, notes_service.search_index)
+    yield data_service, notes_service, user_service
+    data_service.close()
+
+
+def test_rows_of_unknown_users_are_errors(services, tmp_path):
+    data_service, notes_service, user_service = services
+    user = user_service.create_user("Ann", "Lee", "01/01/1990", "red")
+    rows = [
+        {'title': "Mine", 'content': "kept"},
+        {'title': "Orphan", 'content': "dropped", 'user_id': 999},
+        {'title': "Orphan too", 'content': "dropped", 'user_id': 999},
+    ]
+
+    result = notes_service.bulk_create_notes(rows, user_id=user.id)
+
+    assert result['created'] == 1
+    assert result['errors'] == [(2, "User 999 does not exist"), (3, "User 999 does not exist")]
+    assert [note.title for note in data_service.get_all_notes()] == ["Mine"]
+    assert not any(name.startswith("999.") for name in os.listdir(tmp_path / "search_index"))
+
+
+def test_unknown_user_aborts_a_strict_import(services):
+    data_service, notes_service, user_service = services
+    user = user_service.create_user("Ann", "Lee", "01/01/1990", "red")
+    rows = [{'title': "Mine", 'content': "kept"}, {'title': "Orphan", 'content': "x", 'user_id': 999}]
+
+    with pytest.raises(ValueError, match="Row 2: User 999 does not exist"):
+        notes_service.bulk_create_notes(rows, user_id=user.id, strict=True)
+    assert data_service.get_all_notes() == []
+
+
+def test_created_at_zero_is_kept(services):
+    data_service, notes_service, user_service = services
+    user = user_service.create_user("Ann", "Lee", "01/01/1990", "red")
+
+    notes_service.bulk_create_notes([{'title': "Epoch", 'content': "x", 'created_at': 0}], user_id=user.id)
+
+    assert [note.created_at for note in data_service.get_all_notes()] == [0]
+
+
+def test_invalid_rows_are_reported_in_row_order(services):
+    data_service, notes_service, user_service = services
+    user = user_service.create_user("Ann", "Lee", "01/01/1990", "red")
+    rows = [
+        {'title': "", 'content': "no title"},
+        ValueError("Unparseable line"),
+        {'title': "Kept", 'content': "fine"},
+        {'title': "x" * 101, 'content': "too long"},
+        {'title': "Empty", 'content': "   "},
+    ]
+
+    result = notes_service.bulk_create_notes(rows, user_id=user.id)
+
+    assert result == {'created': 1, 'errors': [
+        (1, "Title cannot be empty"), (2, "Unparseable line"),
+        (4, "Title cannot exceed 100 characters"), (5, "Content cannot be empty"),
+    ]}
+    assert [note.title for note in data_service.get_all_notes()] == ["Kept"]
+
+
+def test_unusable_created_at_values_are_row_errors(services):
+    data_service, notes_service, user_service = services
+    user = user_service.create_user("Ann", "Lee", "01/01/1990", "red")
+    lines = io.StringIO(
+        '{"title": "List", "content": "x", "created_at": [1]}\n'
+        '{"title": "Infinite", "content": "x", "created_at": Infinity}\n'
+        '{"title": "Far future", "content": "x", "created_at": 1e30}\n'
+        '{"title": "Kept", "content": "x", "created_at": 1700000000}\n'
+    )
+
+    result = notes_service.bulk_create_notes(read_note_rows(lines, 'jsonl'), user_id=user.id)
+
+    assert result['created'] == 1
+    assert [row_number for row_number, _message in result['errors']] == [1, 2, 3]
+    notes = data_service.get_all_notes()
+    assert [note.title for note in notes] == ["Kept"]
+    assert notes[0].created_display  # still formats
@@ -0,0 +1,70 @@
+import multiprocessing
+import os
+import sys
+import threading
+
+import pytest
+
+from api.server import NotesApi
+from services.data_service import DataService
+
+# The stress workers live with the benchmarks; run them here on a small scale
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'benchmarks'))
+import concurrency_stress  # noqa: E402
+
+
+@pytest.mark.parametrize("storage", ["json", "journal", "sharded"])
+def test_threads_lose_no_updates(tmp_path, storage):
+    outcome = concurrency_stress.run_process(0, str(tmp_path), 8, 10, storage, True, False)
+    assert concurrency_stress.verify(str(tmp_path), storage, outcome['results'], outcome['problems']) == []
+
+
+def test_processes_lose_no_updates(tmp_path):
+    jobs = [(i, str(tmp_path), 4, 10, "journal", True, True) for i in range(2)]
+    with multiprocessing.get_context('spawn').Pool(2) as pool:
+        outcomes = pool.map(concurrency_stress.run_process_star, jobs)
+    results = [result for outcome in outcomes for result in outcome['results']]
+    problems = [problem for outcome in outcomes for problem in outcome['problems']]
+    assert concurrency_stress.verify(str(tmp_path), "journal", results, problems) == []
+
+
+def test_api_requests_run_concurrently_without_lost_edits(tmp_path):
+    api = NotesApi(DataService(str(tmp_path), cached=True, migrate_timestamps=False))
+    _status, user = api.dispatch('POST', '/api/users', {}, {
+        'name': 'Alice', 'surname': 'Tester', 'birthday': '01/01/1990', 'favorite_color': 'blue'
+    })
+    query = {'user_id': [str(user['id'])]}
+    note_ids = [api.dispatch('POST', '/api/notes', query, {'title': f'Note {i}', 'content': 'draft'})[1]['id']
+                for i in range(10)]
+    problems = []
+
+    def edit(field, value):
+        try:
+            for note_id in note_ids:
+                api.dispatch('PUT', f'/api/notes/{note_id}', query, {field: value})
+        except Exception as e:
+            problems.append(repr(e))
+
+    def search():
+        try:
+            for _ in range(20):
+                status, payload = api.dispatch('GET', '/api/notes/search', {**query, 'q': ['note']}, None)
+                if status != 200 or len(payload['notes']) != len(note_ids):
+                    problems.append(f"search returned {status}, {len(payload['notes'])} notes")
+        except Exception as e:
+            problems.append(repr(e))
+
+    workers = [threading.Thread(target=edit, args=('title', 'Note edited')),
+               threading.Thread(target=edit, args=('content', 'final'))]
+    workers += [threading.Thread(target=search) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert problems == []
+    for note_id in note_ids:
+        _status, note = api.dispatch('GET', f'/api/notes/{note_id}', query, None)
+        assert (note['title'], note['content']) == ('Note edited', 'final')
+    api.notes_service.search_index.close()
+    api.data_service.close()
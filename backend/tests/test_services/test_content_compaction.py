@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from models.note import Note, now_timestamp
+from services.data_service import DataService
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src')
+
+
+def open_lazy(data_dir) -> DataService:
+    data_service = DataService(data_dir, cached=True, durable=False, lazy_content=True)
+    # Small limits, so a few kilobytes of edits are enough to trigger compaction
+    data_service.CONTENT_CHECK_BYTES = 4 * 1024
+    data_service.CONTENT_COMPACT_MIN_SIZE = 4 * 1024
+    return data_service
+
+
+def read_in_another_process(data_dir) -> dict:
+    script = ("import json, sys; from services.data_service import DataService; "
+              "ds = DataService(sys.argv[1], lazy_content=True); "
+              "print(json.dumps({n.id: n.content for n in ds.get_all_notes()})); ds.close()")
+    output = subprocess.run([sys.executable, "-c", script, data_dir], cwd=SRC_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    return {int(note_id): content for note_id, content in json.loads(output).items()}
+
+
+@pytest.fixture
+def edited_store(tmp_path):
+    """A lazy-content store whose notes were each rewritten many times."""
+    data_dir = str(tmp_path)
+    data_service = open_lazy(data_dir)
+    notes = [Note(data_service.get_next_note_id(), f"Note {i}", "v0 " + "x" * 500, now_timestamp(), user_id=1)
+             for i in range(10)]
+    data_service.save_notes(notes)
+    return data_dir, data_service, notes
+
+
+def test_edits_trigger_compaction_and_the_file_shrinks(edited_store):
+    data_dir, data_service, notes = edited_store
+    content_file = os.path.join(data_dir, "notes.content")
+    largest = 0
+    for version in range(1, 20):
+        for note in notes:
+            note.content = f"v{version} " + "x" * 500
+            data_service.save_note(note)
+        largest = max(largest, os.path.getsize(content_file))
+
+    live = sum(len(note.content) for note in notes)
+    assert os.path.getsize(content_file) < largest
+    assert os.path.getsize(content_file) < 2 * live + data_service.CONTENT_CHECK_BYTES
+    assert {note.id: note.content for note in data_service.get_all_notes()} == \
+        {note.id: note.content for note in notes}
+    data_service.close()
+    assert read_in_another_process(data_dir) == {note.id: note.content for note in notes}
+
+
+def test_close_compacts_after_deletes_and_other_readers_keep_working(edited_store):
+    data_dir, data_service, notes = edited_store
+    for note in notes[:-1]:
+        data_service.delete_note(note.id)
+    survivor = notes[-1]
+
+    # Another DataService loaded the note before the compaction
+    reader = DataService(data_dir, cached=True, durable=False, lazy_content=True)
+    loaded = reader.get_note_by_id(survivor.id)
+
+    content_file = os.path.join(data_dir, "notes.content")
+    before = os.path.getsize(content_file)
+    data_service.close()
+    assert os.path.getsize(content_file) < before / 2
+    assert not os.path.exists(content_file + ".previous")
+
+    assert loaded.content == survivor.content
+    assert reader.get_note_by_id(survivor.id).content == survivor.content
+    reader.close()
+    assert read_in_another_process(data_dir) == {survivor.id: survivor.content}
@@ -0,0 +1,41 @@
+import pytest
+
+from models.note import Note, now_timestamp
+from services.data_service import DataService
+
+
+@pytest.fixture
+def sharded(tmp_path):
+    data_service = DataService(str(tmp_path), storage="sharded", durable=False)
+    for user_id in range(1, 11):
+        data_service.save_note(Note(data_service.get_next_note_id(), f"Note {user_id}", "Text",
+                                    now_timestamp(), user_id=user_id))
+    data_service.close()
+    return str(tmp_path)
+
+
+def test_lookup_with_owner_reads_only_that_shard(sharded, monkeypatch):
+    data_service = DataService(sharded, storage="sharded", durable=False)
+    loaded = []
+    load_shard = DataService._load_shard
+    monkeypatch.setattr(DataService, '_load_shard',
+                        lambda self, user_id: loaded.append(user_id) or load_shard(self, user_id))
+
+    assert data_service.get_note_by_id(999, user_id=1) is None
+    assert data_service.get_note_by_id(2, user_id=1) is None  # another user's note
+    assert data_service.get_note_by_id(1, user_id=1).title == "Note 1"
+    assert set(loaded) == {1}
+    # Without an owner the note is still found
+    assert data_service.get_note_by_id(2).user_id == 2
+    data_service.close()
+
+
+@pytest.mark.parametrize("storage", ["json", "journal"])
+def test_lookup_with_owner_skips_other_users_notes(tmp_path, storage):
+    data_service = DataService(str(tmp_path), storage=storage, durable=False)
+    note = data_service.save_note(Note(data_service.get_next_note_id(), "Mine", "Text", now_timestamp(), user_id=1))
+
+    assert data_service.get_note_by_id(note.id, user_id=2) is None
+    assert data_service.get_note_by_id(note.id, user_id=1).title == "Mine"
+    assert data_service.get_note_by_id(note.id).title == "Mine"
+    data_service.close()
@@ -0,0 +1,79 @@
+import json
+import os
+
+from models.note import Note
+from services.data_service import DataService
+from services.notes_service import NotesService
+from services.search_index import SearchIndex, _UserIndex
+from services.user_service import UserService
+
+
+def make_note(note_id: int, content: str, user_id: int = 1) -> Note:
+    return Note(note_id, f"Note {note_id}", content, 1_700_000_000 + note_id, user_id=user_id)
+
+
+def test_add_note_appends_instead_of_rewriting_the_index(tmp_path):
+    index = SearchIndex(str(tmp_path))
+    index.add_notes(make_note(i, f"common word{i}") for i in range(1, 501))
+    store, _user_index = index._open(1)
+    store.compact()
+    snapshot = os.stat(index._snapshot_file(1))
+
+    index.add_note(make_note(501, "fresh unusual words"))
+    index.remove_note(1, 2)
+
+    after = os.stat(index._snapshot_file(1))
+    assert (after.st_ino, after.st_mtime_ns) == (snapshot.st_ino, snapshot.st_mtime_ns)
+    assert os.path.getsize(index._journal_file(1)) > 0
+    assert [note_id for note_id, _score in index.search(1, "unusual")] == [501]
+    assert 2 not in dict(index.search(1, "word2"))
+
+
+def test_changes_are_seen_by_another_instance(tmp_path):
+    writer = SearchIndex(str(tmp_path))
+    reader = SearchIndex(str(tmp_path))
+    writer.add_note(make_note(1, "alpha beta"))
+    assert [note_id for note_id, _score in reader.search(1, "alpha")] == [1]
+
+    writer.add_note(make_note(2, "alpha gamma"))
+    writer.remove_note(1, 1)
+    assert [note_id for note_id, _score in reader.search(1, "alpha")] == [2]
+
+    writer._open(1)[0].compact()
+    writer.add_note(make_note(3, "alpha delta"))
+    assert sorted(note_id for note_id, _score in reader.search(1, "alpha")) == [2, 3]
+
+
+def test_index_files_from_older_versions_are_converted(tmp_path):
+    legacy = {'docs': {'7': {'stamp': 1, 'terms': {'legacy': 1, 'note': 1}}}}
+    with open(tmp_path / "1.json", 'w') as f:
+        json.dump(legacy, f)
+
+    index = SearchIndex(str(tmp_path))
+    assert [note_id for note_id, _score in index.search(1, "legacy")] == [7]
+    assert not (tmp_path / "1.json").exists()
+
+
+def test_from_dict_matches_incremental_adds():
+    docs = {str(i): {'stamp': i, 'terms': {f"t{i % 7}": 1, f"u{i}": 2}} for i in range(50)}
+    bulk = _UserIndex.from_dict({'docs': docs})
+    incremental = _UserIndex()
+    for note_id, doc in docs.items():
+        incremental.add(int(note_id), doc['terms'], doc['stamp'])
+    assert bulk.terms == incremental.terms
+    assert bulk.postings == incremental.postings
+    assert bulk.total_length == incremental.total_length
+
+
+def test_deleting_a_user_drops_their_index(tmp_path):
+    data_service = DataService(str(tmp_path), durable=False)
+    notes_service = NotesService(data_service)
+    user_service = UserService(data_service, notes_service.search_index)
+    user = user_service.create_user("Ann", "Lee", "01/01/1990", "red")
+    notes_service.create_note("Title", "searchable content", user.id)
+    index_dir = tmp_path / "search_index"
+    assert any(name.startswith(f"{user.id}.") for name in os.listdir(index_dir))
+
+    assert user_service.delete_user(user.id)
+    assert not any(name.startswith(f"{user.id}.") for name in os.listdir(index_dir))
+    data_service.close()
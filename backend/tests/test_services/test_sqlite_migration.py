@@ -0,0 +1,104 @@
+import json
+import os
+
+import pytest
+
+from models.note import Note, now_timestamp
+from models.user import User
+from services.data_service import DataService
+from services.sqlite_data_service import SQLiteDataService
+
+
+def write_json_data(data_dir, **options) -> dict:
+    """Two users with notes, written by DataService. Returns note ID -> content."""
+    data_service = DataService(data_dir, durable=False, **options)
+    contents = {}
+    for user_number in (1, 2):
+        user = data_service.save_user(User(data_service.get_next_user_id(), f"User{'ab'[user_number - 1]}",
+                                           "Tester", "01/01/1990", "blue"))
+        for i in range(5):
+            note = Note(data_service.get_next_note_id(), f"Note {i}", f"Content {user_number}.{i}",
+                        now_timestamp() + i, user_id=user.id)
+            data_service.save_note(note)
+            contents[note.id] = note.content
+    data_service.close()
+    return contents
+
+
+@pytest.mark.parametrize('options', [
+    {'storage': 'json'},
+    {'storage': 'journal'},
+    {'storage': 'sharded'},
+    {'storage': 'json', 'lazy_content': True},
+], ids=['json', 'journal', 'sharded', 'lazy-content'])
+def test_migrate_from_json_imports_every_layout(tmp_path, options):
+    contents = write_json_data(str(tmp_path), **options)
+
+    sqlite = SQLiteDataService(str(tmp_path))
+    assert sqlite.migrate_from_json() == {'users': 2, 'notes': len(contents)}
+    assert {note.id: note.content for note in sqlite.get_all_notes()} == contents
+    assert sqlite.get_next_note_id() > max(contents)
+    # Runs once
+    assert sqlite.migrate_from_json() == {'users': 0, 'notes': 0}
+    sqlite.close()
+
+
+def test_migrate_from_json_after_sharding_an_existing_data_dir(tmp_path):
+    # notes.json written first, then split into shards (kept as notes.json.pre-sharding)
+    contents = write_json_data(str(tmp_path), storage='json')
+    DataService(str(tmp_path), storage='sharded').close()
+    assert DataService.detect_storage(str(tmp_path)) == 'sharded'
+
+    sqlite = SQLiteDataService(str(tmp_path))
+    assert sqlite.migrate_from_json()['notes'] == len(contents)
+    assert {note.id: note.content for note in sqlite.get_all_notes()} == contents
+    sqlite.close()
+
+
+def snapshot_tree(root) -> dict:
+    """Relative path -> bytes of every file under root."""
+    tree = {}
+    for directory, _dirs, files in os.walk(root):
+        for name in files:
+            path = os.path.join(directory, name)
+            with open(path, 'rb') as f:
+                tree[os.path.relpath(path, root)] = f.read()
+    return tree
+
+
+@pytest.mark.parametrize('options', [
+    {'storage': 'json'},
+    {'storage': 'journal'},
+    {'storage': 'sharded'},
+    {'storage': 'json', 'lazy_content': True},
+], ids=['json', 'journal', 'sharded', 'lazy-content'])
+def test_migrate_from_json_leaves_the_source_untouched(tmp_path, options):
+    json_dir, db_dir = str(tmp_path / "json"), str(tmp_path / "db")
+    contents = write_json_data(json_dir, **options)
+    if options['storage'] == 'sharded':
+        # Not yet moved into the shards; opening a DataService would rename it
+        with open(os.path.join(json_dir, "notes.json"), 'w') as f:
+            json.dump({"99": {'id': 99, 'title': "Unsharded", 'content': "Legacy",
+                              'created_at': 0, 'updated_at': None, 'user_id': 1}}, f)
+        contents[99] = "Legacy"
+    before = snapshot_tree(json_dir)
+
+    sqlite = SQLiteDataService(db_dir)
+    assert sqlite.migrate_from_json(json_dir)['notes'] == len(contents)
+    assert {note.id: note.content for note in sqlite.get_all_notes()} == contents
+    sqlite.close()
+    assert snapshot_tree(json_dir) == before
+
+
+def test_migrate_from_json_creates_no_files_in_a_bare_source(tmp_path):
+    json_dir = tmp_path / "json"
+    json_dir.mkdir()
+    (json_dir / "notes.json").write_text(json.dumps({"1": {
+        'id': 1, 'title': "Old", 'content': "Text", 'created_at': "01/02/24 10:30:00", 'user_id': 1
+    }}))
+
+    sqlite = SQLiteDataService(str(tmp_path / "db"))
+    assert sqlite.migrate_from_json(str(json_dir)) == {'users': 0, 'notes': 1}
+    assert isinstance(sqlite.get_note_by_id(1).created_at, int)
+    sqlite.close()
+    assert sorted(os.listdir(json_dir)) == ["notes.json"]
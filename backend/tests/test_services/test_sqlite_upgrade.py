@@ -0,0 +1,55 @@
+import os
+import sqlite3
+
+import pytest
+
+from services.sqlite_data_service import SQLiteDataService
+
+
+def write_v0_database(data_dir, rows):
+    """A notes.db as written before SCHEMA_VERSION 1 (text timestamps)."""
+    conn = sqlite3.connect(os.path.join(data_dir, "notes.db"))
+    conn.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, title TEXT, content TEXT, "
+                 "created_at TEXT, updated_at TEXT, user_id INTEGER)")
+    conn.executemany("INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def notes_and_version(data_dir):
+    conn = sqlite3.connect(os.path.join(data_dir, "notes.db"))
+    try:
+        return (conn.execute("SELECT count(*) FROM notes").fetchone()[0],
+                conn.execute("PRAGMA user_version").fetchone()[0])
+    finally:
+        conn.close()
+
+
+def test_upgrade_converts_legacy_timestamps(tmp_path):
+    write_v0_database(str(tmp_path), [(1, "Old", "Text", "01/02/24 10:30:00", None, 1),
+                                      (2, "Iso", "Text", "2024-03-01T10:00:00", "2024-03-02T10:00:00", 1)])
+
+    sqlite = SQLiteDataService(str(tmp_path))
+    assert all(isinstance(note.created_at, int) for note in sqlite.get_all_notes())
+    assert isinstance(sqlite.get_note_by_id(2).updated_at, int)
+    sqlite.close()
+    assert notes_and_version(str(tmp_path)) == (2, SQLiteDataService.SCHEMA_VERSION)
+
+
+def test_unconvertible_row_leaves_the_database_untouched(tmp_path):
+    write_v0_database(str(tmp_path), [(1, "Old", "Text", "01/02/24 10:30:00", None, 1),
+                                      (2, "Bad", "Text", "bad-date", None, 1)])
+
+    with pytest.raises(ValueError, match="note 2"):
+        SQLiteDataService(str(tmp_path))
+    assert notes_and_version(str(tmp_path)) == (2, 0)
+
+
+def test_failure_during_the_rebuild_rolls_back(tmp_path):
+    # Converts fine, but violates the new table's NOT NULL title
+    write_v0_database(str(tmp_path), [(1, "Old", "Text", "01/02/24 10:30:00", None, 1),
+                                      (2, None, "Text", "01/02/24 10:30:00", None, 1)])
+
+    with pytest.raises(sqlite3.IntegrityError):
+        SQLiteDataService(str(tmp_path))
+    assert notes_and_version(str(tmp_path)) == (2, 0)
@@ -0,0 +1,41 @@
+import json
+import os
+
+from services.data_service import DataService
+
+
+def write_legacy_notes(data_dir):
+    os.makedirs(data_dir, exist_ok=True)
+    with open(os.path.join(data_dir, "notes.json"), 'w') as f:
+        json.dump({"1": {'id': 1, 'title': "Old", 'content': "From before epoch timestamps",
+                         'created_at': "01/02/24 10:30:00", 'updated_at': None, 'user_id': 1}}, f)
+
+
+def test_legacy_timestamps_are_migrated_once(tmp_path, monkeypatch):
+    data_dir = str(tmp_path)
+    write_legacy_notes(data_dir)
+
+    data_service = DataService(data_dir, durable=False)
+    assert isinstance(data_service.get_note_by_id(1).created_at, int)
+    data_service.close()
+    with open(os.path.join(data_dir, "counters.json")) as f:
+        assert json.load(f)[DataService.TIMESTAMPS_MIGRATED] is True
+
+    # Later starts do not scan the notes again
+    def no_scan(self):
+        raise AssertionError("migrate_timestamps ran again")
+    monkeypatch.setattr(DataService, 'migrate_timestamps', no_scan)
+    DataService(data_dir, durable=False).close()
+
+
+def test_marker_keeps_the_id_counters(tmp_path):
+    data_service = DataService(str(tmp_path), durable=False, id_block_size=1)
+    assert data_service.get_next_note_id() == 1
+    data_service.close()
+
+    reopened = DataService(str(tmp_path), durable=False, id_block_size=1)
+    assert reopened.get_next_note_id() == 2
+    reopened.close()
+    with open(os.path.join(str(tmp_path), "counters.json")) as f:
+        counters = json.load(f)
+    assert counters['note_id_counter'] == 2 and counters[DataService.TIMESTAMPS_MIGRATED] is True
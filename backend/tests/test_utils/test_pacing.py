@@ -0,0 +1,28 @@
+import json
+import logging
+
+from utils.pacing import DEFAULT_PACING, PACING_ENV_VAR, resolve_pacing_mode
+
+
+def test_unknown_env_value_falls_back_with_a_warning(monkeypatch, caplog):
+    monkeypatch.setenv(PACING_ENV_VAR, "sloww")
+    with caplog.at_level(logging.WARNING):
+        assert resolve_pacing_mode() == DEFAULT_PACING
+    assert "sloww" in caplog.text
+
+
+def test_unknown_settings_value_falls_back(monkeypatch, tmp_path):
+    monkeypatch.delenv(PACING_ENV_VAR, raising=False)
+    settings = tmp_path / "settings.json"
+    settings.write_text(json.dumps({'pacing': 42}))
+    assert resolve_pacing_mode(config_file=str(settings)) == DEFAULT_PACING
+
+
+def test_valid_values_keep_their_precedence(monkeypatch, tmp_path):
+    settings = tmp_path / "settings.json"
+    settings.write_text(json.dumps({'pacing': 'non-blocking'}))
+    monkeypatch.setenv(PACING_ENV_VAR, "bogus")
+    assert resolve_pacing_mode(config_file=str(settings)) == 'non-blocking'
+    monkeypatch.setenv(PACING_ENV_VAR, "instant")
+    assert resolve_pacing_mode(config_file=str(settings)) == 'instant'
+    assert resolve_pacing_mode('default', str(settings)) == 'default'
@@ -26,7 +26,6 @@ STEP 5: UPLOAD THE PROJECT TO GITHUB
 
 from datetime import datetime
 import time
-from matplotlib import colors
 import re
 
 def introducing():
@@ -109,6 +108,7 @@ def personalInfo(): # This function returns 4 variables: answer, surname, age an
         print('This is not a valid answer.\n')
         time.sleep(1)
         birthday = input('When is your birthday?\n')
+    from matplotlib import colors # Imported here: matplotlib is slow to load and only needed for registration
     coloursList = list(colors.CSS4_COLORS.keys())
     colour = input('What\'s your favourite colour?\n')
     time.sleep(1)
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Simple launcher script for Notes Assistant.
-Run this file to start the application.
+Run this file to start the application, or pass a subcommand
+(e.g. "python run.py import notes.jsonl --user Ana") to use the CLI.
 """
 
 import sys
@@ -40,7 +41,13 @@ def debug_environment():
     logger.info(f"Python path: {sys.path[:3]}...")  # Primeras 3 rutas
     logger.info("=" * 30)
 
-if __name__ == "__main__": # Main entry point for the application. It is the first file that is run when the application is started.
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Subcommands (e.g. "python run.py import notes.jsonl --user Ana") skip the
+    # interactive menu and run the non-interactive CLI in backend/src/cli.py
+    from cli import cli
+    cli()
+
+elif __name__ == "__main__": # Main entry point for the application. It is the first file that is run when the application is started.
     try:
         logger.info("🚀 Starting Notes Assistant...")
         debug_environment()  # ← NUEVO: Mostrar info del entorno